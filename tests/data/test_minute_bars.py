@@ -35,6 +35,7 @@ from pandas import (
     date_range,
 )
 
+from zipline.assets import Equity
 from zipline.data.bar_reader import NoDataOnDate
 from zipline.data.minute_bars import (
     BcolzMinuteBarMetadata,
@@ -44,6 +45,7 @@ from zipline.data.minute_bars import (
     US_EQUITIES_MINUTES_PER_DAY,
     BcolzMinuteWriterColumnMismatch
 )
+from zipline.data.traded_runs import TRADED_RUNS_FILE
 
 from zipline.testing.fixtures import (
     WithInstanceTmpDir,
@@ -1040,3 +1042,84 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
         _, last_close = cal.open_and_close_for_session(
             self.test_calendar_start)
         self.assertEqual(self.reader.last_available_dt, last_close)
+
+    def test_last_traded_dt(self):
+        tds = self.market_opens.index
+        days = tds[tds.slice_indexer(
+            start=self.test_calendar_start + 1,
+            end=self.test_calendar_start + 5
+        )]
+        sid = 1
+        asset = Equity(sid, exchange='TEST', start_date=days[0])
+
+        def write(day, volumes):
+            minutes = self.market_opens[day] + arange(
+                len(volumes),
+            ).astype('timedelta64[m]')
+            self.writer.write_sid(
+                sid,
+                DataFrame(
+                    data={
+                        'open': full(len(volumes), 10.0),
+                        'high': full(len(volumes), 20.0),
+                        'low': full(len(volumes), 30.0),
+                        'close': full(len(volumes), 40.0),
+                        'volume': volumes,
+                    },
+                    index=minutes,
+                ),
+            )
+
+        # The second write continues the run of traded minutes at the end of
+        # the first day.
+        first_volumes = zeros(US_EQUITIES_MINUTES_PER_DAY)
+        first_volumes[[5, 6, 7, -2, -1]] = 100
+        write(days[0], first_volumes)
+        write(days[1], array([100.0, 0, 0, 100, 0]))
+        write(days[3], array([0.0, 0, 100]))
+
+        first_open = self.market_opens[days[0]]
+        queries = [
+            first_open,
+            first_open + Timedelta(minutes=5),
+            first_open + Timedelta(minutes=200),
+            self.market_opens[days[1]] + Timedelta(minutes=1),
+            self.market_opens[days[1]] + Timedelta(minutes=4),
+            self.market_opens[days[2]] + Timedelta(minutes=30),
+            self.market_opens[days[3]] + Timedelta(minutes=1),
+            self.market_opens[days[3]] + Timedelta(minutes=2),
+            self.market_closes[days[4]],
+        ]
+        expected = [
+            NaT,
+            first_open + Timedelta(minutes=5),
+            first_open + Timedelta(minutes=7),
+            self.market_opens[days[1]],
+            self.market_opens[days[1]] + Timedelta(minutes=3),
+            self.market_opens[days[1]] + Timedelta(minutes=3),
+            self.market_opens[days[1]] + Timedelta(minutes=3),
+            self.market_opens[days[3]] + Timedelta(minutes=2),
+            self.market_opens[days[3]] + Timedelta(minutes=2),
+        ]
+        self.assertEqual(
+            [self.reader.get_last_traded_dt(asset, dt) for dt in queries],
+            expected,
+        )
+
+        # Data written without the index of traded minutes is searched
+        # minute by minute.
+        os.remove(os.path.join(self.writer.sidpath(sid), TRADED_RUNS_FILE))
+        self.reader = BcolzMinuteBarReader(self.dest)
+        self.assertEqual(
+            [self.reader.get_last_traded_dt(asset, dt) for dt in queries],
+            expected,
+        )
+
+        # Truncating the data truncates the index.
+        write(days[4], array([100.0]))
+        self.writer.truncate(days[2])
+        self.reader = BcolzMinuteBarReader(self.dest)
+        self.assertEqual(
+            self.reader.get_last_traded_dt(asset, self.market_closes[days[4]]),
+            self.market_opens[days[1]] + Timedelta(minutes=3),
+        )
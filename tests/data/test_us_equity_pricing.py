@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 from sys import maxsize
 
 from nose_parameterized import parameterized
@@ -28,8 +29,10 @@ from pandas import (
 )
 from pandas.util.testing import assert_index_equal
 
+from zipline.data.traded_runs import TRADED_RUNS_FILE
 from zipline.data.us_equity_pricing import (
     BcolzDailyBarReader,
+    BcolzDailyBarWriter,
     NoDataBeforeDate,
     NoDataAfterDate,
 )
@@ -344,6 +347,51 @@ class BcolzDailyBarTestCase(WithBcolzEquityDailyBarReader, ZiplineTestCase):
         finally:
             reader._spot_col('close')[zero_ix] = old
 
+    def test_last_traded_dt(self):
+        path = self.tmpdir.makedir('sparse_volume')
+
+        def sparse_volume_data():
+            # Only trade every third session of each asset.
+            for asset, frame in make_bar_data(EQUITY_INFO, self.sessions):
+                frame = frame.copy()
+                volume = frame['volume'].values
+                volume[arange(len(volume)) % 3 != 0] = 0
+                yield asset, frame
+
+        BcolzDailyBarWriter(
+            path,
+            self.trading_calendar,
+            self.sessions[0],
+            self.sessions[-1],
+        ).write(sparse_volume_data())
+        self.assertTrue(os.path.exists(os.path.join(path, TRADED_RUNS_FILE)))
+
+        reader = BcolzDailyBarReader(path)
+        last_traded = {
+            (asset, day): reader.get_last_traded_dt(asset, day)
+            for asset in self.assets
+            for day in self.sessions
+        }
+
+        start = self.asset_start(3)
+        third_session = self.sessions[self.sessions.get_loc(start) + 2]
+        self.assertIsNone(last_traded[3, self.sessions[0]])
+        self.assertEqual(last_traded[3, start], start)
+        self.assertEqual(last_traded[3, third_session], start)
+
+        # Tables written without the index of traded sessions are searched
+        # session by session.
+        os.remove(os.path.join(path, TRADED_RUNS_FILE))
+        reader = BcolzDailyBarReader(path)
+        self.assertEqual(
+            {
+                (asset, day): reader.get_last_traded_dt(asset, day)
+                for asset in self.assets
+                for day in self.sessions
+            },
+            last_traded,
+        )
+
 
 class BcolzDailyBarAlwaysReadAllTestCase(BcolzDailyBarTestCase):
     """
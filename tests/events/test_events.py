@@ -19,6 +19,7 @@ from unittest import TestCase
 import warnings
 
 from nose_parameterized import parameterized
+from numpy.testing import assert_array_equal
 import pandas as pd
 from six import iteritems
 from six.moves import range, map
@@ -170,6 +171,93 @@ class TestEventManager(TestCase):
 
         self.assertEqual(CountingRule.count, 5)
 
+    def test_compile(self):
+        cal = get_calendar('NYSE')
+        minutes = cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-09-26', tz='UTC'),
+            pd.Timestamp('2014-10-07', tz='UTC'),
+        )
+
+        class EveryTenMinutes(StatelessRule):
+            # A rule that can't be compiled.
+            def should_trigger(self, dt):
+                return dt.minute % 10 == 0
+
+        def make_event_manager(calls):
+            def callback(name):
+                def callback(context, data):
+                    calls.append((name, context))
+                return callback
+
+            def calendar_rule(rule):
+                rule.cal = cal
+                return rule
+
+            em = EventManager()
+            em.add_event(Event(Always(), callback('always')))
+            em.add_event(Event(Never(), callback('never')))
+            em.add_event(Event(EveryTenMinutes(), callback('ten_minutes')))
+            em.add_event(Event(
+                OncePerDay(
+                    calendar_rule(NthTradingDayOfMonth(0)) &
+                    calendar_rule(AfterOpen(minutes=30)),
+                ),
+                callback('month_start'),
+            ))
+            em.add_event(Event(
+                OncePerDay(calendar_rule(BeforeClose(minutes=5))),
+                callback('close'),
+            ))
+            em.add_event(Event(
+                calendar_rule(AfterOpen(minutes=1)),
+                callback('open'),
+            ))
+            return em
+
+        expected = []
+        em = make_event_manager(expected)
+        for minute in minutes:
+            em.handle_data(minute, None, minute)
+
+        result = []
+        em = make_event_manager(result)
+        em.compile(minutes.asi8)
+        self.assertEqual(
+            [trigger is None for trigger in em._triggers],
+            [False, False, True, False, False, False],
+        )
+        for minute in minutes:
+            em.handle_data(minute, None, minute)
+
+        self.assertEqual(result, expected)
+
+        # Events added after compiling are checked every minute, and skipping
+        # minutes doesn't replay the skipped triggers.
+        result = []
+        em = make_event_manager(result)
+        em.compile(minutes.asi8)
+        em.add_event(
+            Event(EveryTenMinutes(), lambda context, data: result.append(
+                ('late', context),
+            )),
+            prepend=True,
+        )
+        for minute in minutes[::7]:
+            em.handle_data(minute, None, minute)
+
+        expected = []
+        em = make_event_manager(expected)
+        em.add_event(
+            Event(EveryTenMinutes(), lambda context, data: expected.append(
+                ('late', context),
+            )),
+            prepend=True,
+        )
+        for minute in minutes[::7]:
+            em.handle_data(minute, None, minute)
+
+        self.assertEqual(result, expected)
+
 
 class TestEventRule(TestCase):
     def test_is_abstract(self):
@@ -427,6 +515,37 @@ class StatelessRulesTests(RuleTestCase):
                     else:
                         self.assertNotEqual(n_days_before, n)
 
+    def test_trigger_mask(self):
+        minutes = self.cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-09-26', tz='UTC'),
+            pd.Timestamp('2014-10-03', tz='UTC'),
+        )
+
+        def make_rules():
+            rules = [
+                Always(),
+                Never(),
+                AfterOpen(minutes=5),
+                AfterOpen(hours=1, minutes=5),
+                BeforeClose(minutes=1),
+                BeforeClose(hours=1, minutes=5),
+                NotHalfDay(),
+                NthTradingDayOfWeek(1),
+                NDaysBeforeLastTradingDayOfWeek(0),
+                NthTradingDayOfMonth(0),
+                NDaysBeforeLastTradingDayOfMonth(1),
+            ]
+            for rule in rules:
+                rule.cal = self.cal
+            return rules + [rules[9] & rules[2]]
+
+        for rule, other in zip(make_rules(), make_rules()):
+            assert_array_equal(
+                rule.trigger_mask(minutes.asi8),
+                [bool(other.should_trigger(m)) for m in minutes],
+                err_msg=repr(rule),
+            )
+
     def test_ComposedRule(self):
         minute_groups = minutes_for_days(self.cal)
         rule1 = Always()
@@ -504,3 +623,30 @@ class StatefulRulesTests(RuleTestCase):
                 rule.should_trigger(minute)
 
             self.assertEqual(rule.count, 1)
+
+    def test_OncePerDay_trigger_mask(self):
+        minutes = self.cal.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-09-26', tz='UTC'),
+            pd.Timestamp('2014-10-03', tz='UTC'),
+        )
+
+        def make_rules():
+            before_close = BeforeClose(minutes=30)
+            before_close.cal = self.cal
+            return [
+                OncePerDay(),
+                OncePerDay(Never()),
+                OncePerDay(before_close),
+            ]
+
+        for rule, other in zip(make_rules(), make_rules()):
+            assert_array_equal(
+                rule.trigger_mask(minutes.asi8),
+                [bool(other.should_trigger(m)) for m in minutes],
+            )
+
+        class Custom(StatefulRule):
+            def should_trigger(self, dt):
+                return True
+
+        self.assertIsNone(OncePerDay(Custom()).trigger_mask(minutes.asi8))
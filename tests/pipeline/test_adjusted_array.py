@@ -20,6 +20,7 @@ from toolz import curry
 from zipline.errors import WindowLengthNotPositive, WindowLengthTooLong
 from zipline.lib.adjustment import (
     Datetime64Overwrite,
+    Float64AdjustmentTable,
     Float64Multiply,
     Float64Overwrite,
     ObjectOverwrite,
@@ -424,6 +425,68 @@ class AdjustedArrayTestCase(TestCase):
             for yielded, expected_yield in zip_longest(window_iter, expected):
                 check_arrays(yielded, expected_yield)
 
+    @parameterized.expand(
+        chain(
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(
+                'float',
+                make_input=as_dtype(float64_dtype),
+                make_expected_output=as_dtype(float64_dtype),
+                dtype=float64_dtype,
+                missing_value=default_missing_value_for_dtype(float64_dtype),
+            ),
+        )
+    )
+    def test_adjustment_table(self,
+                              name,
+                              data,
+                              lookback,
+                              adjustments,
+                              missing_value,
+                              expected):
+
+        table = Float64AdjustmentTable.from_dict(adjustments)
+        self.assertEqual(
+            len(table),
+            sum(map(len, adjustments.values())),
+        )
+        self.assertEqual(table.to_dict(), adjustments)
+
+        array = AdjustedArray(data, NOMASK, table, missing_value)
+        for _ in range(2):  # Iterate 2x ensure adjusted_arrays are re-usable.
+            window_iter = array.traverse(lookback)
+            for yielded, expected_yield in zip_longest(window_iter, expected):
+                check_arrays(yielded, expected_yield)
+
+    def test_adjustment_table_requires_float64(self):
+        table = Float64AdjustmentTable([1], [0], [0], [0], [0], [0], [2.0])
+        with self.assertRaises(TypeError):
+            AdjustedArray(
+                arange(4).reshape(2, 2),
+                NOMASK,
+                table,
+                missing_value=-1,
+            )
+
+        # An empty table can be used with any data.
+        AdjustedArray(
+            arange(4).reshape(2, 2),
+            NOMASK,
+            Float64AdjustmentTable([], [], [], [], [], [], []),
+            missing_value=-1,
+        )
+
+    def test_invalid_adjustment_table(self):
+        with self.assertRaises(ValueError):
+            # first_row > last_row
+            Float64AdjustmentTable([1], [1], [0], [0], [0], [0], [2.0])
+        with self.assertRaises(ValueError):
+            # unknown kind
+            Float64AdjustmentTable([1], [0], [0], [0], [0], [3], [2.0])
+        with self.assertRaises(ValueError):
+            # mismatched lengths
+            Float64AdjustmentTable([1, 2], [0], [0], [0], [0], [0], [2.0])
+
     @parameterized.expand(
         chain(
             _gen_overwrite_adjustment_cases(
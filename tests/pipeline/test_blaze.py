@@ -6,6 +6,7 @@ from __future__ import division
 from collections import OrderedDict
 from datetime import timedelta, time
 from itertools import product, chain
+import os
 import warnings
 
 import blaze as bz
@@ -16,6 +17,7 @@ from numpy.testing.utils import assert_array_almost_equal
 from odo import odo
 import pandas as pd
 from pandas.util.testing import assert_frame_equal
+from testfixtures import TempDirectory
 from toolz import keymap, valmap, concatv
 from toolz.curried import operator as op
 
@@ -27,11 +29,13 @@ from zipline.pipeline.engine import SimplePipelineEngine
 from zipline.pipeline.loaders.blaze import (
     from_blaze,
     BlazeLoader,
+    DatePartitionedQueryCache,
     NoMetaDataWarning,
 )
 from zipline.pipeline.loaders.blaze.core import (
     ExprData,
     NonPipelineField,
+    overwrite_bounds_from_dates,
 )
 from zipline.testing import (
     ZiplineTestCase,
@@ -1743,6 +1747,79 @@ class BlazeToPipelineTestCase(WithAssetFinder, ZiplineTestCase):
 
 
 class MiscTestCase(ZiplineTestCase):
+    def test_query_cache(self):
+        df = self.df.copy()
+        deltas_df = df.copy()
+        deltas_df['value'] += 10
+        deltas_df['timestamp'] += timedelta(days=1)
+        dates = self.dates.insert(
+            len(self.dates),
+            self.dates[-1] + timedelta(days=1),
+        )
+
+        def run(query_cache):
+            loader = BlazeLoader(query_cache=query_cache)
+            ds = from_blaze(
+                bz.data(df, name='expr', dshape=self.dshape),
+                bz.data(deltas_df, name='delta', dshape=self.dshape),
+                loader=loader,
+                no_checkpoints_rule='ignore',
+                missing_values=self.missing_values,
+            )
+            p = Pipeline()
+            p.add(ds.value.latest, 'value')
+            p.add(ds.int_value.latest, 'int_value')
+            engine = SimplePipelineEngine(loader, dates, self.asset_finder)
+            # Run in two chunks to query overlapping ranges.
+            return pd.concat([
+                engine.run_pipeline(p, dates[0], dates[1]),
+                engine.run_pipeline(p, dates[2], dates[-1]),
+            ])
+
+        expected = run(None)
+        with TempDirectory() as tempdir:
+            query_cache = DatePartitionedQueryCache(tempdir.path)
+            assert_frame_equal(run(query_cache), expected)
+
+            # The baseline and deltas were each cached in one partition.
+            partitions = sorted(
+                key
+                for dirname in os.listdir(tempdir.path)
+                for key in os.listdir(os.path.join(tempdir.path, dirname))
+            )
+            assert_equal(
+                partitions,
+                ['2014-01', '2014-01', '2014-01.sids', '2014-01.sids',
+                 'first-timestamp', 'first-timestamp'],
+            )
+
+            # A new loader reads the same results back from disk.
+            assert_frame_equal(
+                run(DatePartitionedQueryCache(tempdir.path)),
+                expected,
+            )
+
+    def test_overwrite_bounds_from_dates(self):
+        dense_dates = pd.date_range('2014-01-01', '2014-01-05')
+        sparse_dates = pd.to_datetime(
+            ['2014-01-01', '2014-01-03', '2014-02-01'],
+        ).values
+        asofs = pd.to_datetime(
+            ['2014-01-02', '2014-01-03', 'NaT', '2014-01-10'],
+        ).values
+
+        first_rows, last_rows, valid = overwrite_bounds_from_dates(
+            asofs,
+            dense_dates,
+            sparse_dates,
+        )
+        # The first overwrite applies until the next sparse date, the second
+        # applies through the end of the dense dates, the third is not an
+        # actual delta and the fourth is after the last dense date.
+        np.testing.assert_array_equal(first_rows[valid], [1, 2])
+        np.testing.assert_array_equal(last_rows[valid], [1, 4])
+        np.testing.assert_array_equal(valid, [True, True, False, False])
+
     def test_exprdata_repr(self):
         strd = set()
 
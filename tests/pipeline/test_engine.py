@@ -50,6 +50,7 @@ from zipline.pipeline.factors import (
     ExponentialWeightedMovingAverage,
     ExponentialWeightedMovingStdDev,
     MaxDrawdown,
+    Returns,
     SimpleMovingAverage,
 )
 from zipline.pipeline.loaders.equity_pricing_loader import (
@@ -61,8 +62,9 @@ from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
     expected_bar_values_2d,
 )
+from zipline.pipeline.results import PipelineResult
 from zipline.pipeline.sentinels import NotSpecified
-from zipline.pipeline.term import InputDates
+from zipline.pipeline.term import InputDates, is_columnwise
 from zipline.testing import (
     AssetID,
     AssetIDPlusDay,
@@ -148,9 +150,11 @@ class RecordingPrecomputedLoader(PrecomputedLoader):
         super(RecordingPrecomputedLoader, self).__init__(*args, **kwargs)
 
         self.load_calls = []
+        self.load_assets = []
 
     def load_adjusted_array(self, columns, dates, assets, mask):
         self.load_calls.append(ColumnArgs(*columns))
+        self.load_assets.append(list(assets))
 
         return super(RecordingPrecomputedLoader, self).load_adjusted_array(
             columns, dates, assets, mask,
@@ -807,6 +811,292 @@ class ConstantInputTestCase(WithTradingEnvironment, ZiplineTestCase):
                          {ColumnArgs.sorted_by_ds(Loader2DataSet.col1,
                                                   Loader2DataSet.col2)})
 
+    def test_iter_pipeline(self):
+        engine = SimplePipelineEngine(
+            lambda column: self.loader, self.dates, self.asset_finder,
+        )
+        dates = self.dates[10:20]
+
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        pipeline = Pipeline(
+            columns={
+                'sma': sma,
+                'returns_diff': RollingSumDifference(
+                    inputs=[
+                        Returns(window_length=2),
+                        Returns(window_length=3),
+                    ],
+                ),
+                'open': USEquityPricing.open.latest,
+            },
+            screen=AssetID() <= 3,
+        )
+        expected = engine.run_pipeline(pipeline, dates[0], dates[-1])
+
+        for chunksize in 1, 3, len(dates):
+            results = list(
+                engine.iter_pipeline(
+                    pipeline, dates[0], dates[-1], chunksize=chunksize,
+                ),
+            )
+            self.assertEqual([date for date, _ in results], list(dates))
+            for date, result in results:
+                assert_frame_equal(result, expected.loc[date])
+
+    def test_run_pipelines_shares_terms(self):
+        loader = RecordingPrecomputedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        dates = self.dates[10:15]
+
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        pipelines = {
+            'sma': Pipeline(columns={'sma': sma}),
+            'sma_and_open': Pipeline(
+                columns={'sma': sma, 'open': USEquityPricing.open.latest},
+                screen=AssetID() <= 2,
+            ),
+        }
+        results = engine.run_pipelines(pipelines, dates[0], dates[-1])
+
+        # Close is only needed by ``sma``, which is shared between the
+        # pipelines, so it should only be loaded once.
+        self.assertEqual(
+            loader.load_calls.count(ColumnArgs(USEquityPricing.close)),
+            1,
+        )
+
+        self.assertEqual(set(results), set(pipelines))
+        for name, pipeline in iteritems(pipelines):
+            assert_frame_equal(
+                results[name],
+                engine.run_pipeline(pipeline, dates[0], dates[-1]),
+            )
+
+    def test_columnar_results(self):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        dates = self.dates[10:15]
+
+        pipeline = Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=[USEquityPricing.close],
+                    window_length=5,
+                ),
+                'open': USEquityPricing.open.latest,
+            },
+            screen=AssetID() <= 2,
+        )
+        expected = engine.run_pipeline(pipeline, dates[0], dates[-1])
+        result = engine.run_pipeline(
+            pipeline,
+            dates[0],
+            dates[-1],
+            columnar=True,
+        )
+
+        self.assertIsInstance(result, PipelineResult)
+        self.assertEqual(result.columns, ['open', 'sma'])
+        self.assertEqual(len(result), 2 * len(dates))
+        check_arrays(result.offsets, arange(0, 2 * len(dates) + 1, 2))
+        assert_frame_equal(result.frame, expected)
+
+        for date in dates:
+            check_arrays(result.sids_for(date), array([1, 2]))
+            check_arrays(
+                result.values_for(date, 'open'),
+                expected.loc[date]['open'].values,
+            )
+            assert_frame_equal(result.frame_for(date), expected.loc[date])
+
+        with self.assertRaises(KeyError):
+            result.frame_for(self.dates[0])
+
+        # No assets pass this screen, so every date is empty.
+        pipeline.set_screen(AssetID() < 0, overwrite=True)
+        empty_result = engine.run_pipeline(
+            pipeline,
+            dates[0],
+            dates[-1],
+            columnar=True,
+        )
+        self.assertEqual(len(empty_result), 0)
+        assert_frame_equal(
+            empty_result.frame,
+            engine.run_pipeline(pipeline, dates[0], dates[-1]),
+        )
+        for date in dates:
+            frame = empty_result.frame_for(date)
+            self.assertTrue(frame.empty)
+            self.assertEqual(list(frame.columns), ['open', 'sma'])
+
+    def test_screen_prunes_assets(self):
+        loader = RecordingPrecomputedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        unpruned_engine = SimplePipelineEngine(
+            lambda column: self.loader,
+            self.dates,
+            self.asset_finder,
+            prune_assets=False,
+        )
+        dates = self.dates[10:15]
+
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        pipeline = Pipeline(
+            columns={'sma': sma, 'open': USEquityPricing.open.latest},
+            screen=AssetID() <= 2,
+        )
+        result = engine.run_pipeline(pipeline, dates[0], dates[-1])
+        expected = unpruned_engine.run_pipeline(pipeline, dates[0], dates[-1])
+        assert_frame_equal(result, expected)
+
+        # Neither column is needed to compute the screen, so both should only
+        # be loaded for the assets that pass the screen.
+        self.assertEqual(loader.load_assets, [[1, 2], [1, 2]])
+
+    @parameterized.expand([(False,), (True,)])
+    def test_screen_inputs_loaded_once(self, narrow):
+        loader = RecordingPrecomputedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        unpruned_engine = SimplePipelineEngine(
+            lambda column: self.loader,
+            self.dates,
+            self.asset_finder,
+            prune_assets=False,
+        )
+        dates = self.dates[10:15]
+
+        # Every asset passes this screen, unless it is narrowed.
+        screen = SimpleMovingAverage(
+            inputs=[USEquityPricing.low],
+            window_length=5,
+        ) > 0
+        if narrow:
+            screen &= AssetID() <= 2
+        pipeline = Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=[USEquityPricing.close],
+                    window_length=5,
+                ),
+                'open': USEquityPricing.open.latest,
+            },
+            screen=screen,
+        )
+        result = engine.run_pipeline(pipeline, dates[0], dates[-1])
+        expected = unpruned_engine.run_pipeline(pipeline, dates[0], dates[-1])
+        assert_frame_equal(result, expected)
+
+        loaded = [column for call in loader.load_calls for column in call]
+        self.assertEqual(
+            sorted(loaded, key=repr),
+            sorted(
+                [
+                    USEquityPricing.low,
+                    USEquityPricing.close,
+                    USEquityPricing.open,
+                ],
+                key=repr,
+            ),
+        )
+        # The screen's input is loaded for every asset, and the other columns
+        # only for the assets that pass the screen.
+        kept = [1, 2] if narrow else list(self.asset_ids)
+        self.assertEqual(
+            loader.load_assets,
+            [list(self.asset_ids), kept, kept],
+        )
+
+    def test_cross_sectional_column_disables_pruning(self):
+        loader = RecordingPrecomputedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        dates = self.dates[10:15]
+
+        # Ranks depend on every asset in the cross-section, so we can't
+        # narrow the assets before computing them.
+        pipeline = Pipeline(
+            columns={
+                'rank': USEquityPricing.close.latest.rank(method='average'),
+            },
+            screen=AssetID() <= 2,
+        )
+        result = engine.run_pipeline(pipeline, dates[0], dates[-1])
+
+        self.assertEqual(loader.load_assets, [list(self.asset_ids)])
+        check_arrays(
+            result['rank'].unstack().values,
+            full((len(dates), 2), 2.5),
+        )
+
+    def test_overridden_compute_disables_pruning(self):
+        class DemeanedAssetSMA(SimpleMovingAverage):
+            # Inherits columnwise from SimpleMovingAverage, but depends on
+            # every asset in the cross-section.
+            def compute(self, today, assets, out, data):
+                out[:] = assets - assets.mean()
+
+        loader = RecordingPrecomputedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        dates = self.dates[10:15]
+
+        factor = DemeanedAssetSMA(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        self.assertFalse(is_columnwise(factor))
+        pipeline = Pipeline(
+            columns={'demeaned': factor},
+            screen=AssetID() <= 2,
+        )
+        result = engine.run_pipeline(pipeline, dates[0], dates[-1])
+
+        self.assertEqual(loader.load_assets, [list(self.asset_ids)])
+        check_arrays(
+            result['demeaned'].unstack().values,
+            array([[-1.5, -0.5]] * len(dates)),
+        )
+
 
 class FrameInputTestCase(WithTradingEnvironment, ZiplineTestCase):
     asset_ids = ASSET_FINDER_EQUITY_SIDS = 1, 2, 3
@@ -266,6 +266,57 @@ class EventIndexerTestCase(ZiplineTestCase):
                 # Neither event is eligible.  Return -1 as a sentinel.
                 self.assertEqual(computed_index, -1)
 
+    def test_loader_indexers_for_subsets_of_sids(self):
+        events = self.events
+        loader = EventsLoader(events, {}, {})
+
+        all_dates = pd.date_range('2014', '2014-01-31')
+        all_sids = np.unique(events['sid'].values)
+
+        def event_ids(ids, indexer):
+            # The loader may store events in a different order, so compare
+            # the ids of the selected events rather than raw indices.
+            return np.where(indexer < 0, -1, ids[indexer])
+
+        for method, indexer_func in (('next_event_indexer',
+                                      next_event_indexer),
+                                     ('previous_event_indexer',
+                                      previous_event_indexer)):
+            expected = event_ids(
+                events['index'].values,
+                indexer_func(
+                    all_dates,
+                    all_sids,
+                    events['event_date'].values,
+                    events['timestamp'].values,
+                    events['sid'].values,
+                ),
+            )
+
+            def loader_event_ids(sids, dates=all_dates):
+                return event_ids(
+                    loader.events['index'],
+                    getattr(loader, method)(dates, sids),
+                )
+
+            assert_equal(loader_event_ids(all_sids), expected)
+
+            # Chunks of dates should agree with the full range.
+            for start, stop in ((0, 7), (7, 18), (18, len(all_dates))):
+                assert_equal(
+                    loader_event_ids(all_sids, all_dates[start:stop]),
+                    expected[start:stop],
+                )
+
+            # Each chunk should only see the events for the sids it asked
+            # for, including sids with no events at all.
+            assert_equal(loader_event_ids(all_sids[::3]), expected[:, ::3])
+            missing = np.array([all_sids.max() + 1], dtype=all_sids.dtype)
+            assert_equal(
+                loader_event_ids(missing),
+                np.full((len(all_dates), 1), -1, dtype=np.int64),
+            )
+
 
 class EventsLoaderTestCase(WithAssetFinder,
                            WithTradingSessions,
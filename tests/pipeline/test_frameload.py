@@ -6,6 +6,7 @@ from unittest import TestCase
 from mock import patch
 from numpy import arange, ones
 from numpy.testing import assert_array_equal
+from testfixtures import TempDirectory
 from pandas import (
     DataFrame,
     DatetimeIndex,
@@ -24,6 +25,10 @@ from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.loaders.frame import (
     DataFrameLoader,
 )
+from zipline.pipeline.loaders.memmap import (
+    MemmapDataFrameLoader,
+    MemmapFrameWriter,
+)
 from zipline.utils.calendars import get_calendar
 
 
@@ -242,3 +247,98 @@ class DataFrameLoaderTestCase(TestCase):
         assert_array_equal(kwargs['data'], expected_baseline.values)
         assert_array_equal(kwargs['mask'], mask)
         self.assertEqual(kwargs['adjustments'], expected_formatted_adjustments)
+
+
+class MemmapDataFrameLoaderTestCase(TestCase):
+
+    def setUp(self):
+        self.trading_day = get_calendar("NYSE").day
+
+        self.sids = Int64Index(range(5))
+        self.dates = DatetimeIndex(
+            start='2014-01-02',
+            freq=self.trading_day,
+            periods=20,
+            tz='UTC',
+        )
+        self.baseline = DataFrame(
+            arange(100, dtype=float).reshape(20, 5),
+            index=self.dates,
+            columns=self.sids,
+        )
+        self.adjustments = DataFrame([
+            {
+                'sid': 1,
+                'start_date': None,
+                'end_date': self.dates[15],
+                'apply_date': self.dates[16],
+                'value': 0.5,
+                'kind': MULTIPLY,
+            },
+            {
+                'sid': 3,
+                'start_date': self.dates[16],
+                'end_date': self.dates[17],
+                'apply_date': self.dates[18],
+                'value': 99.0,
+                'kind': OVERWRITE,
+            },
+        ])
+
+        self.tmpdir = TempDirectory()
+        MemmapFrameWriter(self.tmpdir.path).write(
+            self.baseline,
+            self.adjustments,
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_matches_dataframe_loader(self):
+        column = USEquityPricing.close
+        loader = MemmapDataFrameLoader(column, self.tmpdir.path)
+        expected_loader = DataFrameLoader(
+            column,
+            self.baseline,
+            adjustments=self.adjustments,
+        )
+
+        # Request dates and sids that are partially outside of the stored
+        # data.
+        dates = self.dates[8:].append(
+            DatetimeIndex([self.dates[-1] + self.trading_day]),
+        )
+        sids = Int64Index([1, 3, 99])
+        mask = ones((len(dates), len(sids)), dtype=bool)
+
+        self.assertEqual(
+            loader.format_adjustments(dates, sids),
+            expected_loader.format_adjustments(dates, sids),
+        )
+
+        [adj_array] = loader.load_adjusted_array(
+            [column], dates, sids, mask,
+        ).values()
+        [expected_adj_array] = expected_loader.load_adjusted_array(
+            [column], dates, sids, mask,
+        ).values()
+
+        windows = adj_array.traverse(window_length=3)
+        expected_windows = expected_adj_array.traverse(window_length=3)
+        for window, expected_window in zip(windows, expected_windows):
+            assert_array_equal(window, expected_window)
+
+    def test_bad_input(self):
+        loader = MemmapDataFrameLoader(USEquityPricing.close, self.tmpdir.path)
+        mask = ones((len(self.dates), len(self.sids)), dtype=bool)
+
+        with self.assertRaises(ValueError):
+            # Wrong column.
+            loader.load_adjusted_array(
+                [USEquityPricing.open], self.dates, self.sids, mask,
+            )
+
+        with self.assertRaises(TypeError):
+            MemmapFrameWriter(self.tmpdir.path).write(
+                self.baseline.astype(object),
+            )
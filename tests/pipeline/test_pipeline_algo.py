@@ -37,6 +37,7 @@ from zipline.api import (
 )
 from zipline.errors import (
     AttachPipelineAfterInitialize,
+    DuplicatePipelineName,
     PipelineOutputDuringInitialize,
     NoSuchPipeline,
 )
@@ -253,6 +254,75 @@ class ClosesOnly(WithDataPortal, ZiplineTestCase):
         with self.assertRaises(PipelineOutputDuringInitialize):
             algo.run(self.data_portal)
 
+    def test_duplicate_pipeline_name(self):
+        """
+        Assert that attaching two pipelines with the same name raises.
+        """
+        def initialize(context):
+            attach_pipeline(Pipeline(), 'test')
+            attach_pipeline(Pipeline(), 'test')
+            raise AssertionError("Shouldn't make it past attach_pipeline!")
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start - self.trading_day,
+            end=self.last_asset_end + self.trading_day,
+            env=self.env,
+        )
+
+        with self.assertRaises(DuplicatePipelineName):
+            algo.run(self.data_portal)
+
+    def test_multiple_pipelines(self):
+        """
+        Assert that several attached pipelines each produce their own output.
+        """
+        def initialize(context):
+            close = USEquityPricing.close.latest
+            attach_pipeline(Pipeline({'close': close}), 'all')
+            attach_pipeline(
+                Pipeline({'close': close}, screen=close > 0),
+                'screened',
+                chunksize=5,
+            )
+            attach_pipeline(
+                Pipeline({'close': close}),
+                'incremental',
+                incremental=True,
+            )
+
+        def handle_data(context, data):
+            date = get_datetime().normalize()
+            all_results = pipeline_output('all')
+            screened = pipeline_output('screened')
+            incremental = pipeline_output('incremental')
+            for asset in self.assets:
+                exists_today = self.exists(date, asset)
+                existed_yesterday = self.exists(date - self.trading_day, asset)
+                if exists_today and existed_yesterday:
+                    expected = self.expected_close(date, asset)
+                    self.assertEqual(all_results.loc[asset, 'close'], expected)
+                    self.assertEqual(screened.loc[asset, 'close'], expected)
+                    self.assertEqual(incremental.loc[asset, 'close'], expected)
+                else:
+                    self.assertNotIn(asset, all_results.index)
+                    self.assertNotIn(asset, screened.index)
+                    self.assertNotIn(asset, incremental.index)
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start,
+            end=self.last_asset_end,
+            env=self.env,
+        )
+
+        algo.run(self.data_portal)
+
     def test_get_output_nonexistent_pipeline(self):
         """
         Assert that calling add_pipeline after initialize raises appropriately.
@@ -281,12 +351,17 @@ class ClosesOnly(WithDataPortal, ZiplineTestCase):
         with self.assertRaises(NoSuchPipeline):
             algo.run(self.data_portal)
 
-    @parameterized.expand([('default', None),
-                           ('day', 1),
-                           ('week', 5),
-                           ('year', 252),
-                           ('all_but_one_day', 'all_but_one_day')])
-    def test_assets_appear_on_correct_days(self, test_name, chunksize):
+    @parameterized.expand([('default', None, False),
+                           ('day', 1, False),
+                           ('week', 5, False),
+                           ('year', 252, False),
+                           ('all_but_one_day', 'all_but_one_day', False),
+                           ('incremental_default', None, True),
+                           ('incremental_week', 5, True)])
+    def test_assets_appear_on_correct_days(self,
+                                           test_name,
+                                           chunksize,
+                                           incremental):
         """
         Assert that assets appear at correct times during a backtest, with
         correctly-adjusted close price values.
@@ -299,7 +374,12 @@ class ClosesOnly(WithDataPortal, ZiplineTestCase):
             ) - 1
 
         def initialize(context):
-            p = attach_pipeline(Pipeline(), 'test', chunksize=chunksize)
+            p = attach_pipeline(
+                Pipeline(),
+                'test',
+                chunksize=chunksize,
+                incremental=incremental,
+            )
             p.add(USEquityPricing.close.latest, 'close')
 
         def handle_data(context, data):
@@ -487,10 +567,12 @@ class PipelineAlgorithmTestCase(WithBcolzEquityDailyBarReaderFromCSVs,
         return vwaps
 
     @parameterized.expand([
-        (True,),
-        (False,),
+        (True, False),
+        (False, False),
+        (True, True),
+        (False, True),
     ])
-    def test_handle_adjustment(self, set_screen):
+    def test_handle_adjustment(self, set_screen, incremental):
         AAPL, MSFT, BRK_A = assets = self.assets
 
         window_lengths = [1, 2, 5, 10]
@@ -513,7 +595,7 @@ class PipelineAlgorithmTestCase(WithBcolzEquityDailyBarReaderFromCSVs,
             if set_screen:
                 pipeline.set_screen(filter_)
 
-            attach_pipeline(pipeline, 'test')
+            attach_pipeline(pipeline, 'test', incremental=incremental)
 
         def handle_data(context, data):
             today = normalize_date(get_datetime())
@@ -395,6 +395,28 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
                 self.assertEqual(adj.last_col, expected.last_col)
                 assert_allclose(adj.value, expected.value)
 
+    def test_load_packed_adjustments_from_sqlite(self):
+        columns = [USEquityPricing.close, USEquityPricing.volume]
+        query_days = self.calendar_days_between(
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+        )
+
+        unpacked = self.adjustment_reader.load_adjustments(
+            [c.name for c in columns],
+            query_days,
+            self.assets,
+        )
+        packed = self.adjustment_reader.load_adjustments(
+            [c.name for c in columns],
+            query_days,
+            self.assets,
+            packed=True,
+        )
+
+        for table, expected in zip(packed, unpacked):
+            self.assertEqual(table.to_dict(), expected)
+
     def test_read_no_adjustments(self):
         adjustment_reader = NullAdjustmentReader()
         columns = [USEquityPricing.close, USEquityPricing.volume]
@@ -558,3 +580,39 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
             highs.traverse(windowlen + 1)
         with self.assertRaises(WindowLengthTooLong):
             volumes.traverse(windowlen + 1)
+
+    def test_read_with_unpacked_adjustments(self):
+        adjustment_reader = self.adjustment_reader
+
+        class UnpackedAdjustmentReader(object):
+            # Doesn't accept ``packed``, like adjustment readers written
+            # before packed adjustments existed.
+            def load_adjustments(self, columns, dates, assets):
+                return adjustment_reader.load_adjustments(
+                    columns,
+                    dates,
+                    assets,
+                )
+
+        columns = [USEquityPricing.high, USEquityPricing.volume]
+        query_days = self.calendar_days_between(
+            TEST_QUERY_START,
+            TEST_QUERY_STOP
+        )
+        assets = Int64Index(arange(1, 7))
+        mask = ones((len(query_days), 6), dtype=bool)
+
+        packed, unpacked = (
+            USEquityPricingLoader(
+                self.bcolz_equity_daily_bar_reader,
+                reader,
+            ).load_adjusted_array(columns, query_days, assets, mask)
+            for reader in (adjustment_reader, UnpackedAdjustmentReader())
+        )
+
+        for column in columns:
+            for windowlen in range(1, len(query_days) + 1):
+                for expected, window in zip(
+                        packed[column].traverse(windowlen),
+                        unpacked[column].traverse(windowlen)):
+                    assert_allclose(expected, window)
@@ -515,6 +515,68 @@ class TestRisk(WithTradingEnvironment, ZiplineTestCase):
         # Confirm that max_leverage is set to the max of those values
         assert test_period.max_leverage == .03
 
+    def test_treasury_curves_lookup(self):
+        dates = pd.to_datetime(
+            ['2006-01-03', '2006-01-04', '2006-01-06'],
+            utc=True,
+        )
+        treasury = pd.DataFrame(
+            {
+                duration: np.arange(3, dtype=float) + i / 10.0
+                for i, duration in enumerate(risk.risk.TREASURY_DURATIONS)
+            },
+            index=dates,
+        ).astype(object)
+        treasury.loc[dates[1], '1month'] = None
+        treasury.loc[dates[2], ['1month', '3month']] = None
+        treasury_curves = risk.risk.TreasuryCurves(treasury)
+
+        # Missing rates are filled from the next longer duration.
+        for date in dates:
+            for duration in risk.risk.TREASURY_DURATIONS:
+                position, exact = treasury_curves.find_rate(duration, date)
+                self.assertEqual(position, dates.get_loc(date))
+                self.assertTrue(exact)
+                self.assertEqual(
+                    treasury_curves.rates[
+                        risk.risk.TREASURY_DURATIONS.index(duration),
+                        position,
+                    ],
+                    risk.risk.get_treasury_rate(treasury, duration, date),
+                )
+
+        # Dates without curves use the latest earlier curve.
+        self.assertEqual(
+            treasury_curves.find_rate(
+                '1month',
+                pd.Timestamp('2006-01-05', tz='UTC'),
+            ),
+            (1, False),
+        )
+        self.assertEqual(
+            risk.risk.choose_treasury(
+                lambda *args: '1month',
+                treasury,
+                pd.Timestamp('2006-01-03', tz='UTC'),
+                pd.Timestamp('2006-01-05', tz='UTC'),
+                self.trading_calendar,
+                compound=False,
+            ),
+            1.1,
+        )
+
+        # Restricting the curves to a range drops the other dates.
+        window = treasury_curves.between(dates[1], dates[1])
+        assert window.frame.equals(treasury.iloc[1:2])
+        self.assertEqual(window.find_rate('3month', dates[2]), (1, False))
+
+        # Ranges after the last date use the last curve.
+        window = treasury_curves.between(
+            pd.Timestamp('2006-02-01', tz='UTC'),
+            pd.Timestamp('2006-02-28', tz='UTC'),
+        )
+        assert window.frame.equals(treasury.iloc[-1:])
+
     def test_index_mismatch_exception(self):
         # An exception is raised when returns and benchmark returns
         # have indexes that do not match
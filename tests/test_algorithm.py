@@ -53,6 +53,7 @@ from zipline.data.us_equity_pricing import (
     BcolzDailyBarWriter,
 )
 from zipline.errors import (
+    CheckpointMismatch,
     OrderDuringInitialize,
     RegisterTradingControlPostInit,
     TradingControlViolation,
@@ -75,7 +76,12 @@ from zipline.api import (
 from zipline.finance.commission import PerShare
 from zipline.finance.execution import LimitOrder
 from zipline.finance.order import ORDER_STATUS
+from zipline.finance.performance import (
+    StreamedResults,
+    StreamingResultsWriter,
+)
 from zipline.finance.trading import SimulationParameters
+from zipline.gens.checkpoint import Checkpoint, CheckpointWriter
 from zipline.testing import (
     FakeDataPortal,
     create_daily_df_for_asset,
@@ -100,6 +106,7 @@ from zipline.testing.fixtures import (
     WithTradingCalendars,
     ZiplineTestCase,
 )
+from zipline.testing.predicates import assert_equal
 from zipline.test_algorithms import (
     access_account_in_init,
     access_portfolio_in_init,
@@ -191,6 +198,93 @@ class TestRecordAlgorithm(WithSimParams, WithDataPortal, ZiplineTestCase):
         np.testing.assert_array_equal(output['name3'].values,
                                       range(1, len(output) + 1))
 
+    def test_metrics_only(self):
+        full = RecordAlgorithm(
+            sim_params=self.sim_params,
+            env=self.env,
+        ).run(self.data_portal)
+        metrics_only = RecordAlgorithm(
+            sim_params=self.sim_params,
+            env=self.env,
+            metrics_only=True,
+        ).run(self.data_portal)
+
+        for name in ('positions', 'transactions', 'orders'):
+            self.assertIn(name, full.columns)
+            self.assertNotIn(name, metrics_only.columns)
+
+        assert_equal(
+            metrics_only,
+            full.drop(['positions', 'transactions', 'orders'], axis=1),
+        )
+
+    def test_stream_results(self):
+        full = RecordAlgorithm(
+            sim_params=self.sim_params,
+            env=self.env,
+        ).run(self.data_portal)
+
+        with TempDirectory() as tmpdir:
+            algo = RecordAlgorithm(sim_params=self.sim_params, env=self.env)
+            results = algo.run(
+                self.data_portal,
+                results_sink=StreamingResultsWriter(tmpdir.path, chunksize=5),
+            )
+            self.assertIsInstance(results, StreamedResults)
+
+            assert_equal(results.to_frame(), full)
+            summary = results.summary()
+            self.assertIn(str(full.index[0].date()), summary)
+            self.assertIn(tmpdir.path, summary)
+            self.assertEqual(
+                sorted(results.risk_report),
+                sorted(algo.risk_report),
+            )
+
+            start, end = full.index[7], full.index[12]
+            assert_equal(
+                results.to_frame(start, end),
+                full.loc[start:end],
+            )
+
+    def test_checkpoint_and_resume(self):
+        with TempDirectory() as tmpdir:
+            path = tmpdir.getpath('checkpoint')
+            full = RecordAlgorithm(
+                sim_params=self.sim_params,
+                env=self.env,
+            ).run(
+                self.data_portal,
+                checkpoints=CheckpointWriter(path, frequency=5),
+            )
+
+            # The last checkpoint is from part way through the simulation, so
+            # resuming from it replays the rest of the sessions.
+            checkpoint = Checkpoint.read(
+                path,
+                RecordAlgorithm(sim_params=self.sim_params, env=self.env),
+            )
+            self.assertLess(checkpoint.session, full.index[-1])
+            self.assertEqual(
+                checkpoint.context,
+                {'incr': len(checkpoint.recorder)},
+            )
+
+            algo = RecordAlgorithm(sim_params=self.sim_params, env=self.env)
+            resumed = algo.resume(path, self.data_portal)
+            assert_equal(resumed, full)
+            self.assertEqual(algo.incr, len(full))
+
+            other_params = self.sim_params.create_new(
+                self.sim_params.sessions[1],
+                self.sim_params.end_session,
+            )
+            with self.assertRaises(CheckpointMismatch):
+                RecordAlgorithm(
+                    sim_params=other_params,
+                    env=self.env,
+                ).resume(path, self.data_portal)
+
 
 class TestMiscellaneousAPI(WithLogger,
                            WithSimParams,
@@ -576,6 +670,50 @@ def log_nyse_close(context, data):
                 % (n, g.__name__, f.__name__),
             )
 
+    def test_sparse_clock(self):
+        def rebalance(context, data):
+            # Small enough to be filled in one bar.
+            context.order(context.sid(1), 2)
+            context.record(price=data.current(context.sid(1), 'price'))
+
+        def initialize(context):
+            context.schedule_function(
+                rebalance,
+                date_rule=date_rules.every_day(),
+                time_rule=time_rules.market_open(minutes=30),
+            )
+
+        def run(sparse_clock):
+            bars = []
+            algo = TradingAlgorithm(
+                initialize=initialize,
+                sim_params=self.sim_params,
+                env=self.env,
+                create_event_context=CallbackManager(bars.append),
+                sparse_clock=sparse_clock,
+            )
+            return algo.run(self.data_portal), bars
+
+        dense, dense_bars = run(sparse_clock=False)
+        sparse, sparse_bars = run(sparse_clock=True)
+
+        self.assertEqual(len(dense_bars), 780)
+        # Each session has the rebalance, the bar that fills its order and
+        # the close.
+        self.assertEqual(len(sparse_bars), 6)
+
+        # Orders and transactions have random ids.
+        id_columns = ['orders', 'transactions']
+        assert_equal(
+            sparse.drop(id_columns, axis=1),
+            dense.drop(id_columns, axis=1),
+        )
+        for column in id_columns:
+            self.assertEqual(
+                list(map(len, sparse[column])),
+                list(map(len, dense[column])),
+            )
+
     @parameterized.expand([
         ('daily',),
         ('minute'),
@@ -948,6 +1086,88 @@ def before_trading_start(context, data):
         )
         algo.run(self.data_portal)
 
+    def test_order_batch(self):
+        order_ids = []
+
+        def handle_data(context, data):
+            order_ids.append(context.order_batch({
+                context.sid(0): 2,
+                context.sid(1): 0,
+                context.sid(133): -1.00001,
+            }))
+
+        algo = TradingAlgorithm(
+            handle_data=handle_data,
+            sim_params=self.sim_params,
+            env=self.env,
+        )
+        algo.run(self.data_portal)
+
+        self.assertEqual(len(order_ids), 4)
+        for ids in order_ids:
+            self.assertIsNone(ids[algo.sid(1)])
+            self.assertEqual(algo.blotter.orders[ids[algo.sid(0)]].amount, 2)
+            self.assertEqual(
+                algo.blotter.orders[ids[algo.sid(133)]].amount,
+                -1,
+            )
+
+    def test_order_target_percents(self):
+        targets = [
+            {0: 0.3, 1: 0.2, 133: -0.1},
+            {0: 0.1, 1: 0.4, 133: 0.0},
+            {0: 0.1, 1: 0.4, 133: 0.0},
+            {0: 0.5, 133: 0.2},
+        ]
+
+        def initialize(context, batch):
+            context.batch = batch
+            context.session = 0
+
+        def handle_data(context, data):
+            weights = {
+                context.sid(sid): weight
+                for sid, weight in iteritems(targets[context.session])
+            }
+            context.session += 1
+            if context.batch:
+                context.order_target_percents(weights)
+            else:
+                for asset, weight in iteritems(weights):
+                    context.order_target_percent(asset, weight)
+
+        def run(batch):
+            return TradingAlgorithm(
+                initialize=initialize,
+                handle_data=handle_data,
+                batch=batch,
+                sim_params=self.sim_params,
+                env=self.env,
+            ).run(self.data_portal)
+
+        batched = run(batch=True)
+        expected = run(batch=False)
+
+        # Orders and transactions have random ids.
+        id_columns = ['orders', 'transactions']
+        assert_equal(
+            batched.drop(id_columns, axis=1),
+            expected.drop(id_columns, axis=1),
+        )
+        for column in id_columns:
+            self.assertEqual(
+                [
+                    sorted((record['sid'].sid, record['amount'])
+                           for record in records)
+                    for records in batched[column]
+                ],
+                [
+                    sorted((record['sid'].sid, record['amount'])
+                           for record in records)
+                    for records in expected[column]
+                ],
+            )
+
     def test_order_on_each_day_of_asset_lifetime(self):
         algo_code = dedent("""
         from zipline.api import sid, schedule_function, date_rules, order
@@ -2817,6 +3037,91 @@ class TestTradingControls(WithSimParams, WithDataPortal, ZiplineTestCase):
 
         self.check_algo_succeeds(algo, handle_data)
 
+    def test_order_batch_validates_every_order_first(self):
+        algo = SetDoNotOrderListAlgorithm(
+            sid=self.sid,
+            restricted_list=[134],
+            sim_params=self.sim_params,
+            env=self.env,
+        )
+
+        def handle_data(algo, data):
+            algo.order_batch({algo.sid(self.sid): 1, algo.sid(134): 1})
+            algo.order_count += 1
+
+        self.check_algo_fails(algo, handle_data, 0)
+        # The order for the unrestricted asset wasn't placed either.
+        self.assertEqual(algo.blotter.orders, {})
+
+    @parameterized.expand([
+        ('max_order_size',
+         lambda algo: algo.set_max_order_size(max_shares=10),
+         {133: 10, 134: -10},
+         False),
+        ('max_order_size_violated',
+         lambda algo: algo.set_max_order_size(max_shares=10),
+         {133: 10, 134: -11},
+         True),
+        ('max_order_size_for_asset',
+         lambda algo: algo.set_max_order_size(algo.sid(134), max_shares=1),
+         {133: 100, 134: 1},
+         False),
+        ('max_order_size_for_asset_violated',
+         lambda algo: algo.set_max_order_size(algo.sid(134), max_shares=1),
+         {133: 1, 134: 2},
+         True),
+        ('max_position_size',
+         lambda algo: algo.set_max_position_size(max_shares=10),
+         {133: 10, 134: -10},
+         False),
+        ('max_position_size_violated',
+         lambda algo: algo.set_max_position_size(max_shares=10),
+         {133: 5, 134: 11},
+         True),
+        ('long_only',
+         lambda algo: algo.set_long_only(),
+         {133: 1, 134: 0},
+         False),
+        ('long_only_violated',
+         lambda algo: algo.set_long_only(),
+         {133: 1, 134: -1},
+         True),
+        ('max_order_count',
+         lambda algo: algo.set_max_order_count(2),
+         {133: 1, 134: 1},
+         False),
+        ('max_order_count_violated',
+         lambda algo: algo.set_max_order_count(1),
+         {133: 1, 134: 1},
+         True),
+    ])
+    def test_order_batch_controls(self, name, set_control, amounts, fails):
+        def initialize(algo):
+            algo.order_count = 0
+            set_control(algo)
+
+        def handle_data(algo, data):
+            if algo.order_count:
+                return
+            algo.order_batch({
+                algo.sid(sid): amount for sid, amount in iteritems(amounts)
+            })
+            algo.order_count += 1
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            sim_params=self.sim_params,
+            env=self.env,
+        )
+        self._check_algo(
+            algo,
+            handle_data,
+            0 if fails else 1,
+            TradingControlViolation if fails else None,
+        )
+        if fails:
+            self.assertEqual(algo.blotter.orders, {})
+
     def test_set_max_order_size(self):
 
         # Buy one share.
@@ -195,6 +195,58 @@ class TestBenchmark(WithDataPortal, WithSimParams, WithTradingCalendars,
                     manually_calculated[idx + 1]
                 )
 
+    def test_return_since_open(self):
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            self.sim_params.sessions[0],
+            self.sim_params.sessions[5]
+        )
+
+        tmp_reader = tmp_bcolz_equity_minute_bar_reader(
+            self.trading_calendar,
+            self.trading_calendar.all_sessions,
+            create_minute_bar_data(minutes, [2]),
+        )
+        with tmp_reader as reader:
+            data_portal = DataPortal(
+                self.env.asset_finder, self.trading_calendar,
+                first_trading_day=reader.first_trading_day,
+                equity_minute_reader=reader,
+                equity_daily_reader=self.bcolz_equity_daily_bar_reader,
+                adjustment_reader=self.adjustment_reader,
+            )
+
+            sessions = self.sim_params.sessions[1:4]
+            source = BenchmarkSource(
+                2,
+                self.env,
+                self.trading_calendar,
+                sessions,
+                data_portal,
+                emission_rate='minute',
+            )
+
+            for session in sessions:
+                session_minutes = self.trading_calendar.minutes_for_session(
+                    session,
+                )
+                growth = 1.0
+                for minute in session_minutes:
+                    growth *= 1.0 + source.get_value(minute)
+                    self.assertAlmostEqual(
+                        source.get_return_since_open(minute),
+                        growth - 1.0,
+                    )
+
+            # Nothing has happened yet before the first minute of the day.
+            self.assertEqual(
+                source.get_return_since_open(
+                    self.trading_calendar.open_and_close_for_session(
+                        sessions[0],
+                    )[0] - pd.Timedelta(minutes=1),
+                ),
+                0.0,
+            )
+
     def test_no_stock_dividends_allowed(self):
         # try to use sid(4) as benchmark, should blow up due to the presence
         # of a stock dividend
@@ -123,6 +123,44 @@ class BlotterTestCase(WithLogger,
         self.assertEqual(len(blotter.open_orders), 1)
         self.assertEqual(list(blotter.open_orders), [asset_25])
 
+    def test_archive_closed_orders(self):
+        blotter = Blotter('daily', self.env.asset_finder)
+        blotter.set_date(self.sim_params.sessions[0])
+
+        asset_24 = blotter.asset_finder.retrieve_asset(24)
+        asset_25 = blotter.asset_finder.retrieve_asset(25)
+
+        open_id = blotter.order(asset_24, 100, LimitOrder(10))
+        cancelled_id = blotter.order(asset_25, -150, StopOrder(20))
+        rejected_id = blotter.order(asset_25, 50, MarketOrder())
+        blotter.cancel(cancelled_id)
+        blotter.reject(rejected_id, reason='too big')
+
+        orders = {order_id: blotter.orders[order_id]
+                  for order_id in (open_id, cancelled_id, rejected_id)}
+        expected = {order_id: order.to_dict()
+                    for order_id, order in orders.items()}
+
+        # The closed orders are kept until their status has been relayed.
+        blotter.archive_closed_orders()
+        for order_id, order in orders.items():
+            self.assertIs(blotter.orders[order_id], order)
+
+        blotter.new_orders = []
+        blotter.archive_closed_orders()
+        self.assertIs(blotter.orders[open_id], orders[open_id])
+        self.assertIsNot(blotter.orders[cancelled_id], orders[cancelled_id])
+        self.assertIsNot(blotter.orders[rejected_id], orders[rejected_id])
+
+        self.assertEqual(sorted(blotter.orders), sorted(expected))
+        for order_id, expected_dict in expected.items():
+            self.assertIn(order_id, blotter.orders)
+            self.assertEqual(blotter.orders[order_id].to_dict(), expected_dict)
+
+        # Cancelling an archived order does nothing.
+        blotter.cancel(cancelled_id)
+        self.assertEqual(blotter.new_orders, [])
+
     def test_blotter_eod_cancellation(self):
         blotter = Blotter('minute', self.env.asset_finder,
                           cancel_policy=EODCancel())
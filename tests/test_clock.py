@@ -3,6 +3,7 @@ from unittest import TestCase
 import pandas as pd
 from zipline.gens.sim_engine import (
     MinuteSimulationClock,
+    SparseMinuteSimulationClock,
     SESSION_START,
     BEFORE_TRADING_START_BAR,
     BAR,
@@ -178,3 +179,108 @@ class TestClock(TestCase):
                 self.sessions[i],
                 all_events[(i * 392): ((i + 1) * 392)]
             )
+
+
+class TestSparseClock(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.nyse_calendar = get_calendar("NYSE")
+
+        cls.sessions = cls.nyse_calendar.sessions_in_range(
+            pd.Timestamp("2016-07-15"),
+            pd.Timestamp("2016-07-19")
+        )
+
+        trading_o_and_c = cls.nyse_calendar.schedule.ix[cls.sessions]
+        cls.opens = trading_o_and_c['market_open']
+        cls.closes = trading_o_and_c['market_close']
+
+        cls.triggers = pd.DatetimeIndex([
+            pd.Timestamp("2016-07-15 10:00", tz='US/Eastern'),
+            # Not a market minute.
+            pd.Timestamp("2016-07-16 10:00", tz='US/Eastern'),
+            pd.Timestamp("2016-07-18 9:31", tz='US/Eastern'),
+            pd.Timestamp("2016-07-18 15:00", tz='US/Eastern'),
+            pd.Timestamp("2016-07-19 16:00", tz='US/Eastern'),
+        ]).tz_convert('UTC')
+
+    def clocks(self, bts_time, needs_every_minute):
+        bts_minutes = days_at_time(self.sessions, bts_time, "US/Eastern")
+        dense = MinuteSimulationClock(
+            self.sessions,
+            self.opens,
+            self.closes,
+            bts_minutes,
+            False
+        )
+        sparse = SparseMinuteSimulationClock(
+            self.sessions,
+            self.opens,
+            self.closes,
+            bts_minutes,
+            self.triggers.asi8,
+            needs_every_minute,
+        )
+        return list(dense), sparse
+
+    bts_times = [
+        time(6, 17),
+        time(9, 30),
+        time(11, 45),
+        time(16, 00),
+        time(19, 5),
+    ]
+
+    def test_every_minute(self):
+        for bts_time in self.bts_times:
+            dense, sparse = self.clocks(bts_time, lambda: True)
+            self.assertEqual(list(sparse), dense)
+
+    def test_triggers_only(self):
+        closes = set(self.closes)
+        triggers = set(self.triggers)
+        for bts_time in self.bts_times:
+            dense, sparse = self.clocks(bts_time, lambda: False)
+            self.assertEqual(
+                list(sparse),
+                [
+                    (dt, event) for dt, event in dense
+                    if event != BAR or dt in triggers or dt in closes
+                ],
+            )
+
+    def test_needs_every_minute(self):
+        # Emulate an order placed at each trigger that takes three more bars
+        # to fill.
+        remaining = [0]
+
+        def needs_every_minute():
+            return remaining[0] > 0
+
+        triggers = set(self.triggers)
+        dense, sparse = self.clocks(time(8, 45), needs_every_minute)
+        events = []
+        for dt, event in sparse:
+            events.append((dt, event))
+            if event == BAR:
+                if dt in triggers:
+                    remaining[0] = 3
+                elif remaining[0]:
+                    remaining[0] -= 1
+
+        filling = {
+            trigger + pd.Timedelta(minutes=n)
+            for trigger in self.triggers
+            for n in range(1, 4)
+        }
+        closes = set(self.closes)
+        self.assertEqual(
+            events,
+            [
+                (dt, event) for dt, event in dense
+                if (event != BAR or
+                    dt in triggers or
+                    dt in filling or
+                    dt in closes)
+            ],
+        )
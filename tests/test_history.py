@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from textwrap import dedent
+from threading import current_thread
 
 from nose_parameterized import parameterized
 import numpy as np
@@ -23,6 +24,7 @@ from six import iteritems
 from zipline import TradingAlgorithm
 from zipline._protocol import handle_non_market_minutes
 from zipline.assets import Asset
+from zipline.data.data_portal import DataPortal
 from zipline.errors import (
     HistoryInInitialize,
     HistoryWindowStartsBeforeData,
@@ -1131,6 +1133,72 @@ class MinuteEquityHistoryTestCase(WithHistory, ZiplineTestCase):
             pd.Timestamp('2014-07-07 13:31', tz='UTC')
         )
 
+    def test_minute_prefetch_in_background(self):
+        data_portal = DataPortal(
+            self.env.asset_finder,
+            self.trading_calendar,
+            first_trading_day=self.DATA_PORTAL_FIRST_TRADING_DAY,
+            equity_daily_reader=self.bcolz_equity_daily_bar_reader,
+            equity_minute_reader=self.bcolz_equity_minute_bar_reader,
+            adjustment_reader=self.adjustment_reader,
+            prefetch_minute_history=True,
+        )
+        assets = [self.ASSET2, self.SPLIT_ASSET, self.DIVIDEND_ASSET]
+
+        loader = data_portal._minute_history_loader
+        load_array = loader._array
+        load_and_prefetch = loader._load_and_prefetch
+        main_thread = current_thread()
+        served_from_background = []
+
+        def load_in_background_only(dts, assets, field):
+            # Background loads swallow their errors, so fail loudly if a
+            # window has to fall back to loading its block synchronously.
+            if current_thread() is main_thread:
+                raise AssertionError(
+                    'loaded %s synchronously after warming up' % field,
+                )
+            return load_array(dts, assets, field)
+
+        def record_served(start_ix, end_ix, prefetch_end_ix, assets, field):
+            result = load_and_prefetch(
+                start_ix,
+                end_ix,
+                prefetch_end_ix,
+                assets,
+                field,
+            )
+            served_from_background.append(field)
+            return result
+
+        # Walk through more minutes than are prefetched at once, so that
+        # windows expire and are rebuilt from blocks loaded in the
+        # background.  The split and dividend assets have adjustments on
+        # 1/6 and 1/7.
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            pd.Timestamp('2015-01-05', tz='UTC'),
+            pd.Timestamp('2015-01-12', tz='UTC'),
+        )[::7]
+        for i, minute in enumerate(minutes):
+            if i == 1:
+                # The first windows are loaded synchronously.  From now on,
+                # every block must come from a completed background load.
+                loader._array = load_in_background_only
+                loader._load_and_prefetch = record_served
+            for field in ('close', 'volume'):
+                expected = self.data_portal.get_history_window(
+                    assets, minute, 15, '1m', field,
+                )
+                result = data_portal.get_history_window(
+                    assets, minute, 15, '1m', field,
+                )
+                np.testing.assert_array_equal(result.values, expected.values)
+
+        self.assertEqual(
+            sorted(set(served_from_background)),
+            ['close', 'volume'],
+        )
+
     def test_minute_different_lifetimes(self):
         # at trading start, only asset1 existed
         day = self.trading_calendar.next_session_label(self.TRADING_START_DT)
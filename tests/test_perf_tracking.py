@@ -2085,3 +2085,54 @@ class TestPositionTracker(WithTradingEnvironment,
         # Test gross and net exposures
         self.assertEqual(100 + 150000 + 200, pos_stats.gross_exposure)
         self.assertEqual(100 + 150000 - 200, pos_stats.net_exposure)
+
+
+class TestDailyStatsRecorder(ZiplineTestCase):
+
+    def test_column_dtypes(self):
+        closes = pd.date_range('2016-01-04 21:00', periods=3, tz='UTC')
+        rows = [
+            {'count': 1, 'returns': 0.1, 'name': 'a', 'gap': 1},
+            {'count': 2, 'returns': 0.2, 'name': 'b', 'late': 5},
+            {'count': 3, 'returns': 0.3, 'name': 'c', 'gap': 3},
+        ]
+        sharpes = [None, 1.0, 2.0]
+
+        # Start with too little room so that the columns have to grow.
+        recorder = perf.DailyStatsRecorder(2)
+        for close, row, sharpe in zip(closes, rows, sharpes):
+            daily_perf = dict(row, period_close=close, positions=[])
+            recorder.record({
+                'daily_perf': daily_perf,
+                'cumulative_risk_metrics': {'sharpe': sharpe},
+            })
+        recorder.record({'cumulative_perf': {}})
+
+        columns = recorder._columns
+        self.assertEqual(columns['count'].dtype, np.int64)
+        self.assertEqual(columns['returns'].dtype, np.float64)
+        self.assertEqual(columns['late'].dtype, np.float64)
+        self.assertEqual(columns['name'].dtype, object)
+        self.assertEqual(columns['positions'].dtype, object)
+        self.assertEqual(columns['sharpe'].dtype, object)
+        self.assertEqual(recorder.risk_report, {'cumulative_perf': {}})
+
+        frame = recorder.to_frame()
+        expected = pd.DataFrame(
+            {
+                'count': [1, 2, 3],
+                'returns': [0.1, 0.2, 0.3],
+                'name': ['a', 'b', 'c'],
+                'gap': [1.0, np.nan, 3.0],
+                'late': [np.nan, 5.0, np.nan],
+                'period_close': list(closes),
+                'positions': [[], [], []],
+                'sharpe': [np.nan, 1.0, 2.0],
+            },
+            index=pd.DatetimeIndex(list(closes)),
+        )
+        pd.util.testing.assert_frame_equal(
+            frame,
+            expected,
+            check_like=True,
+        )
@@ -1,4 +1,5 @@
 from datetime import timedelta
+import os
 
 import pandas as pd
 from testfixtures import TempDirectory
@@ -18,6 +19,7 @@ from zipline.testing.fixtures import (
     ZiplineTestCase,
 )
 from zipline.utils import factory
+from zipline.utils.paths import cache_path
 from zipline.utils.security_list import (
     SecurityListSet,
     load_from_directory,
@@ -188,6 +190,37 @@ class SecurityListTestCase(WithLogger, WithTradingCalendars, ZiplineTestCase):
             self.assertNotIn("BZQ", rl.leveraged_etf_list)
             self.assertNotIn("URTY", rl.leveraged_etf_list)
 
+    def test_security_list_before_first_knowledge_date(self):
+        def get_datetime():
+            return min(LEVERAGED_ETFS) - timedelta(days=1)
+
+        rl = SecurityListSet(get_datetime, self.env.asset_finder)
+        self.assertEqual(list(rl.leveraged_etf_list), [])
+
+    def test_load_from_directory_cache(self):
+        with security_list_copy(), tmp_dir() as root:
+            environ = {'ZIPLINE_ROOT': root.path}
+            data = load_from_directory('leveraged_etf_list', environ=environ)
+            self.assertEqual(data, LEVERAGED_ETFS)
+            self.assertTrue(os.path.exists(cache_path(
+                ['security_lists', 'leveraged_etf_list.pickle'],
+                environ=environ,
+            )))
+            self.assertEqual(
+                load_from_directory('leveraged_etf_list', environ=environ),
+                data,
+            )
+
+            # Changing the files invalidates the cache.
+            add_security_data(['AAPL'], [])
+            data = load_from_directory('leveraged_etf_list', environ=environ)
+            self.assertEqual(
+                data[self.extra_knowledge_date][
+                    pd.Timestamp('2015-01-25', tz='utc')
+                ]['add'],
+                ['AAPL'],
+            )
+
     def test_algo_without_rl_violation_via_check(self):
         algo = RestrictedAlgoWithCheck(symbol='BZQ',
                                        sim_params=self.sim_params,
@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+from zipline.utils.imports import DeferredCallable, profile_imports
+
+
+class DeferredCallableTestCase(TestCase):
+
+    def test_deferred_callable(self):
+        from os.path import join
+
+        deferred = DeferredCallable('os.path', 'join')
+        self.assertEqual(repr(deferred), '<DeferredCallable: os.path.join>')
+        self.assertIs(deferred.resolve(), join)
+        self.assertEqual(deferred('a', 'b'), join('a', 'b'))
+
+    def test_missing_name(self):
+        deferred = DeferredCallable('os.path', 'not_a_function')
+        with self.assertRaises(AttributeError):
+            deferred()
+
+
+class ProfileImportsTestCase(TestCase):
+
+    def test_profile_imports(self):
+        total, imports = profile_imports('email.mime.text')
+
+        modules = [i.module for i in imports]
+        self.assertIn('email.mime.text', modules)
+        self.assertEqual(len(modules), len(set(modules)))
+        for i in imports:
+            self.assertGreaterEqual(i.cumulative, i.self)
+            self.assertLessEqual(i.cumulative, total)
+
+        # The requested module finishes loading last, at the top level.
+        self.assertEqual(imports[-1].module, 'email.mime.text')
+        self.assertEqual(imports[-1].depth, 0)
+
+    def test_import_error(self):
+        with self.assertRaises(subprocess.CalledProcessError):
+            profile_imports('zipline.not_a_module')
+
+
+class LazyImportsTestCase(TestCase):
+
+    def test_optional_subsystems_not_imported(self):
+        # Check the modules imported by a fresh interpreter, because this one
+        # has already imported everything.
+        modules = json.loads(subprocess.check_output([
+            sys.executable,
+            '-c',
+            'import json, sys, zipline.__main__;'
+            ' print(json.dumps(sorted(sys.modules)))',
+        ]).decode('utf-8'))
+
+        for module in ('blaze',
+                       'odo',
+                       'pandas_datareader',
+                       'zipline.data.bundles.quandl',
+                       'zipline.data.bundles.yahoo',
+                       'zipline.pipeline.loaders.blaze',
+                       'zipline.pipeline.visualize',
+                       'zipline.utils.calendars.exchange_calendar_nyse'):
+            self.assertNotIn(module, modules)
@@ -0,0 +1,143 @@
+from mock import patch
+import numpy as np
+import pandas as pd
+from six import iteritems
+
+from zipline.api import (
+    attach_pipeline,
+    order,
+    pipeline_output,
+    record,
+    sid,
+)
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import Column, DataSet
+from zipline.pipeline.loaders.frame import DataFrameLoader
+from zipline.testing import parameter_space
+from zipline.testing.fixtures import (
+    WithDataPortal,
+    WithSimParams,
+    ZiplineTestCase,
+)
+from zipline.testing.predicates import assert_equal
+from zipline.utils.calendars import get_calendar
+from zipline.utils.sweep import Sweep
+
+
+def initialize(context, step):
+    context.step = step
+    context.total = 0
+    context.asset = sid(133)
+
+
+def handle_data(context, data):
+    context.total += context.step
+    record(total=context.total)
+    order(context.asset, context.step)
+
+
+class SweepData(DataSet):
+    value = Column(dtype=float)
+
+
+def initialize_pipeline(context, step):
+    initialize(context, step)
+    attach_pipeline(Pipeline({'value': SweepData.value.latest}), 'sweep')
+
+
+def before_trading_start(context, data):
+    context.values = pipeline_output('sweep')
+
+
+class SweepTestCase(WithSimParams, WithDataPortal, ZiplineTestCase):
+    ASSET_FINDER_EQUITY_SIDS = 133,
+
+    def make_sweep(self, steps=(1, 2, 3)):
+        return Sweep(
+            {
+                step: {
+                    'initialize': initialize,
+                    'handle_data': handle_data,
+                    'step': step,
+                }
+                for step in steps
+            },
+            self.env,
+            self.data_portal,
+            self.sim_params,
+        )
+
+    @parameter_space(
+        __fail_fast=True,
+        processes=[None, 2],
+        multiplex=[False, True],
+    )
+    def test_sweep(self, processes, multiplex):
+        sweep = self.make_sweep()
+        if processes is not None and multiplex:
+            with self.assertRaises(ValueError):
+                sweep.run(processes=processes, multiplex=multiplex)
+            return
+
+        perfs = sweep.run(processes=processes, multiplex=multiplex)
+
+        self.assertEqual(sorted(perfs), [1, 2, 3])
+        for step, perf in iteritems(perfs):
+            assert_equal(
+                perf.total.values,
+                np.arange(1, len(perf) + 1) * float(step),
+            )
+            # Orders and transactions have random ids.
+            id_columns = ['orders', 'transactions']
+            assert_equal(
+                perf.drop(id_columns, axis=1),
+                sweep.run_variant(step).drop(id_columns, axis=1),
+            )
+
+    def count_multiplexed_reads(self, steps):
+        reader = self.data_portal._get_pricing_reader('daily')
+        sweep = self.make_sweep(steps)
+        with patch.object(reader, 'get_value', wraps=reader.get_value) as m:
+            sweep.run(multiplex=True)
+        return m.call_count
+
+    def test_multiplexed_reads_are_shared(self):
+        single = self.count_multiplexed_reads([1])
+        self.assertGreater(single, 0)
+        self.assertEqual(self.count_multiplexed_reads([1, 2, 3]), single)
+
+    def count_pipeline_loads(self, steps):
+        loader = DataFrameLoader(
+            SweepData.value,
+            pd.DataFrame(
+                1.0,
+                index=get_calendar('NYSE').all_sessions,
+                columns=[133],
+            ),
+        )
+        sweep = Sweep(
+            {
+                step: {
+                    'initialize': initialize_pipeline,
+                    'handle_data': handle_data,
+                    'before_trading_start': before_trading_start,
+                    'step': step,
+                }
+                for step in steps
+            },
+            self.env,
+            self.data_portal,
+            self.sim_params,
+            get_pipeline_loader=lambda column: loader,
+        )
+        with patch.object(
+                loader,
+                'load_adjusted_array',
+                wraps=loader.load_adjusted_array) as m:
+            sweep.run()
+        return m.call_count
+
+    def test_pipelines_are_shared(self):
+        single = self.count_pipeline_loads([1])
+        self.assertGreater(single, 0)
+        self.assertEqual(self.count_pipeline_loads([1, 2, 3]), single)
@@ -1,6 +1,7 @@
 import errno
 import os
 from functools import wraps
+from subprocess import CalledProcessError
 
 import click
 import logbook
@@ -8,7 +9,9 @@ import pandas as pd
 from six import text_type
 
 from zipline.data import bundles as bundles_module
+from zipline.finance.performance import StreamedResults
 from zipline.utils.cli import Date, Timestamp
+from zipline.utils.imports import format_import_profile, profile_imports
 from zipline.utils.run_algo import _run, load_extensions
 
 try:
@@ -17,7 +20,32 @@ except NameError:
     __IPYTHON__ = False
 
 
+def _profile_startup(ctx, param, value):
+    """Print the time it takes to start the zipline cli and exit.
+    """
+    if not value or ctx.resilient_parsing:
+        return
+
+    # Import the cli in a fresh interpreter, because everything has already
+    # been imported in this one.
+    module_name = 'zipline.__main__'
+    try:
+        total, imports = profile_imports(module_name)
+    except CalledProcessError:
+        raise click.ClickException('Failed to import %s.' % module_name)
+    click.echo(format_import_profile(module_name, total, imports))
+    ctx.exit()
+
+
 @click.group()
+@click.option(
+    '--profile-startup',
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=_profile_startup,
+    help='Show the slowest imports when starting zipline and exit.',
+)
 @click.option(
     '-e',
     '--extension',
@@ -172,6 +200,37 @@ def ipython_only(option):
     help="The location to write the perf data. If this is '-' the perf will"
     " be written to stdout.",
 )
+@click.option(
+    '--stream-results',
+    default=None,
+    metavar='DIRECTORY',
+    type=click.Path(file_okay=False, writable=True),
+    help='Write the perf data to DIRECTORY as the simulation runs instead of'
+    ' keeping it in memory. The perf frame is reassembled from DIRECTORY if'
+    ' it is also written to --output.',
+)
+@click.option(
+    '--checkpoint',
+    default=None,
+    metavar='FILENAME',
+    type=click.Path(dir_okay=False, writable=True),
+    help='Periodically write the state of the simulation to FILENAME.',
+)
+@click.option(
+    '--checkpoint-frequency',
+    default=21,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help='The number of sessions between checkpoints.',
+)
+@click.option(
+    '--resume/--no-resume',
+    is_flag=True,
+    default=False,
+    help='Continue the simulation from --checkpoint if it exists. The'
+    ' algorithm and the other arguments must be the same as the ones of the'
+    ' interrupted run.',
+)
 @click.option(
     '--print-algo/--no-print-algo',
     is_flag=True,
@@ -196,6 +255,10 @@ def run(ctx,
         start,
         end,
         output,
+        stream_results,
+        checkpoint,
+        checkpoint_frequency,
+        resume,
         print_algo,
         local_namespace):
     """Run a backtest for the given algorithm.
@@ -219,6 +282,9 @@ def run(ctx,
             " '-t' / '--algotext'",
         )
 
+    if resume and checkpoint is None:
+        ctx.fail("must specify '--checkpoint' to use '--resume'")
+
     perf = _run(
         initialize=None,
         handle_data=None,
@@ -238,10 +304,16 @@ def run(ctx,
         print_algo=print_algo,
         local_namespace=local_namespace,
         environ=os.environ,
+        stream_results=stream_results,
+        checkpoint=checkpoint,
+        checkpoint_frequency=checkpoint_frequency,
+        resume=resume,
     )
 
     if output == '-':
-        click.echo(str(perf))
+        click.echo(
+            perf.summary() if isinstance(perf, StreamedResults) else str(perf),
+        )
     elif output != os.devnull:  # make the zipline magic not write any data
         perf.to_pickle(output)
 
@@ -28,6 +28,7 @@ from numbers import Integral
 
 from six import (
     exec_,
+    get_unbound_function,
     iteritems,
     itervalues,
     string_types,
@@ -40,6 +41,7 @@ from zipline.data.data_portal import DataPortal
 from zipline.data.us_equity_pricing import PanelBarReader
 from zipline.errors import (
     AttachPipelineAfterInitialize,
+    DuplicatePipelineName,
     HistoryInInitialize,
     NoSuchPipeline,
     OrderDuringInitialize,
@@ -67,6 +69,7 @@ from zipline.finance.controls import (
     MaxOrderSize,
     MaxPositionSize,
     MaxLeverage,
+    OrderBatch,
     RestrictedListOrder
 )
 from zipline.finance.execution import (
@@ -75,13 +78,17 @@ from zipline.finance.execution import (
     StopLimitOrder,
     StopOrder,
 )
-from zipline.finance.performance import PerformanceTracker
+from zipline.finance.performance import (
+    DailyStatsRecorder,
+    PerformanceTracker,
+)
 from zipline.finance.slippage import (
     VolumeShareSlippage,
     SlippageModel
 )
 from zipline.finance.cancel_policy import NeverCancel, CancelPolicy
 from zipline.assets import Asset, Future
+from zipline.gens.checkpoint import Checkpoint
 from zipline.gens.tradesimulation import AlgorithmSimulator
 from zipline.pipeline import Pipeline
 from zipline.pipeline.engine import (
@@ -124,7 +131,10 @@ from zipline.utils.preprocess import preprocess
 import zipline.protocol
 from zipline.sources.requests_csv import PandasRequestsCSV
 
-from zipline.gens.sim_engine import MinuteSimulationClock
+from zipline.gens.sim_engine import (
+    MinuteSimulationClock,
+    SparseMinuteSimulationClock,
+)
 from zipline.sources.benchmark_source import BenchmarkSource
 from zipline.zipline_warnings import ZiplineDeprecationWarning
 
@@ -190,6 +200,10 @@ class TradingAlgorithm(object):
         equities_metadata, but will be traded by this TradingAlgorithm.
     get_pipeline_loader : callable[BoundColumn -> PipelineLoader], optional
         The function that maps pipeline columns to their loaders.
+    pipeline_engine : PipelineEngine, optional
+        The engine to compute pipelines with. This can be used to share one
+        engine between many algorithms. This is mutually exclusive with
+        ``get_pipeline_loader``.
     create_event_context : callable[BarData -> context manager], optional
         A function used to create a context mananger that wraps the
         execution of all events that are scheduled for a bar.
@@ -202,6 +216,19 @@ class TradingAlgorithm(object):
         in the simulation with ``get_environment``. This allows algorithms
         to conditionally execute code based on platform it is running on.
         default: 'zipline'
+    metrics_only : bool, optional
+        Don't include the positions, transactions and orders of each period
+        in the performance packets or in the results of ``run``. This makes
+        long simulations faster when only the returns and risk metrics are
+        needed. default: False
+    sparse_clock : bool, optional
+        In minute simulations, skip the minutes at which the algorithm has
+        nothing to do: only the minutes at which scheduled functions run, the
+        minutes at which the algorithm has open orders and the last minute of
+        each session are simulated. This only has an effect when the
+        algorithm has no ``handle_data``, no account controls and no events
+        whose rules can't be precomputed, and the emission rate is daily.
+        default: False
     """
 
     def __init__(self, *args, **kwargs):
@@ -303,11 +330,28 @@ class TradingAlgorithm(object):
         self.asset_finder = self.trading_environment.asset_finder
 
         # Initialize Pipeline API data.
-        self.init_engine(kwargs.pop('get_pipeline_loader', None))
+        engine = kwargs.pop('pipeline_engine', None)
+        get_loader = kwargs.pop('get_pipeline_loader', None)
+        if engine is None:
+            self.init_engine(get_loader)
+        elif get_loader is not None:
+            raise ValueError(
+                "TradingAlgorithm received both a pipeline_engine and a"
+                " get_pipeline_loader function."
+            )
+        else:
+            self.engine = engine
+        # Map from pipeline name to (pipeline, iterator of chunksizes).  The
+        # chunksize iterator is None for incrementally-computed pipelines.
         self._pipelines = {}
         # Create an always-expired cache so that we compute the first time data
-        # is requested.
+        # is requested.  The cached value is a dict mapping pipeline name to
+        # results for every pipeline that isn't computed incrementally.
         self._pipeline_cache = CachedObject(None, pd.Timestamp(0, tz='UTC'))
+        # Map from pipeline name to (iterator of (date, output) pairs,
+        # most recent (date, output) pair) for incrementally-computed
+        # pipelines.
+        self._incremental_pipelines = {}
 
         self.blotter = kwargs.pop('blotter', None)
         self.cancel_policy = kwargs.pop('cancel_policy', NeverCancel())
@@ -373,7 +417,7 @@ class TradingAlgorithm(object):
             exec_(code, self.namespace)
 
             self._initialize = self.namespace.get('initialize', noop)
-            self._handle_data = self.namespace.get('handle_data', noop)
+            self._handle_data = self.namespace.get('handle_data')
             self._before_trading_start = self.namespace.get(
                 'before_trading_start',
             )
@@ -382,22 +426,20 @@ class TradingAlgorithm(object):
 
         else:
             self._initialize = kwargs.pop('initialize', noop)
-            self._handle_data = kwargs.pop('handle_data', noop)
+            self._handle_data = kwargs.pop('handle_data', None)
             self._before_trading_start = kwargs.pop(
                 'before_trading_start',
                 None,
             )
             self._analyze = kwargs.pop('analyze', None)
 
-        self.event_manager.add_event(
-            zipline.utils.events.Event(
-                zipline.utils.events.Always(),
-                # We pass handle_data.__func__ to get the unbound method.
-                # We will explicitly pass the algorithm to bind it again.
-                self.handle_data.__func__,
-            ),
-            prepend=True,
+        self._handle_data_event = zipline.utils.events.Event(
+            zipline.utils.events.Always(),
+            # We pass handle_data.__func__ to get the unbound method.
+            # We will explicitly pass the algorithm to bind it again.
+            self.handle_data.__func__,
         )
+        self.event_manager.add_event(self._handle_data_event, prepend=True)
 
         # Alternative way of setting data_frequency for backwards
         # compatibility.
@@ -411,6 +453,9 @@ class TradingAlgorithm(object):
 
         self.benchmark_sid = kwargs.pop('benchmark_sid', None)
 
+        self.metrics_only = kwargs.pop('metrics_only', False)
+        self._sparse_clock = kwargs.pop('sparse_clock', False)
+
         # A dictionary of capital changes, keyed by timestamp, indicating the
         # target/delta of the capital changes, along with values
         self.capital_changes = kwargs.pop('capital_changes', {})
@@ -418,6 +463,10 @@ class TradingAlgorithm(object):
         # A dictionary of the actual capital change deltas, keyed by timestamp
         self.capital_change_deltas = {}
 
+        # The checkpoint being resumed from, if any.
+        self._resume_path = None
+        self._checkpoint = None
+
     def init_engine(self, get_loader):
         """
         Construct and store a PipelineEngine from loader.
@@ -495,12 +544,19 @@ class TradingAlgorithm(object):
                    blotter=repr(self.blotter),
                    recorded_vars=repr(self.recorded_vars))
 
+    def _clock_sessions(self):
+        sessions = self.sim_params.sessions
+        if self._checkpoint is not None:
+            # Only simulate the sessions after the checkpoint.
+            sessions = sessions[sessions > self._checkpoint.session]
+        return sessions
+
     def _create_clock(self):
         """
         If the clock property is not set, then create one based on frequency.
         """
-        trading_o_and_c = self.trading_calendar.schedule.ix[
-            self.sim_params.sessions]
+        sessions = self._clock_sessions()
+        trading_o_and_c = self.trading_calendar.schedule.ix[sessions]
         market_closes = trading_o_and_c['market_close']
         minutely_emission = False
 
@@ -515,19 +571,59 @@ class TradingAlgorithm(object):
 
         # FIXME generalize these values
         before_trading_start_minutes = days_at_time(
-            self.sim_params.sessions,
+            sessions,
             time(8, 45),
             "US/Eastern"
         )
 
+        if (self._sparse_clock and
+                self.sim_params.data_frequency == 'minute' and
+                not minutely_emission):
+            trigger_minutes = self._sparse_clock_triggers()
+            if trigger_minutes is not None:
+                return SparseMinuteSimulationClock(
+                    sessions,
+                    market_opens,
+                    market_closes,
+                    before_trading_start_minutes,
+                    trigger_minutes,
+                    self._has_open_orders,
+                )
+
         return MinuteSimulationClock(
-            self.sim_params.sessions,
+            sessions,
             market_opens,
             market_closes,
             before_trading_start_minutes,
             minute_emission=minutely_emission,
         )
 
+    def _sparse_clock_triggers(self):
+        """
+        Get the minutes at which the algorithm has work to do regardless of
+        its open orders, or None if it may have work to do at any minute.
+        """
+        handle_data_is_noop = (
+            self._handle_data is None and
+            not self.account_controls and
+            self.handle_data.__func__ is
+            get_unbound_function(TradingAlgorithm.handle_data)
+        )
+        event_minutes = self.event_manager.trigger_minutes(
+            ignore=[self._handle_data_event] if handle_data_is_noop else [],
+        )
+        if event_minutes is None:
+            return None
+
+        capital_change_minutes = np.array(
+            [pd.Timestamp(dt).value for dt in self.capital_changes],
+            dtype=np.int64,
+        )
+        return np.union1d(event_minutes, capital_change_minutes)
+
+    def _has_open_orders(self):
+        return bool(self.blotter.open_orders)
+
     def _create_benchmark_source(self):
         return BenchmarkSource(
             benchmark_sid=self.benchmark_sid,
@@ -539,6 +635,13 @@ class TradingAlgorithm(object):
         )
 
     def _create_generator(self, sim_params):
+        return self._create_simulator(sim_params).transform()
+
+    def _create_simulator(self, sim_params):
+        """
+        Set up the performance tracker, call ``initialize`` and create the
+        AlgorithmSimulator that will run the algorithm.
+        """
         if sim_params is not None:
             self.sim_params = sim_params
 
@@ -549,15 +652,28 @@ class TradingAlgorithm(object):
                 sim_params=self.sim_params,
                 trading_calendar=self.trading_calendar,
                 env=self.trading_environment,
+                metrics_only=self.metrics_only,
             )
 
             # Set the dt initially to the period start by forcing it to change.
             self.on_dt_changed(self.sim_params.start_session)
 
         if not self.initialized:
+            # Everything that is set on the algorithm from here on, other than
+            # the attributes below, is part of the user's context.
+            self._internal_attributes = frozenset(vars(self)) | {
+                '_internal_attributes',
+                'risk_report',
+                'trading_client',
+            }
             self.initialize(*self.initialize_args, **self.initialize_kwargs)
             self.initialized = True
 
+        if self._checkpoint is not None:
+            self._checkpoint.restore(self)
+
+        self._compile_events()
+
         self.trading_client = AlgorithmSimulator(
             self,
             sim_params,
@@ -566,8 +682,25 @@ class TradingAlgorithm(object):
             self._create_benchmark_source(),
             universe_func=self._calculate_universe
         )
+        return self.trading_client
+
+    def _compile_events(self):
+        """
+        Precompute the bars at which the scheduled functions are called.
+        """
+        sessions = self._clock_sessions()
+        if not len(sessions):
+            return
 
-        return self.trading_client.transform()
+        if self.sim_params.data_frequency == 'minute':
+            bars = self.trading_calendar.minutes_for_sessions_in_range(
+                sessions[0],
+                sessions[-1],
+            )
+        else:
+            # In daily mode there is one bar per session, at the close.
+            bars = self.trading_calendar.schedule.market_close.loc[sessions]
+        self.event_manager.compile(bars.values.astype(np.int64))
 
     def _calculate_universe(self):
         # this exists to provide backwards compatibility for older,
@@ -585,16 +718,66 @@ class TradingAlgorithm(object):
         """
         return self._create_generator(self.sim_params)
 
-    def run(self, data=None, overwrite_sim_params=True):
+    def run(self,
+            data=None,
+            overwrite_sim_params=True,
+            results_sink=None,
+            checkpoints=None):
         """Run the algorithm.
 
         :Arguments:
             source : DataPortal
+            results_sink : StreamingResultsWriter, optional
+              Write the daily performance to disk as the simulation runs
+              instead of keeping it in memory.
+            checkpoints : CheckpointWriter, optional
+              Periodically write the state of the simulation to disk so that
+              it can be continued with ``resume`` if it is interrupted.
 
         :Returns:
-            daily_stats : pandas.DataFrame
-              Daily performance metrics such as returns, alpha etc.
+            daily_stats : pandas.DataFrame or StreamedResults
+              Daily performance metrics such as returns, alpha etc. If
+              ``results_sink`` is passed, a reader for the written results
+              is returned instead, and is also what ``analyze`` receives.
 
+        """
+        self._prepare_data(data, overwrite_sim_params)
+
+        # Force a reset of the performance tracker, in case
+        # this is a repeat run of the algorithm.
+        self.perf_tracker = None
+
+        # Create zipline and loop through simulated_trading.
+        # Each iteration returns a perf dictionary
+        try:
+            if self._resume_path is not None:
+                self._checkpoint = Checkpoint.read(self._resume_path, self)
+                # The results are recorded wherever the interrupted
+                # simulation was recording them.
+                recorder = self._checkpoint.recorder
+            elif results_sink is not None:
+                recorder = results_sink
+            else:
+                recorder = DailyStatsRecorder(
+                    len(self.sim_params.sessions),
+                    metrics_only=self.metrics_only,
+                )
+            for perf in self.get_generator():
+                recorder.record(perf)
+                if checkpoints is not None:
+                    checkpoints.record(self, perf, recorder)
+
+            daily_stats = self._finish_run(recorder)
+        finally:
+            self.data_portal = None
+            self._checkpoint = None
+
+        return daily_stats
+
+    def _prepare_data(self, data, overwrite_sim_params):
+        """
+        Set up the data portal and the universe from the ``data`` passed to
+        ``run``.
         """
         self._assets_from_source = []
 
@@ -676,25 +859,57 @@ class TradingAlgorithm(object):
                     **{equity_reader_arg: equity_reader}
                 )
 
-        # Force a reset of the performance tracker, in case
-        # this is a repeat run of the algorithm.
-        self.perf_tracker = None
+    def _finish_run(self, recorder):
+        """
+        Build the results of ``run`` from the recorded packets and call
+        ``analyze``.
+        """
+        self.risk_report = recorder.risk_report
+        if isinstance(recorder, DailyStatsRecorder):
+            daily_stats = recorder.to_frame()
+        else:
+            daily_stats = recorder.close()
 
-        # Create zipline and loop through simulated_trading.
-        # Each iteration returns a perf dictionary
-        try:
-            perfs = []
-            for perf in self.get_generator():
-                perfs.append(perf)
+        self.analyze(daily_stats)
+        return daily_stats
 
-            # convert perf dict to pandas dataframe
-            daily_stats = self._create_daily_stats(perfs)
+    def resume(self,
+               checkpoint,
+               data=None,
+               overwrite_sim_params=True,
+               checkpoints=None):
+        """Continue a simulation from a checkpoint.
 
-            self.analyze(daily_stats)
-        finally:
-            self.data_portal = None
+        The algorithm must be constructed and passed ``data`` the same way as
+        the algorithm that wrote the checkpoint. ``initialize`` is called
+        again, then the blotter, the performance tracker, the recorded
+        variables and the context are restored and the simulation continues
+        with the session after the checkpoint.
 
-        return daily_stats
+        :Arguments:
+            checkpoint : str
+              The path of a checkpoint written by a ``CheckpointWriter``.
+            source : DataPortal
+            checkpoints : CheckpointWriter, optional
+              Keep writing checkpoints as the simulation continues.
+
+        :Returns:
+            daily_stats : pandas.DataFrame or StreamedResults
+              The results of the whole simulation, including the sessions
+              before the checkpoint. If the interrupted simulation was
+              writing its results to a ``results_sink``, the rest of the
+              results are written there too and a reader is returned.
+
+        """
+        self._resume_path = checkpoint
+        try:
+            return self.run(
+                data,
+                overwrite_sim_params=overwrite_sim_params,
+                checkpoints=checkpoints,
+            )
+        finally:
+            self._resume_path = None
 
     def _write_and_map_id_index_to_sids(self, identifiers, as_of_date):
         # Build new Assets for identifiers that can't be resolved as
@@ -803,27 +1018,15 @@ class TradingAlgorithm(object):
 
     def _create_daily_stats(self, perfs):
         # create daily and cumulative stats dataframe
-        daily_perfs = []
-        # TODO: the loop here could overwrite expected properties
-        # of daily_perf. Could potentially raise or log a
+        # TODO: recorded variables and risk metrics could overwrite expected
+        # properties of daily_perf. Could potentially raise or log a
         # warning.
+        recorder = DailyStatsRecorder(len(perfs))
         for perf in perfs:
-            if 'daily_perf' in perf:
-
-                perf['daily_perf'].update(
-                    perf['daily_perf'].pop('recorded_vars')
-                )
-                perf['daily_perf'].update(perf['cumulative_risk_metrics'])
-                daily_perfs.append(perf['daily_perf'])
-            else:
-                self.risk_report = perf
-
-        daily_dts = pd.DatetimeIndex(
-            [p['period_close'] for p in daily_perfs], tz='UTC'
-        )
-        daily_stats = pd.DataFrame(daily_perfs, index=daily_dts)
+            recorder.record(perf)
 
-        return daily_stats
+        self.risk_report = recorder.risk_report
+        return recorder.to_frame()
 
     def calculate_capital_changes(self, dt, emission_rate, is_interday,
                                   portfolio_value_adjustment=0.0):
@@ -1913,6 +2116,227 @@ class TradingAlgorithm(object):
                                        stop_price=stop_price,
                                        style=style)
 
+    def _orderable_batch(self, values):
+        """
+        Split a mapping from assets to numbers into the list of assets that
+        can be ordered and an array of their values.
+        """
+        assets = []
+        orderable_values = []
+        for asset, value in iteritems(values):
+            if self._can_order_asset(asset):
+                assets.append(asset)
+                orderable_values.append(value)
+        return assets, np.array(orderable_values, dtype=np.float64)
+
+    def _calculate_order_value_amounts(self, assets, values):
+        """
+        Vectorized version of ``_calculate_order_value_amount``.
+
+        The prices of every asset are read with a single call to the data
+        portal.
+        """
+        if not assets:
+            return np.empty(0, dtype=np.float64)
+
+        normalized_date = normalize_date(self.datetime)
+        for asset in assets:
+            if normalized_date < asset.start_date:
+                raise CannotOrderDelistedAsset(
+                    msg="Cannot order {0}, as it started trading on"
+                        " {1}.".format(asset.symbol, asset.start_date)
+                )
+            elif normalized_date > asset.end_date:
+                raise CannotOrderDelistedAsset(
+                    msg="Cannot order {0}, as it stopped trading on"
+                        " {1}.".format(asset.symbol, asset.end_date)
+                )
+
+        last_prices = np.asarray(
+            self.trading_client.current_data.current(assets, "price"),
+            dtype=np.float64,
+        )
+        missing = np.isnan(last_prices)
+        if missing.any():
+            asset = assets[np.flatnonzero(missing)[0]]
+            raise CannotOrderDelistedAsset(
+                msg="Cannot order {0} on {1} as there is no last "
+                    "price for the security.".format(asset.symbol,
+                                                     self.datetime)
+            )
+
+        value_multipliers = np.array(
+            [
+                asset.multiplier if isinstance(asset, Future) else 1
+                for asset in assets
+            ],
+            dtype=np.float64,
+        )
+
+        # Same tolerance as ``tolerant_equals``.
+        zero_prices = np.isclose(last_prices, 0, rtol=10e-7, atol=10e-7)
+        if self.logger:
+            for asset in np.asarray(assets, dtype=object)[zero_prices]:
+                self.logger.debug(
+                    "Price of 0 for {psid}; can't infer value".format(
+                        psid=asset,
+                    )
+                )
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            amounts = values / (last_prices * value_multipliers)
+        # Don't place any order for assets with a price of 0.
+        amounts[zero_prices] = 0
+        return amounts
+
+    def _place_batch(self, assets, amounts, style, method_name):
+        """
+        Validate a batch of orders against every trading control and then
+        place all of them at once.
+
+        Returns
+        -------
+        order_ids : dict[Asset -> str or None]
+        """
+        if not self.initialized:
+            raise OrderDuringInitialize(
+                msg="{0}() can only be called from within"
+                    " handle_data()".format(method_name)
+            )
+
+        # See ``order`` for the rounding rules.
+        amounts = [int(round_if_near_integer(amount)) for amount in amounts]
+
+        # Every order is validated before any of them is placed so that a
+        # control violation can't leave a partially placed batch.
+        if assets and self.trading_controls:
+            portfolio = self.updated_portfolio()
+            positions = portfolio.positions
+            current_data = self.trading_client.current_data
+            batch = OrderBatch(
+                assets,
+                amounts,
+                current_data.current(assets, "price"),
+                [
+                    positions[asset].amount if asset in positions else 0
+                    for asset in assets
+                ],
+            )
+            dt = self.get_datetime()
+            for control in self.trading_controls:
+                control.validate_batch(batch, portfolio, dt, current_data)
+
+        style = self.__convert_order_params_for_blotter(None, None, style)
+        order_ids = self.blotter.batch_order(
+            [(asset, amount, style) for asset, amount in zip(assets, amounts)]
+        )
+        return dict(zip(assets, order_ids))
+
+    @api_method
+    @disallowed_in_before_trading_start(OrderInBeforeTradingStart())
+    def order_batch(self, amounts, style=None):
+        """Place an order for each of many assets at once.
+
+        Parameters
+        ----------
+        amounts : dict[Asset -> int] or pd.Series
+            The number of shares to order of each asset. See
+            :func:`zipline.api.order` for the meaning of the sign of each
+            amount.
+        style : ExecutionStyle, optional
+            The execution style for every order.
+
+        Returns
+        -------
+        order_ids : dict[Asset -> str]
+            The unique identifier of the order placed for each asset. Assets
+            for which no order was placed are mapped to None.
+
+        Notes
+        -----
+        This is equivalent to calling :func:`zipline.api.order` for each
+        asset, except that every order is checked against the trading
+        controls before any of them is placed.
+
+        See Also
+        --------
+        :class:`zipline.finance.execution.ExecutionStyle`
+        :func:`zipline.api.order`
+        :func:`zipline.api.order_target_percents`
+        """
+        order_ids = dict.fromkeys(asset for asset, _ in iteritems(amounts))
+        assets, values = self._orderable_batch(amounts)
+        order_ids.update(
+            self._place_batch(assets, values, style, 'order_batch'),
+        )
+        return order_ids
+
+    @api_method
+    @disallowed_in_before_trading_start(OrderInBeforeTradingStart())
+    def order_target_percents(self, targets, style=None):
+        """Place orders to adjust many positions to target percents of the
+        current portfolio value at once.
+
+        Parameters
+        ----------
+        targets : dict[Asset -> float] or pd.Series
+            The desired percentage of the portfolio value to allocate to each
+            asset. This is specified as a decimal, for example: 0.50 means
+            50%.
+        style : ExecutionStyle, optional
+            The execution style for every order.
+
+        Returns
+        -------
+        order_ids : dict[Asset -> str]
+            The unique identifier of the order placed for each asset. Assets
+            for which no order was placed, for example because they are
+            already at their target, are mapped to None.
+
+        Notes
+        -----
+        This is equivalent to calling :func:`zipline.api.order_target_percent`
+        for each asset, except that the prices of the assets are read once for
+        the whole batch and that every order is checked against the trading
+        controls before any of them is placed. Like
+        ``order_target_percent``, this does not take into account any open
+        orders.
+
+        Assets that are not in ``targets`` are left alone; to close a
+        position, give it a target of 0.
+
+        See Also
+        --------
+        :class:`zipline.finance.execution.ExecutionStyle`
+        :func:`zipline.api.order_batch`
+        :func:`zipline.api.order_target_percent`
+        """
+        order_ids = dict.fromkeys(asset for asset, _ in iteritems(targets))
+        assets, percents = self._orderable_batch(targets)
+
+        target_amounts = self._calculate_order_value_amounts(
+            assets,
+            percents * self.portfolio.portfolio_value,
+        )
+        positions = self.portfolio.positions
+        current_amounts = np.array(
+            [
+                positions[asset].amount if asset in positions else 0
+                for asset in assets
+            ],
+            dtype=np.float64,
+        )
+
+        order_ids.update(
+            self._place_batch(
+                assets,
+                target_amounts - current_amounts,
+                style,
+                'order_target_percents',
+            ),
+        )
+        return order_ids
+
     @error_keywords(sid='Keyword argument `sid` is no longer supported for '
                         'get_open_orders. Use `asset` instead.')
     @api_method
@@ -2178,8 +2602,10 @@ class TradingAlgorithm(object):
         pipeline=Pipeline,
         name=string_types,
         chunksize=optional(int),
+        incremental=bool,
     )
-    def attach_pipeline(self, pipeline, name, chunksize=None):
+    def attach_pipeline(self, pipeline, name, chunksize=None,
+                        incremental=False):
         """Register a pipeline to be computed at the start of each day.
 
         Parameters
@@ -2191,20 +2617,47 @@ class TradingAlgorithm(object):
         chunksize : int, optional
             The number of days to compute pipeline results for. Increasing
             this number will make it longer to get the first results but
-            may improve the total runtime of the simulation.
+            may improve the total runtime of the simulation. If multiple
+            pipelines are attached, they are computed together using the
+            smallest chunksize.
+        incremental : bool, optional
+            Whether to compute the pipeline one day at a time. Inputs are
+            still loaded ``chunksize`` days at a time, but each day only
+            computes that day's results, which keeps the time spent computing
+            the pipeline roughly constant from day to day. default: False
 
         Returns
         -------
         pipeline : Pipeline
             Returns the pipeline that was attached unchanged.
 
+        Notes
+        -----
+        Multiple pipelines may be attached. Pipelines that aren't computed
+        incrementally are computed together, so terms that are shared between
+        them are only loaded and computed once.
+
         See Also
         --------
         :func:`zipline.api.pipeline_output`
         """
-        if self._pipelines:
-            raise NotImplementedError("Multiple pipelines are not supported.")
-        if chunksize is None:
+        if name in self._pipelines:
+            raise DuplicatePipelineName(name=name)
+        if incremental:
+            # Inputs are loaded lazily, so there's no need for a small first
+            # chunk.
+            outputs = self.engine.iter_pipeline(
+                pipeline,
+                self.sim_params.start_session,
+                self.sim_params.end_session,
+                chunksize=126 if chunksize is None else int(chunksize),
+            )
+            self._incremental_pipelines[name] = (
+                outputs,
+                (pd.Timestamp(0, tz='UTC'), None),
+            )
+            chunks = None
+        elif chunksize is None:
             # Make the first chunk smaller to get more immediate results:
             # (one week, then every half year)
             chunks = iter(chain([5], repeat(126)))
@@ -2243,18 +2696,16 @@ class TradingAlgorithm(object):
         :func:`zipline.api.attach_pipeline`
         :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
         """
-        # NOTE: We don't currently support multiple pipelines, but we plan to
-        # in the future.
-        try:
-            p, chunks = self._pipelines[name]
-        except KeyError:
+        if name not in self._pipelines:
             raise NoSuchPipeline(
                 name=name,
                 valid=list(self._pipelines.keys()),
             )
-        return self._pipeline_output(p, chunks)
+        if name in self._incremental_pipelines:
+            return self._incremental_pipeline_output(name)
+        return self._pipeline_output(name)
 
-    def _pipeline_output(self, pipeline, chunks):
+    def _pipeline_output(self, name):
         """
         Internal implementation of `pipeline_output`.
         """
@@ -2262,36 +2713,66 @@ class TradingAlgorithm(object):
         try:
             data = self._pipeline_cache.unwrap(today)
         except Expired:
-            data, valid_until = self._run_pipeline(
-                pipeline, today, next(chunks),
+            # Compute every attached pipeline together so that shared terms
+            # are only computed once.
+            pipelines = {}
+            chunksizes = []
+            for pipeline_name, entry in iteritems(self._pipelines):
+                pipeline, chunks = entry
+                if chunks is not None:
+                    pipelines[pipeline_name] = pipeline
+                    chunksizes.append(next(chunks))
+
+            data, valid_until = self._run_pipelines(
+                pipelines, today, min(chunksizes),
             )
             self._pipeline_cache = CachedObject(data, valid_until)
 
+        data = data[name]
+
         # Now that we have a cached result, try to return the data for today.
+        # Results are stored column-wise, so this only builds a frame for the
+        # assets that passed the screen today.
         try:
-            return data.loc[today]
+            return data.frame_for(today)
         except KeyError:
-            # This happens if no assets passed the pipeline screen on a given
-            # day.
+            # This happens if today isn't one of the computed sessions.
             return pd.DataFrame(index=[], columns=data.columns)
 
-    def _run_pipeline(self, pipeline, start_session, chunksize):
+    def _incremental_pipeline_output(self, name):
+        """
+        Internal implementation of `pipeline_output` for pipelines attached
+        with ``incremental=True``.
         """
-        Compute `pipeline`, providing values for at least `start_date`.
+        today = normalize_date(self.get_datetime())
+        outputs, (date, data) = self._incremental_pipelines[name]
 
-        Produces a DataFrame containing data for days between `start_date` and
-        `end_date`, where `end_date` is defined by:
+        # Advance through any days on which the output wasn't requested.  The
+        # engine computes each day from the previous one, so we can't skip
+        # them.
+        while date < today:
+            date, data = next(outputs)
+
+        self._incremental_pipelines[name] = outputs, (date, data)
+        return data
+
+    def _run_pipelines(self, pipelines, start_session, chunksize):
+        """
+        Compute `pipelines`, providing values for at least `start_date`.
+
+        Produces a PipelineResult for each pipeline containing data for days
+        between `start_date` and `end_date`, where `end_date` is defined by:
 
             `end_date = min(start_date + chunksize trading days,
                             simulation_end)`
 
         Returns
         -------
-        (data, valid_until) : tuple (pd.DataFrame, pd.Timestamp)
+        (data, valid_until) : tuple (dict[str -> PipelineResult], pd.Timestamp)
 
         See Also
         --------
-        PipelineEngine.run_pipeline
+        SimplePipelineEngine.run_pipelines
         """
         sessions = self.trading_calendar.all_sessions
 
@@ -2309,9 +2790,13 @@ class TradingAlgorithm(object):
 
         end_session = sessions[end_loc]
 
-        return \
-            self.engine.run_pipeline(pipeline, start_session, end_session), \
-            end_session
+        data = self.engine.run_pipelines(
+            pipelines,
+            start_session,
+            end_session,
+            columnar=True,
+        )
+        return data, end_session
 
     ##################
     # End Pipeline API
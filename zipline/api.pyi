@@ -6,7 +6,7 @@ from zipline.protocol import Order
 from zipline.utils.events import EventRule
 
 
-def attach_pipeline(pipeline, name, chunksize=None):
+def attach_pipeline(pipeline, name, chunksize=None, incremental=False):
     """Register a pipeline to be computed at the start of each day.
 
     Parameters
@@ -19,6 +19,11 @@ def attach_pipeline(pipeline, name, chunksize=None):
         The number of days to compute pipeline results for. Increasing
         this number will make it longer to get the first results but
         may improve the total runtime of the simulation.
+    incremental : bool, optional
+        Whether to compute the pipeline one day at a time. Inputs are
+        still loaded ``chunksize`` days at a time, but each day only
+        computes that day's results, which keeps the time spent computing
+        the pipeline roughly constant from day to day. default: False
 
     Returns
     -------
@@ -241,6 +246,37 @@ def order(asset, amount, limit_price=None, stop_price=None, style=None):
     :func:`zipline.api.order_percent`
     """
 
+def order_batch(amounts, style=None):
+    """Place an order for each of many assets at once.
+
+    Parameters
+    ----------
+    amounts : dict[Asset -> int] or pd.Series
+        The number of shares to order of each asset. See
+        :func:`zipline.api.order` for the meaning of the sign of each
+        amount.
+    style : ExecutionStyle, optional
+        The execution style for every order.
+
+    Returns
+    -------
+    order_ids : dict[Asset -> str]
+        The unique identifier of the order placed for each asset. Assets
+        for which no order was placed are mapped to None.
+
+    Notes
+    -----
+    This is equivalent to calling :func:`zipline.api.order` for each
+    asset, except that every order is checked against the trading
+    controls before any of them is placed.
+
+    See Also
+    --------
+    :class:`zipline.finance.execution.ExecutionStyle`
+    :func:`zipline.api.order`
+    :func:`zipline.api.order_target_percents`
+    """
+
 def order_percent(asset, percent, limit_price=None, stop_price=None, style=None):
     """Place an order in the specified asset corresponding to the given
     percent of the current portfolio value.
@@ -379,6 +415,45 @@ def order_target_percent(asset, target, limit_price=None, stop_price=None, style
     :func:`zipline.api.order_target_value`
     """
 
+def order_target_percents(targets, style=None):
+    """Place orders to adjust many positions to target percents of the
+    current portfolio value at once.
+
+    Parameters
+    ----------
+    targets : dict[Asset -> float] or pd.Series
+        The desired percentage of the portfolio value to allocate to each
+        asset. This is specified as a decimal, for example: 0.50 means
+        50%.
+    style : ExecutionStyle, optional
+        The execution style for every order.
+
+    Returns
+    -------
+    order_ids : dict[Asset -> str]
+        The unique identifier of the order placed for each asset. Assets
+        for which no order was placed, for example because they are
+        already at their target, are mapped to None.
+
+    Notes
+    -----
+    This is equivalent to calling :func:`zipline.api.order_target_percent`
+    for each asset, except that the prices of the assets are read once for
+    the whole batch and that every order is checked against the trading
+    controls before any of them is placed. Like
+    ``order_target_percent``, this does not take into account any open
+    orders.
+
+    Assets that are not in ``targets`` are left alone; to close a
+    position, give it a target of 0.
+
+    See Also
+    --------
+    :class:`zipline.finance.execution.ExecutionStyle`
+    :func:`zipline.api.order_batch`
+    :func:`zipline.api.order_target_percent`
+    """
+
 def order_target_value(asset, target, limit_price=None, stop_price=None, style=None):
     """Place an order to adjust a position to a target value. If
     the position doesn't already exist, this is equivalent to placing a new
@@ -18,18 +18,25 @@ from cpython cimport (
 )
 
 from numpy import (
+    float64,
+    full,
     int64,
+    uint8,
     uint32,
     zeros,
 )
-from numpy cimport int64_t, ndarray
+from numpy cimport float64_t, int64_t, ndarray
 from pandas import Timestamp
 
 ctypedef object Timestamp_t
 ctypedef object DatetimeIndex_t
 ctypedef object Int64Index_t
 
-from zipline.lib.adjustment import Float64Multiply
+from zipline.lib.adjustment import (
+    Float64AdjustmentTable,
+    Float64Multiply,
+    MULTIPLY,
+)
 from zipline.assets.asset_writer import (
     SQLITE_MAX_VARIABLE_NUMBER as SQLITE_MAX_IN_STATEMENT,
 )
@@ -149,7 +156,8 @@ cdef _adjustments(object adjustments_db,
 cpdef load_adjustments_from_sqlite(object adjustments_db,  # sqlite3.Connection
                                    list columns,
                                    DatetimeIndex_t dates,
-                                   Int64Index_t assets):
+                                   Int64Index_t assets,
+                                   bint packed=False):
     """
     Load a dictionary of Adjustment objects from adjustments_db
 
@@ -164,12 +172,15 @@ cpdef load_adjustments_from_sqlite(object adjustments_db,  # sqlite3.Connection
         Dates for which adjustments are needed
     assets : pd.Int64Index
         Assets for which adjustments are needed.
+    packed : bool, optional
+        If True, return a Float64AdjustmentTable for each column instead of a
+        dict of Adjustment objects.
 
     Returns
     -------
-    adjustments : list[dict[int -> Adjustment]]
+    adjustments : list[dict[int -> Adjustment]] or list[Float64AdjustmentTable]
         A list of mappings from index to adjustment objects to apply at that
-        index.
+        index, or a list of adjustment tables if ``packed`` is True.
     """
 
     cdef int start_date = timedelta_to_integral_seconds(dates[0] - EPOCH)
@@ -203,7 +214,6 @@ cpdef load_adjustments_from_sqlite(object adjustments_db,  # sqlite3.Connection
         assets,
     )
 
-    cdef list results = [{} for column in columns]
     cdef dict asset_ixs = {}  # Cache sid lookups here.
     cdef dict date_ixs = {}
     cdef:
@@ -214,7 +224,10 @@ cpdef load_adjustments_from_sqlite(object adjustments_db,  # sqlite3.Connection
         int eff_date
         int date_loc
         Py_ssize_t asset_ix
-        dict col_adjustments
+        # (date_loc, asset_ix, ratio) for each adjustment to apply.
+        list price_records = []
+        list volume_records = []
+        list table
 
     cdef ndarray[int64_t, ndim=1] _dates_seconds = \
         dates.values.astype('datetime64[s]').view(int64)
@@ -223,75 +236,85 @@ cpdef load_adjustments_from_sqlite(object adjustments_db,  # sqlite3.Connection
     for i, dt in enumerate(_dates_seconds):
         date_ixs[dt] = i
 
-    # splits affect prices and volumes, volumes is the inverse
-    for sid, ratio, eff_date in splits:
-        if eff_date < start_date:
-            continue
-
-        date_loc = _lookup_dt(date_ixs, eff_date, _dates_seconds)
-
-        if not PyDict_Contains(asset_ixs, sid):
-            asset_ixs[sid] = assets.get_loc(sid)
-        asset_ix = asset_ixs[sid]
-
-        price_adj = Float64Multiply(0, date_loc, asset_ix, asset_ix, ratio)
-        for i, column in enumerate(columns):
-            col_adjustments = results[i]
-            if column != 'volume':
-                try:
-                    col_adjustments[date_loc].append(price_adj)
-                except KeyError:
-                    col_adjustments[date_loc] = [price_adj]
-            else:
-                volume_adj = Float64Multiply(
-                    0, date_loc, asset_ix, asset_ix, 1.0 / ratio
-                )
-                try:
-                    col_adjustments[date_loc].append(volume_adj)
-                except KeyError:
-                    col_adjustments[date_loc] = [volume_adj]
-
-    # mergers affect prices only
-    for sid, ratio, eff_date in mergers:
-        if eff_date < start_date:
-            continue
-
-        date_loc = _lookup_dt(date_ixs, eff_date, _dates_seconds)
-
-        if not PyDict_Contains(asset_ixs, sid):
-            asset_ixs[sid] = assets.get_loc(sid)
-        asset_ix = asset_ixs[sid]
-
-        adj = Float64Multiply(0, date_loc, asset_ix, asset_ix, ratio)
-        for i, column in enumerate(columns):
-            col_adjustments = results[i]
-            if column != 'volume':
-                try:
-                    col_adjustments[date_loc].append(adj)
-                except KeyError:
-                    col_adjustments[date_loc] = [adj]
-
-    # dividends affect prices only
-    for sid, ratio, eff_date in dividends:
-        if eff_date < start_date:
-            continue
-
-        date_loc = _lookup_dt(date_ixs, eff_date, _dates_seconds)
+    # splits affect prices and volumes, volumes is the inverse.
+    # mergers and dividends affect prices only.
+    for table, is_split in ((splits, True),
+                            (mergers, False),
+                            (dividends, False)):
+        for sid, ratio, eff_date in table:
+            if eff_date < start_date:
+                continue
+
+            date_loc = _lookup_dt(date_ixs, eff_date, _dates_seconds)
+
+            if not PyDict_Contains(asset_ixs, sid):
+                asset_ixs[sid] = assets.get_loc(sid)
+            asset_ix = asset_ixs[sid]
+
+            price_records.append((date_loc, asset_ix, ratio))
+            if is_split:
+                volume_records.append((date_loc, asset_ix, 1.0 / ratio))
+
+    if packed:
+        price_table = _pack_multiplies(price_records)
+        volume_table = _pack_multiplies(volume_records)
+        return [
+            volume_table if column == 'volume' else price_table
+            for column in columns
+        ]
+
+    cdef dict price_adjustments = _unpack_multiplies(price_records)
+    cdef dict volume_adjustments = _unpack_multiplies(volume_records)
+    cdef list results = []
+    for column in columns:
+        if column == 'volume':
+            source = volume_adjustments
+        else:
+            source = price_adjustments
+        # Each column gets its own lists, but the Adjustment objects are
+        # shared between columns.
+        results.append({k: list(v) for k, v in source.items()})
+    return results
 
-        if not PyDict_Contains(asset_ixs, sid):
-            asset_ixs[sid] = assets.get_loc(sid)
-        asset_ix = asset_ixs[sid]
 
+cdef dict _unpack_multiplies(list records):
+    """
+    Convert (date_loc, asset_ix, ratio) records into a dict mapping date_loc
+    to a list of Float64Multiply adjustments.
+    """
+    cdef dict out = {}
+    for date_loc, asset_ix, ratio in records:
         adj = Float64Multiply(0, date_loc, asset_ix, asset_ix, ratio)
-        for i, column in enumerate(columns):
-            col_adjustments = results[i]
-            if column != 'volume':
-                try:
-                    col_adjustments[date_loc].append(adj)
-                except KeyError:
-                    col_adjustments[date_loc] = [adj]
+        try:
+            out[date_loc].append(adj)
+        except KeyError:
+            out[date_loc] = [adj]
+    return out
 
-    return results
+
+cdef _pack_multiplies(list records):
+    """
+    Convert (date_loc, asset_ix, ratio) records into a Float64AdjustmentTable
+    of multiplications.
+    """
+    cdef Py_ssize_t n = len(records)
+    cdef ndarray[int64_t, ndim=1] date_locs = zeros(n, dtype=int64)
+    cdef ndarray[int64_t, ndim=1] asset_ixs = zeros(n, dtype=int64)
+    cdef ndarray[float64_t, ndim=1] ratios = zeros(n, dtype=float64)
+    cdef Py_ssize_t i
+
+    for i in range(n):
+        date_locs[i], asset_ixs[i], ratios[i] = records[i]
+
+    return Float64AdjustmentTable(
+        date_locs,
+        zeros(n, dtype=int64),
+        date_locs,
+        asset_ixs,
+        asset_ixs,
+        full(n, MULTIPLY, dtype=uint8),
+        ratios,
+    )
 
 
 cdef _lookup_dt(dict dt_cache,
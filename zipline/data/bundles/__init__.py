@@ -1,5 +1,5 @@
-# These imports are necessary to force module-scope register calls to happen.
-from . import quandl  # noqa
+from zipline.utils.calendars import register_calendar_alias
+from zipline.utils.imports import DeferredCallable
 from .core import (
     UnknownBundle,
     bundles,
@@ -12,7 +12,43 @@ from .core import (
     to_bundle_ingest_dirname,
     unregister,
 )
-from .yahoo import yahoo_equities
+
+
+def yahoo_equities(symbols, start=None, end=None):
+    """Create a data bundle ingest function from a set of symbols loaded from
+    yahoo.
+
+    See :func:`zipline.data.bundles.yahoo.yahoo_equities`.
+    """
+    # The yahoo module depends on pandas_datareader, which is slow to import,
+    # so it isn't imported until a yahoo bundle is created.
+    from .yahoo import yahoo_equities
+    return yahoo_equities(symbols, start, end)
+
+
+# The default bundles are registered with ingest functions that import their
+# modules when a bundle is ingested, so that the download dependencies aren't
+# imported on every run.
+register(
+    'quandl',
+    DeferredCallable('zipline.data.bundles.quandl', 'quandl_bundle'),
+)
+register(
+    'quantopian-quandl',
+    DeferredCallable(
+        'zipline.data.bundles.quandl',
+        'quantopian_quandl_bundle',
+    ),
+    create_writers=False,
+)
+# bundle used when creating test data
+register(
+    '.test',
+    DeferredCallable('zipline.data.bundles.yahoo', 'test_bundle'),
+)
+
+register_calendar_alias("QUANDL", "NYSE")
+register_calendar_alias("YAHOO", "NYSE")
 
 
 __all__ = [
@@ -12,11 +12,8 @@ import pandas as pd
 import requests
 from six.moves.urllib.parse import urlencode
 
-from zipline.utils.calendars import register_calendar_alias
 from zipline.utils.cli import maybe_show_progress
 
-from . import core as bundles
-
 log = Logger(__name__)
 seconds_per_call = (pd.Timedelta('10 minutes') / 2000).total_seconds()
 # Invalid symbols that quandl has had in its metadata:
@@ -274,7 +271,6 @@ def gen_symbol_data(api_key,
                 sleep(remaining)
 
 
-@bundles.register('quandl')
 def quandl_bundle(environ,
                   asset_db_writer,
                   minute_bar_writer,
@@ -379,7 +375,6 @@ QUANTOPIAN_QUANDL_URL = (
 ONE_MEGABYTE = 1024 * 1024
 
 
-@bundles.register('quantopian-quandl', create_writers=False)
 def quantopian_quandl_bundle(environ,
                              asset_db_writer,
                              minute_bar_writer,
@@ -404,6 +399,3 @@ def quantopian_quandl_bundle(environ,
         if show_progress:
             print("Writing data to %s." % output_dir)
         tar.extractall(output_dir)
-
-
-register_calendar_alias("QUANDL", "NYSE")
@@ -5,9 +5,7 @@ import pandas as pd
 from pandas_datareader.data import DataReader
 import requests
 
-from zipline.utils.calendars import register_calendar_alias
 from zipline.utils.cli import maybe_show_progress
-from .core import register
 
 
 def _cachpath(symbol, type_):
@@ -180,24 +178,19 @@ def yahoo_equities(symbols, start=None, end=None):
     return ingest
 
 
-# bundle used when creating test data
-register(
-    '.test',
-    yahoo_equities(
-        (
-            'AMD',
-            'CERN',
-            'COST',
-            'DELL',
-            'GPS',
-            'INTC',
-            'MMM',
-            'AAPL',
-            'MSFT',
-        ),
-        pd.Timestamp('2004-01-02', tz='utc'),
-        pd.Timestamp('2015-01-01', tz='utc'),
+# bundle used when creating test data, registered as '.test'
+test_bundle = yahoo_equities(
+    (
+        'AMD',
+        'CERN',
+        'COST',
+        'DELL',
+        'GPS',
+        'INTC',
+        'MMM',
+        'AAPL',
+        'MSFT',
     ),
+    pd.Timestamp('2004-01-02', tz='utc'),
+    pd.Timestamp('2015-01-01', tz='utc'),
 )
-
-register_calendar_alias("YAHOO", "NYSE")
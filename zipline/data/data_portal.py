@@ -104,6 +104,10 @@ class DataPortal(object):
     adjustment_reader : SQLiteAdjustmentWriter, optional
         The adjustment reader. This is used to apply splits, dividends, and
         other adjustment data to the raw data from the readers.
+    prefetch_minute_history : bool, optional
+        If True, the minute data for the next few sessions of minute history
+        windows is read on a background thread while the current sessions are
+        simulated.  Default is False.
     """
     def __init__(self,
                  asset_finder,
@@ -113,7 +117,8 @@ class DataPortal(object):
                  equity_minute_reader=None,
                  future_daily_reader=None,
                  future_minute_reader=None,
-                 adjustment_reader=None):
+                 adjustment_reader=None,
+                 prefetch_minute_history=False):
 
         self.trading_calendar = trading_calendar
         self.asset_finder = asset_finder
@@ -195,7 +200,8 @@ class DataPortal(object):
         self._minute_history_loader = MinuteHistoryLoader(
             self.trading_calendar,
             _dispatch_minute_reader,
-            self._adjustment_reader
+            self._adjustment_reader,
+            prefetch_in_background=prefetch_minute_history,
         )
 
         self._first_trading_day = first_trading_day
@@ -17,6 +17,8 @@ from abc import (
     abstractmethod,
     abstractproperty,
 )
+from threading import Thread
+
 from lru import LRU
 
 from numpy import around, hstack
@@ -69,6 +71,80 @@ class SlidingWindow(object):
         return self.current
 
 
+class PendingArray(object):
+    """
+    A raw pricing array being loaded on a background thread.
+
+    Parameters
+    ----------
+    load : callable
+        Function called as ``load(dts, assets, field)`` on the background
+        thread to load the array.
+    start_ix : int
+        Index in the loader's calendar of the first row of the array.
+    end_ix : int
+        Index in the loader's calendar of the last row of the array.
+    dts : iterable of datetime64-like
+        The datetimes to load.
+    assets : list of Assets
+        The assets to load, in column order.
+    field : str
+        The OHLCV field to load.
+    """
+    def __init__(self, load, start_ix, end_ix, dts, assets, field):
+        self.start_ix = start_ix
+        self.end_ix = end_ix
+        self._columns = {asset: i for i, asset in enumerate(assets)}
+        self._array = None
+        self._thread = Thread(
+            target=self._load,
+            args=(load, dts, assets, field),
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _load(self, load, dts, assets, field):
+        try:
+            self._array = load(dts, assets, field)
+        except Exception:
+            # Leave self._array as None.  The caller will fall back to loading
+            # the data on the main thread, which will raise the error again.
+            pass
+
+    def covers(self, start_ix, end_ix, assets):
+        """
+        Can this array provide data for ``assets`` from ``start_ix`` through
+        at least ``end_ix``?
+        """
+        columns = self._columns
+        return (
+            self.start_ix <= start_ix and
+            end_ix <= self.end_ix and
+            all(asset in columns for asset in assets)
+        )
+
+    def get(self, start_ix, assets):
+        """
+        Wait for the array to finish loading and return the rows from
+        ``start_ix`` onwards for ``assets``.
+
+        Returns
+        -------
+        out : np.ndarray or None
+            A new array with one column per asset in ``assets``, or None if
+            the array failed to load.
+        """
+        self._thread.join()
+        if self._array is None:
+            return None
+        # Fancy indexing the columns copies the data.  AdjustedArrayWindows
+        # mutate their data in place, so they can't share a buffer.
+        return self._array[
+            start_ix - self.start_ix:,
+            [self._columns[asset] for asset in assets],
+        ]
+
+
 class HistoryLoader(with_metaclass(ABCMeta)):
     """
     Loader for sliding history windows, with support for adjustments.
@@ -81,11 +157,19 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         Reader for pricing bars.
     adjustment_reader : SQLiteAdjustmentReader
         Reader for adjustment data.
+    sid_cache_size : int, optional
+        The number of sliding windows to cache per field.
+    prefetch_in_background : bool, optional
+        If True, whenever a block of data is read to build new sliding
+        windows, start loading the block that will replace it on a background
+        thread.  This overlaps reading and decompressing the next block with
+        the simulation using the current one.  The reader must support being
+        read from multiple threads.  Default is False.
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume')
 
     def __init__(self, trading_calendar, reader, adjustment_reader,
-                 sid_cache_size=1000):
+                 sid_cache_size=1000, prefetch_in_background=False):
         self.trading_calendar = trading_calendar
         self._reader = reader
         self._adjustments_reader = adjustment_reader
@@ -93,6 +177,10 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             field: ExpiringCache(LRU(sid_cache_size))
             for field in self.FIELDS
         }
+        self._prefetch_in_background = prefetch_in_background
+        # Map from (field, window size) to the PendingArray that will provide
+        # the next block of data for windows of that size.
+        self._pending_arrays = {}
 
     @abstractproperty
     def _prefetch_length(self):
@@ -266,10 +354,23 @@ class HistoryLoader(with_metaclass(ABCMeta)):
 
             cal = self._calendar
             prefetch_end_ix = min(end_ix + self._prefetch_length, len(cal) - 1)
+            if self._prefetch_in_background:
+                array, prefetch_end_ix = self._load_and_prefetch(
+                    start_ix,
+                    end_ix,
+                    prefetch_end_ix,
+                    needed_assets,
+                    field,
+                )
+            else:
+                array = self._array(
+                    cal[start_ix:prefetch_end_ix + 1],
+                    needed_assets,
+                    field,
+                )
             prefetch_end = cal[prefetch_end_ix]
             prefetch_dts = cal[start_ix:prefetch_end_ix + 1]
             prefetch_len = len(prefetch_dts)
-            array = self._array(prefetch_dts, needed_assets, field)
             view_kwargs = {}
             if field == 'volume':
                 array = array.astype(float64_dtype)
@@ -296,6 +397,83 @@ class HistoryLoader(with_metaclass(ABCMeta)):
 
         return [asset_windows[asset] for asset in assets]
 
+    def _load_and_prefetch(self,
+                           start_ix,
+                           end_ix,
+                           prefetch_end_ix,
+                           assets,
+                           field):
+        """
+        Load the raw data for new sliding windows, using data loaded on a
+        background thread if possible, and start loading the data that will be
+        needed once the new windows expire.
+
+        Parameters
+        ----------
+        start_ix : int
+            Calendar index of the first dt of the windows.
+        end_ix : int
+            Calendar index of the current dt of the windows.
+        prefetch_end_ix : int
+            Calendar index of the last dt to load if the data has to be read
+            now.
+        assets : list of Assets
+            The assets to load.
+        field : str
+            The OHLCV field to load.
+
+        Returns
+        -------
+        array : np.ndarray
+            The raw data from ``start_ix`` through ``prefetch_end_ix``.
+        prefetch_end_ix : int
+            Calendar index of the last row of ``array``.  This may differ from
+            the requested ``prefetch_end_ix`` if the data was loaded in the
+            background, but is always at least ``end_ix``.
+        """
+        cal = self._calendar
+        key = field, end_ix - start_ix
+        pending = self._pending_arrays.get(key)
+
+        array = None
+        if pending is not None and pending.covers(start_ix, end_ix, assets):
+            array = pending.get(start_ix, assets)
+            if array is not None:
+                prefetch_end_ix = pending.end_ix
+        if array is None:
+            array = self._array(
+                cal[start_ix:prefetch_end_ix + 1],
+                assets,
+                field,
+            )
+
+        # The windows built from ``array`` expire once the simulation moves
+        # past ``prefetch_end_ix``.  Start loading the block that a request
+        # on the following dt would need, so that it is ready by then.
+        next_end_ix = prefetch_end_ix + 1
+        if next_end_ix < len(cal):
+            next_start_ix = next_end_ix - (end_ix - start_ix)
+            next_prefetch_end_ix = min(
+                next_end_ix + self._prefetch_length,
+                len(cal) - 1,
+            )
+            # Windows of the same size viewed from a different perspective
+            # can share the pending block, so only replace it if it wouldn't
+            # cover the next request.
+            if pending is None or not pending.covers(next_start_ix,
+                                                     next_prefetch_end_ix,
+                                                     assets):
+                self._pending_arrays[key] = PendingArray(
+                    self._array,
+                    next_start_ix,
+                    next_prefetch_end_ix,
+                    cal[next_start_ix:next_prefetch_end_ix + 1],
+                    assets,
+                    field,
+                )
+
+        return array, prefetch_end_ix
+
     def history(self, assets, dts, field, is_perspective_after):
         """
         A window of pricing data with adjustments applied assuming that the
@@ -17,7 +17,6 @@ from collections import OrderedDict
 
 import logbook
 import pandas as pd
-from pandas_datareader.data import DataReader
 import pytz
 from six import iteritems
 from six.moves.urllib_error import HTTPError
@@ -346,6 +345,9 @@ def _load_raw_yahoo_data(indexes=None, stocks=None, start=None, end=None):
     assert indexes is not None or stocks is not None, """
 must specify stocks or indexes"""
 
+    # pandas_datareader is slow to import and only needed here.
+    from pandas_datareader.data import DataReader
+
     if start is None:
         start = pd.datetime(1990, 1, 1, 0, 0, 0, 0, pytz.utc)
 
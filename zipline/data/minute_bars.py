@@ -36,6 +36,14 @@ from zipline.data._minute_bar_internal import (
 from zipline.gens.sim_engine import NANOS_IN_MINUTE
 
 from zipline.data.bar_reader import BarReader, NoDataOnDate
+from zipline.data.traded_runs import (
+    extend_traded_runs,
+    last_traded_position,
+    read_traded_runs,
+    traded_runs,
+    truncate_traded_runs,
+    write_traded_runs,
+)
 from zipline.utils.calendars import get_calendar
 from zipline.utils.cli import maybe_show_progress
 from zipline.utils.memoize import lazyval
@@ -751,6 +759,24 @@ class BcolzMinuteBarWriter(object):
         ])
         table.flush()
 
+        self._update_traded_runs(sid, table, num_rec_mins, vol_col)
+
+    def _update_traded_runs(self, sid, table, num_rec_mins, vol_col):
+        """
+        Add the minutes with volume that were just written to the sid's index
+        of traded minutes.
+        """
+        sidpath = self.sidpath(sid)
+        runs = read_traded_runs(sidpath)
+        if runs is None:
+            # The earlier data was written before traded minutes were
+            # indexed; index it now.
+            runs = traded_runs(table['volume'][:num_rec_mins])
+        write_traded_runs(
+            sidpath,
+            extend_traded_runs(runs, traded_runs(vol_col, num_rec_mins)),
+        )
+
     def data_len_for_day(self, day):
         """
         Return the number of data points up to and including the
@@ -788,6 +814,12 @@ class BcolzMinuteBarWriter(object):
             shutil.move(sid_path, tmp_path)
             try:
                 bcolz.ctable(new_table, rootdir=sid_path)
+                runs = read_traded_runs(tmp_path)
+                if runs is not None:
+                    write_traded_runs(
+                        sid_path,
+                        truncate_traded_runs(runs, truncate_slice_end),
+                    )
                 try:
                     shutil.rmtree(tmp_path)
                 except Exception as err:
@@ -859,6 +891,8 @@ class BcolzMinuteBarReader(MinuteBarReader):
             for field in self.FIELDS
         }
 
+        self._traded_runs = LRU(sid_cache_size)
+
         self._last_get_value_dt_position = None
         self._last_get_value_dt_value = None
 
@@ -1059,7 +1093,45 @@ class BcolzMinuteBarReader(MinuteBarReader):
             return pd.NaT
         return self._pos_to_minute(minute_pos)
 
+    def _get_traded_runs(self, sid):
+        sid = int(sid)
+        try:
+            return self._traded_runs[sid]
+        except KeyError:
+            runs = self._traded_runs[sid] = read_traded_runs(
+                os.path.join(self._rootdir, _sid_subdir_path(sid)),
+            )
+            return runs
+
     def _find_last_traded_position(self, asset, dt):
+        runs = self._get_traded_runs(asset)
+        if runs is None:
+            # The data was written without an index of the traded minutes.
+            return self._scan_last_traded_position(asset, dt)
+
+        start_date_minute = asset.start_date.value / NANOS_IN_MINUTE
+        dt_minute = dt.value / NANOS_IN_MINUTE
+        if dt_minute < start_date_minute:
+            return -1
+
+        pos = last_traded_position(
+            runs,
+            find_position_of_minute(
+                self._market_open_values,
+                self._market_close_values,
+                dt_minute,
+                self._minutes_per_day,
+                True,
+            ),
+        )
+        if pos == -1 or minute_value(
+                self._market_open_values,
+                pos,
+                self._minutes_per_day) < start_date_minute:
+            return -1
+        return pos
+
+    def _scan_last_traded_position(self, asset, dt):
         volumes = self._open_minute_file('volume', asset)
         start_date_minute = asset.start_date.value / NANOS_IN_MINUTE
         dt_minute = dt.value / NANOS_IN_MINUTE
@@ -0,0 +1,127 @@
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Index of the positions at which a bar table has volume.
+
+The index is stored next to the bcolz tables as the runs of consecutive
+positions with non-zero volume: a ``(2, nruns)`` int64 array of the first and
+last position of each run. Finding the last position with volume at or before
+a given position is then a binary search, no matter how long the asset went
+without trading.
+"""
+import os
+
+import numpy as np
+
+TRADED_RUNS_FILE = 'traded_runs.npy'
+
+
+def empty_traded_runs():
+    return np.empty((2, 0), dtype=np.int64)
+
+
+def traded_runs(volumes, offset=0):
+    """
+    Find the runs of consecutive non-zero volumes.
+
+    Parameters
+    ----------
+    volumes : np.ndarray
+        The volumes to index.
+    offset : int, optional
+        The position of ``volumes[0]`` in the table.
+
+    Returns
+    -------
+    runs : np.ndarray[int64]
+        Array of shape ``(2, nruns)`` holding the first and last position of
+        each run.
+    """
+    traded = np.asarray(volumes) != 0
+    if not traded.any():
+        return empty_traded_runs()
+
+    padded = np.concatenate([[False], traded, [False]])
+    changes = np.flatnonzero(padded[1:] != padded[:-1])
+    runs = np.vstack([changes[::2], changes[1::2] - 1]).astype(np.int64)
+    runs += offset
+    return runs
+
+
+def extend_traded_runs(runs, new_runs):
+    """
+    Append the runs of data written after the end of ``runs``.
+
+    A run that starts right after the last run of ``runs`` is merged into it.
+    """
+    if (runs.shape[1] and new_runs.shape[1] and
+            new_runs[0, 0] == runs[1, -1] + 1):
+        runs = runs.copy()
+        runs[1, -1] = new_runs[1, 0]
+        new_runs = new_runs[:, 1:]
+    return np.hstack([runs, new_runs])
+
+
+def truncate_traded_runs(runs, length):
+    """
+    Drop the parts of ``runs`` at or after position ``length``.
+    """
+    runs = runs[:, runs[0] < length].copy()
+    if runs.shape[1]:
+        runs[1, -1] = min(runs[1, -1], length - 1)
+    return runs
+
+
+def last_traded_position(runs, pos):
+    """
+    Find the last position at or before ``pos`` with non-zero volume.
+
+    Parameters
+    ----------
+    runs : np.ndarray[int64]
+        The runs of a table, as returned by ``traded_runs``.
+    pos : int
+        The position to search back from.
+
+    Returns
+    -------
+    last_traded : int
+        The position, or -1 if there was no volume at or before ``pos``.
+    """
+    ix = np.searchsorted(runs[0], pos, side='right') - 1
+    if ix < 0:
+        return -1
+    return int(min(runs[1, ix], pos))
+
+
+def write_traded_runs(rootdir, runs):
+    """
+    Write the runs of a table into the table's root directory.
+    """
+    np.save(os.path.join(rootdir, TRADED_RUNS_FILE), runs)
+
+
+def read_traded_runs(rootdir):
+    """
+    Read the runs of a table from the table's root directory.
+
+    Returns
+    -------
+    runs : np.ndarray[int64] or None
+        The runs, or None if the table was written without them.
+    """
+    try:
+        return np.load(os.path.join(rootdir, TRADED_RUNS_FILE))
+    except IOError:
+        return None
@@ -50,6 +50,12 @@ from six import (
 )
 
 from zipline.data.session_bars import SessionBarReader
+from zipline.data.traded_runs import (
+    last_traded_position,
+    read_traded_runs,
+    traded_runs,
+    write_traded_runs,
+)
 from zipline.data.bar_reader import (
     NoDataAfterDate,
     NoDataBeforeDate,
@@ -385,6 +391,12 @@ class BcolzDailyBarWriter(object):
         full_table.attrs['start_session_ns'] = self._start_session.value
         full_table.attrs['end_session_ns'] = self._end_session.value
         full_table.flush()
+
+        if self._filename is not None:
+            write_traded_runs(
+                self._filename,
+                traded_runs(full_table['volume'][:]),
+            )
         return full_table
 
 
@@ -476,6 +488,15 @@ class BcolzDailyBarReader(SessionBarReader):
             return maybe_table_rootdir
         return ctable(rootdir=maybe_table_rootdir, mode='r')
 
+    @lazyval
+    def _traded_runs(self):
+        maybe_table_rootdir = self._maybe_table_rootdir
+        if isinstance(maybe_table_rootdir, ctable):
+            maybe_table_rootdir = maybe_table_rootdir.rootdir
+        if maybe_table_rootdir is None:
+            return None
+        return read_traded_runs(maybe_table_rootdir)
+
     @lazyval
     def sessions(self):
         if 'calendar' in self._table.attrs.attrs:
@@ -627,6 +648,27 @@ class BcolzDailyBarReader(SessionBarReader):
         return col
 
     def get_last_traded_dt(self, asset, day):
+        runs = self._traded_runs
+        if runs is None:
+            # The table was written without an index of the traded rows.
+            return self._scan_last_traded_dt(asset, day)
+
+        try:
+            ix = self.sid_day_index(asset, day)
+        except NoDataAfterDate:
+            ix = self._last_rows[asset]
+        except (NoDataBeforeDate, NoDataOnDate):
+            return None
+
+        # The runs may continue across the boundary between two assets, so
+        # make sure that the row found belongs to this asset.
+        first_row = self._first_rows[asset]
+        ix = last_traded_position(runs, ix)
+        if ix < first_row:
+            return None
+        return self.sessions[self._calendar_offsets[asset] + ix - first_row]
+
+    def _scan_last_traded_dt(self, asset, day):
         volumes = self._spot_col('volume')
 
         search_day = day
@@ -1243,17 +1285,20 @@ class SQLiteAdjustmentReader(object):
     --------
     :class:`zipline.data.us_equity_pricing.SQLiteAdjustmentWriter`
     """
+    # ``load_adjustments`` accepts ``packed=True``.
+    supports_packed_adjustments = True
 
     @preprocess(conn=coerce_string_to_conn)
     def __init__(self, conn):
         self.conn = conn
 
-    def load_adjustments(self, columns, dates, assets):
+    def load_adjustments(self, columns, dates, assets, packed=False):
         return load_adjustments_from_sqlite(
             self.conn,
             list(columns),
             dates,
             assets,
+            packed=packed,
         )
 
     def get_adjustments_for_sid(self, table_name, sid):
@@ -548,6 +548,18 @@ class AttachPipelineAfterInitialize(ZiplineError):
     )
 
 
+class DuplicatePipelineName(ZiplineError):
+    """
+    Raised when a user tries to attach a pipeline with a name that's already
+    been used by another pipeline.
+    """
+    msg = (
+        "Attempted to attach pipeline named {name!r}, but the name already "
+        "exists for another pipeline. Please use a different name for this "
+        "pipeline."
+    )
+
+
 class PipelineOutputDuringInitialize(ZiplineError):
     """
     Raised when a user tries to call `pipeline_output` during initialize.
@@ -727,3 +739,22 @@ class IncompatibleTerms(ZiplineError):
         "{term_1} and {term_2} must have the same mask in order to compute "
         "correlations and regressions asset-wise."
     )
+
+
+class UnpicklableCheckpointState(ZiplineError):
+    """
+    Raised when an attribute of an algorithm's context can't be written to a
+    checkpoint.
+    """
+    msg = (
+        "Can't write a checkpoint of the simulation because the context"
+        " attribute {name!r} can't be pickled: {error}"
+    )
+
+
+class CheckpointMismatch(ZiplineError):
+    """
+    Raised when resuming from a checkpoint that wasn't written by a matching
+    simulation.
+    """
+    msg = "Can't resume from the checkpoint at {path!r}: {reason}."
@@ -19,6 +19,7 @@ from copy import copy
 from six import iteritems
 
 from zipline.finance.order import Order
+from zipline.finance.order_book import OrderBook
 from zipline.finance.slippage import VolumeShareSlippage
 from zipline.finance.commission import PerShare
 from zipline.finance.cancel_policy import NeverCancel
@@ -33,8 +34,8 @@ class Blotter(object):
         # these orders are aggregated by sid
         self.open_orders = defaultdict(list)
 
-        # keep a dict of orders by their own id
-        self.orders = {}
+        # keep a mapping of orders by their own id
+        self.orders = OrderBook()
 
         # all our legacy order management code works with integer sids.
         # this lets us convert those to assets when needed.  ideally, we'd just
@@ -114,6 +115,27 @@ class Blotter(object):
 
         return order.id
 
+    def batch_order(self, order_arg_lists):
+        """Place a batch of orders.
+
+        Parameters
+        ----------
+        order_arg_lists : iterable[tuple]
+            Tuples of args that `order` expects.
+
+        Returns
+        -------
+        order_ids : list[str or None]
+            The unique identifier (or None) for each of the orders placed
+            (or not placed).
+
+        Notes
+        -----
+        This is required for `Blotter` subclasses to be able to place a batch
+        of orders, instead of being passed the order requests one at a time.
+        """
+        return [self.order(*order_args) for order_args in order_arg_lists]
+
     def cancel(self, order_id, relay_status=True):
         if order_id not in self.orders:
             return
@@ -243,6 +265,15 @@ class Blotter(object):
             # along with newly placed orders.
             self.new_orders.append(cur_order)
 
+    def archive_closed_orders(self):
+        """
+        Move the orders that have been closed and relayed into compact
+        storage. They can still be looked up in ``self.orders``.
+        """
+        self.orders.archive_closed(
+            keep={order.id for order in self.new_orders},
+        )
+
     def process_splits(self, splits):
         """
         Processes a list of splits by modifying any open orders as needed.
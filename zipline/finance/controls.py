@@ -14,6 +14,7 @@
 # limitations under the License.
 import abc
 
+import numpy as np
 import pandas as pd
 
 from six import with_metaclass
@@ -22,6 +23,79 @@ from zipline.errors import (
     AccountControlViolation,
     TradingControlViolation,
 )
+from zipline.utils.memoize import lazyval
+
+
+def _normalized_nanos(dates):
+    """
+    Normalize dates to midnight as int64 nanoseconds, with NaT for missing
+    dates.
+    """
+    return np.array(
+        [
+            pd.Timestamp(date).normalize().value if date else pd.NaT.value
+            for date in dates
+        ],
+        dtype=np.int64,
+    )
+
+
+class OrderBatch(object):
+    """
+    A batch of orders laid out as arrays for ``TradingControl.validate_batch``.
+
+    Parameters
+    ----------
+    assets : list[Asset]
+        The asset of each order.
+    amounts : iterable[int]
+        The number of shares of each order.
+    prices : iterable[float]
+        The current price of each asset.
+    position_amounts : iterable[float]
+        The number of shares of each asset held before the orders are placed.
+    """
+    def __init__(self, assets, amounts, prices, position_amounts):
+        self.assets = np.empty(len(assets), dtype=object)
+        self.assets[:] = assets
+        self.amounts = np.asarray(amounts, dtype=np.int64)
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.position_amounts = np.asarray(position_amounts, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.assets)
+
+    @lazyval
+    def sids(self):
+        return np.array([asset.sid for asset in self.assets], dtype=np.int64)
+
+    @lazyval
+    def start_dates(self):
+        """The normalized start date of each asset as int64 nanoseconds."""
+        return _normalized_nanos(asset.start_date for asset in self.assets)
+
+    @lazyval
+    def end_dates(self):
+        """The normalized end date of each asset as int64 nanoseconds."""
+        return _normalized_nanos(asset.end_date for asset in self.assets)
+
+    def mask_for(self, asset):
+        """
+        Get the orders that a control restricted to ``asset`` applies to.
+
+        Parameters
+        ----------
+        asset : Asset or None
+            The asset the control is restricted to, or None if it applies to
+            every asset.
+
+        Returns
+        -------
+        mask : np.ndarray[bool]
+        """
+        if asset is None:
+            return np.ones(len(self), dtype=bool)
+        return self.sids == int(asset)
 
 
 class TradingControl(with_metaclass(abc.ABCMeta)):
@@ -57,6 +131,48 @@ class TradingControl(with_metaclass(abc.ABCMeta)):
         """
         raise NotImplementedError
 
+    def validate_batch(self,
+                       batch,
+                       portfolio,
+                       algo_datetime,
+                       algo_current_data):
+        """
+        Validate every order of a batch before any of them is placed.
+
+        This must behave like calling ``validate`` once for each order of the
+        batch. The default implementation does exactly that; subclasses
+        override it to check the whole batch with array operations.
+
+        Parameters
+        ----------
+        batch : OrderBatch
+            The orders to validate.
+        portfolio : Portfolio
+            The portfolio before the orders are placed.
+        algo_datetime : pd.Timestamp
+            The current simulation time.
+        algo_current_data : BarData
+            The data for the current bar.
+        """
+        for asset, amount in zip(batch.assets, batch.amounts):
+            self.validate(asset,
+                          int(amount),
+                          portfolio,
+                          algo_datetime,
+                          algo_current_data)
+
+    def fail_first(self, batch, violations, datetime, metadata=None):
+        """
+        Call self.fail for the first order of ``batch`` flagged in
+        ``violations``, if any.
+        """
+        if violations.any():
+            ix = np.flatnonzero(violations)[0]
+            self.fail(batch.assets[ix],
+                      int(batch.amounts[ix]),
+                      datetime,
+                      metadata=metadata)
+
     def fail(self, asset, amount, datetime, metadata=None):
         """
         Raise a TradingControlViolation with information about the failure.
@@ -113,6 +229,28 @@ class MaxOrderCount(TradingControl):
             self.fail(asset, amount, algo_datetime)
         self.orders_placed += 1
 
+    def validate_batch(self,
+                       batch,
+                       _portfolio,
+                       algo_datetime,
+                       _algo_current_data):
+        """
+        Fail if the batch would take us over self.max_count orders today.
+        """
+        algo_date = algo_datetime.date()
+        if self.current_date and self.current_date != algo_date:
+            self.orders_placed = 0
+        self.current_date = algo_date
+
+        remaining = max(self.max_count - self.orders_placed, 0)
+        if len(batch) > remaining:
+            # The orders before the first one over the limit were counted.
+            self.orders_placed += remaining
+            self.fail(batch.assets[remaining],
+                      int(batch.amounts[remaining]),
+                      algo_datetime)
+        self.orders_placed += len(batch)
+
 
 class RestrictedListOrder(TradingControl):
     """TradingControl representing a restricted list of assets that
@@ -140,6 +278,36 @@ class RestrictedListOrder(TradingControl):
         if asset in self.restricted_list:
             self.fail(asset, amount, _algo_datetime)
 
+    def validate_batch(self,
+                       batch,
+                       portfolio,
+                       algo_datetime,
+                       algo_current_data):
+        """
+        Fail if any asset of the batch is in the restricted_list.
+        """
+        try:
+            # Evaluate the restricted list once for the whole batch.
+            restricted_sids = np.array(
+                [int(asset) for asset in self.restricted_list],
+                dtype=np.int64,
+            )
+        except (TypeError, ValueError):
+            # Not a collection of assets or sids, so use its own membership
+            # test.
+            return super(RestrictedListOrder, self).validate_batch(
+                batch,
+                portfolio,
+                algo_datetime,
+                algo_current_data,
+            )
+
+        self.fail_first(
+            batch,
+            np.in1d(batch.sids, restricted_sids),
+            algo_datetime,
+        )
+
 
 class MaxOrderSize(TradingControl):
     """
@@ -197,6 +365,31 @@ class MaxOrderSize(TradingControl):
         if too_much_value:
             self.fail(asset, amount, _algo_datetime)
 
+    def validate_batch(self,
+                       batch,
+                       _portfolio,
+                       algo_datetime,
+                       _algo_current_data):
+        """
+        Fail if the magnitude of any order of the batch exceeds either
+        self.max_shares or self.max_notional.
+        """
+        violations = np.zeros(len(batch), dtype=bool)
+        # A missing price never violates the notional limit.
+        with np.errstate(invalid='ignore'):
+            if self.max_shares is not None:
+                violations |= np.abs(batch.amounts) > self.max_shares
+            if self.max_notional is not None:
+                violations |= (
+                    np.abs(batch.amounts * batch.prices) > self.max_notional
+                )
+
+        self.fail_first(
+            batch,
+            violations & batch.mask_for(self.asset),
+            algo_datetime,
+        )
+
 
 class MaxPositionSize(TradingControl):
     """
@@ -259,6 +452,34 @@ class MaxPositionSize(TradingControl):
         if too_much_value:
             self.fail(asset, amount, algo_datetime)
 
+    def validate_batch(self,
+                       batch,
+                       _portfolio,
+                       algo_datetime,
+                       _algo_current_data):
+        """
+        Fail if any order of the batch would cause the magnitude of our
+        position to be greater in shares than self.max_shares or greater in
+        dollar value than self.max_notional.
+        """
+        shares_post_order = batch.position_amounts + batch.amounts
+
+        violations = np.zeros(len(batch), dtype=bool)
+        with np.errstate(invalid='ignore'):
+            if self.max_shares is not None:
+                violations |= np.abs(shares_post_order) > self.max_shares
+            if self.max_notional is not None:
+                violations |= (
+                    np.abs(shares_post_order * batch.prices) >
+                    self.max_notional
+                )
+
+        self.fail_first(
+            batch,
+            violations & batch.mask_for(self.asset),
+            algo_datetime,
+        )
+
 
 class LongOnly(TradingControl):
     """
@@ -278,6 +499,21 @@ class LongOnly(TradingControl):
         if portfolio.positions[asset].amount + amount < 0:
             self.fail(asset, amount, _algo_datetime)
 
+    def validate_batch(self,
+                       batch,
+                       _portfolio,
+                       algo_datetime,
+                       _algo_current_data):
+        """
+        Fail if we would hold negative shares of any asset after completing
+        the batch.
+        """
+        self.fail_first(
+            batch,
+            batch.position_amounts + batch.amounts < 0,
+            algo_datetime,
+        )
+
 
 class AssetDateBounds(TradingControl):
     """
@@ -318,6 +554,47 @@ class AssetDateBounds(TradingControl):
                 }
                 self.fail(asset, amount, algo_datetime, metadata=metadata)
 
+    def validate_batch(self,
+                       batch,
+                       _portfolio,
+                       algo_datetime,
+                       _algo_current_data):
+        """
+        Fail if the algo is outside of the dates of any asset ordered in the
+        batch.
+        """
+        normalized_algo_dt = pd.Timestamp(algo_datetime).normalize().value
+        nat = pd.NaT.value
+
+        # Orders for 0 shares silently pass through.
+        ordered = batch.amounts != 0
+        start_dates = batch.start_dates
+        end_dates = batch.end_dates
+        too_early = ordered & (start_dates != nat) & (
+            normalized_algo_dt < start_dates
+        )
+        too_late = ordered & (end_dates != nat) & (
+            normalized_algo_dt > end_dates
+        )
+
+        violations = too_early | too_late
+        if not violations.any():
+            return
+
+        ix = np.flatnonzero(violations)[0]
+        if too_early[ix]:
+            metadata = {
+                'asset_start_date': pd.Timestamp(start_dates[ix], tz='UTC'),
+            }
+        else:
+            metadata = {
+                'asset_end_date': pd.Timestamp(end_dates[ix], tz='UTC'),
+            }
+        self.fail(batch.assets[ix],
+                  int(batch.amounts[ix]),
+                  algo_datetime,
+                  metadata=metadata)
+
 
 class AccountControl(with_metaclass(abc.ABCMeta)):
     """
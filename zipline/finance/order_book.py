@@ -0,0 +1,231 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compact storage for the orders placed by an algorithm.
+"""
+from array import array
+from collections import MutableMapping
+from itertools import chain
+import math
+from numbers import Integral
+
+import pandas as pd
+
+from zipline.finance.order import Order
+
+_NAT = pd.NaT.value
+
+
+def _dt_to_nanos(dt):
+    return _NAT if dt is None else dt.value
+
+
+def _nanos_to_dt(nanos):
+    return None if nanos == _NAT else pd.Timestamp(nanos, tz='UTC')
+
+
+def _price_to_float(price):
+    return float('nan') if price is None else price
+
+
+def _float_to_price(value):
+    return None if math.isnan(value) else value
+
+
+def _is_archivable(order):
+    """
+    Can ``order`` be archived without losing information?
+    """
+    if not (isinstance(order.amount, Integral) and
+            isinstance(order.filled, Integral)):
+        return False
+    for dt in order.dt, order.created:
+        if dt is not None and not (isinstance(dt, pd.Timestamp) and
+                                   dt.tz is not None):
+            return False
+    return True
+
+
+class ClosedOrders(object):
+    """
+    Columnar storage for closed orders.
+
+    Every field of an Order is stored in its own typed array, one row per
+    order. The few fields that are usually None are stored sparsely. This
+    takes a fraction of the memory of the Order objects and leaves nothing
+    for the garbage collector to traverse.
+    """
+    def __init__(self):
+        self.rows = {}
+        self.assets = {}
+        self.sids = array('q')
+        self.dts = array('q')
+        self.created = array('q')
+        self.amounts = array('q')
+        self.filled = array('q')
+        self.commissions = array('d')
+        self.statuses = array('b')
+        self.stops = array('d')
+        self.limits = array('d')
+        self.stops_reached = array('b')
+        self.limits_reached = array('b')
+        self.reasons = {}
+        self.broker_order_ids = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, order_id):
+        return order_id in self.rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def append(self, order):
+        """
+        Add a closed order.
+        """
+        row = len(self.sids)
+        self.rows[order.id] = row
+
+        asset = order.sid
+        self.assets[asset.sid] = asset
+        self.sids.append(asset.sid)
+        self.dts.append(_dt_to_nanos(order.dt))
+        self.created.append(_dt_to_nanos(order.created))
+        self.amounts.append(order.amount)
+        self.filled.append(order.filled)
+        self.commissions.append(order.commission)
+        self.statuses.append(order._status)
+        self.stops.append(_price_to_float(order.stop))
+        self.limits.append(_price_to_float(order.limit))
+        self.stops_reached.append(order.stop_reached)
+        self.limits_reached.append(order.limit_reached)
+        if order.reason is not None:
+            self.reasons[row] = order.reason
+        if order.broker_order_id is not None:
+            self.broker_order_ids[row] = order.broker_order_id
+
+    def get(self, order_id):
+        """
+        Rebuild an archived order.
+
+        Parameters
+        ----------
+        order_id : str
+            The id of the order.
+
+        Returns
+        -------
+        order : Order
+            A new Order with the fields of the archived order.
+
+        Raises
+        ------
+        KeyError
+            Raised if no order with this id was archived.
+        """
+        row = self.rows[order_id]
+        order = Order(
+            dt=_nanos_to_dt(self.dts[row]),
+            sid=self.assets[self.sids[row]],
+            amount=self.amounts[row],
+            stop=_float_to_price(self.stops[row]),
+            limit=_float_to_price(self.limits[row]),
+            filled=self.filled[row],
+            commission=self.commissions[row],
+            id=order_id,
+        )
+        order.created = _nanos_to_dt(self.created[row])
+        order._status = self.statuses[row]
+        order.stop_reached = bool(self.stops_reached[row])
+        order.limit_reached = bool(self.limits_reached[row])
+        order.reason = self.reasons.get(row)
+        order.broker_order_id = self.broker_order_ids.get(row)
+        return order
+
+
+class OrderBook(MutableMapping):
+    """
+    Mapping from order id to every order placed by an algorithm.
+
+    Orders are stored as Order objects until ``archive_closed`` moves the
+    closed ones into a ClosedOrders table, so the memory used by a long
+    simulation grows with the number of orders by a few dozen bytes per order
+    instead of by a few Order and Timestamp objects.
+
+    Looking up an archived order rebuilds it, so the result has the fields of
+    the order that was archived but is not the same object. Changes made to it
+    are not saved.
+    """
+    def __init__(self):
+        self._live = {}
+        self._closed = ClosedOrders()
+
+    def __getitem__(self, order_id):
+        try:
+            return self._live[order_id]
+        except KeyError:
+            return self._closed.get(order_id)
+
+    def __setitem__(self, order_id, order):
+        if order_id in self._closed:
+            raise ValueError(
+                "Can't replace the archived order %r." % order_id,
+            )
+        self._live[order_id] = order
+
+    def __delitem__(self, order_id):
+        if order_id in self._closed:
+            raise ValueError(
+                "Can't delete the archived order %r." % order_id,
+            )
+        del self._live[order_id]
+
+    def __contains__(self, order_id):
+        return order_id in self._live or order_id in self._closed
+
+    def __iter__(self):
+        return chain(self._closed, self._live)
+
+    def __len__(self):
+        return len(self._live) + len(self._closed)
+
+    def __repr__(self):
+        return '<%s: %d live, %d archived>' % (
+            type(self).__name__,
+            len(self._live),
+            len(self._closed),
+        )
+
+    def archive_closed(self, keep=()):
+        """
+        Move the closed orders into compact storage.
+
+        Parameters
+        ----------
+        keep : container[str], optional
+            The ids of orders to keep as objects even if they are closed, for
+            example because their status hasn't been relayed yet.
+        """
+        archived = [
+            order_id
+            for order_id, order in self._live.items()
+            if (not order.open and
+                order_id not in keep and
+                _is_archivable(order))
+        ]
+        for order_id in archived:
+            self._closed.append(self._live.pop(order_id))
@@ -17,10 +17,15 @@ from . tracker import PerformanceTracker
 from . period import PerformancePeriod
 from . position import Position
 from . position_tracker import PositionTracker
+from . sink import StreamedResults, StreamingResultsWriter
+from . stats import DailyStatsRecorder
 
 __all__ = [
+    'DailyStatsRecorder',
     'PerformanceTracker',
     'PerformancePeriod',
     'Position',
     'PositionTracker',
+    'StreamedResults',
+    'StreamingResultsWriter',
 ]
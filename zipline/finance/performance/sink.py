@@ -0,0 +1,378 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pickle
+
+import pandas as pd
+
+from zipline.utils.cache import working_file
+from zipline.utils.paths import ensure_directory
+from .stats import DailyStatsRecorder, RECORD_FIELDS
+
+DAILY_DIR = 'daily'
+RISK_REPORT_FILE = 'risk_report.pickle'
+PERIOD_CLOSE_FIELD = 'period_close'
+
+
+def _chunk_name(year, sequence):
+    return '%04d-%06d.pickle' % (year, sequence)
+
+
+def _chunk_year(name):
+    return int(name.split('-', 1)[0])
+
+
+def _chunk_sequence(name):
+    return int(name.split('-', 1)[1].split('.', 1)[0])
+
+
+def _utc(dt):
+    dt = pd.Timestamp(dt)
+    if dt.tz is None:
+        return dt.tz_localize('UTC')
+    return dt.tz_convert('UTC')
+
+
+def _dump(obj, path):
+    # Write through a temporary file so that a crash never leaves a partially
+    # written file behind.
+    with working_file(path) as wf, open(wf.path, 'wb') as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class StreamingResultsWriter(object):
+    """
+    Writes the daily performance of a simulation to disk as it runs.
+
+    Daily packets are buffered for at most ``chunksize`` sessions and then
+    written to a new chunk file. Chunks never span more than one year, so
+    reading part of a long simulation only reads the years that were
+    requested. The memory used by the writer doesn't grow with the length of
+    the simulation, and the chunks that were written before a crash can still
+    be read.
+
+    The on-disk layout is::
+
+        <path>/daily/<year>-<seq>.pickle          scalar metrics
+        <path>/transactions/<year>-<seq>.pickle   one row per transaction
+        <path>/orders/<year>-<seq>.pickle         one row per order
+        <path>/positions/<year>-<seq>.pickle      one row per position
+        <path>/risk_report.pickle                 written by ``close``
+
+    Record tables have one column per field of the records plus a
+    ``period_close`` column.
+
+    Parameters
+    ----------
+    path : str
+        The directory to write the results to.
+    chunksize : int, optional
+        The maximum number of sessions to buffer in memory.
+
+    See Also
+    --------
+    zipline.finance.performance.sink.StreamedResults
+    zipline.algorithm.TradingAlgorithm.run
+    """
+    def __init__(self, path, chunksize=63):
+        self.path = path
+        self._chunksize = chunksize
+        self._sequence = 0
+        self._buffer = DailyStatsRecorder(chunksize)
+        self._buffer_year = None
+        self.risk_report = None
+
+        for name in (DAILY_DIR,) + tuple(sorted(RECORD_FIELDS)):
+            ensure_directory(os.path.join(path, name))
+
+    def __repr__(self):
+        return '<%s: path=%r>' % (type(self).__name__, self.path)
+
+    def record(self, packet):
+        """
+        Record a performance packet.
+
+        Parameters
+        ----------
+        packet : dict
+            A packet emitted by ``TradingAlgorithm.get_generator``.
+
+        See Also
+        --------
+        zipline.finance.performance.stats.DailyStatsRecorder.record
+        """
+        try:
+            daily_perf = packet['daily_perf']
+        except KeyError:
+            self.risk_report = packet
+            return
+
+        year = pd.Timestamp(daily_perf[PERIOD_CLOSE_FIELD]).year
+        if (self._buffer_year is not None and year != self._buffer_year or
+                len(self._buffer) == self._chunksize):
+            self.flush()
+        self._buffer_year = year
+        self._buffer.record(packet)
+
+    def _write(self, directory, frame):
+        _dump(
+            frame,
+            os.path.join(
+                self.path,
+                directory,
+                _chunk_name(self._buffer_year, self._sequence),
+            ),
+        )
+
+    def flush(self):
+        """
+        Write the buffered sessions to disk.
+        """
+        if not len(self._buffer):
+            return
+
+        frame = self._buffer.to_frame()
+        for field in RECORD_FIELDS:
+            if field not in frame.columns:
+                continue
+
+            rows = []
+            for period_close, records in frame.pop(field).iteritems():
+                for record in records:
+                    row = dict(record)
+                    row[PERIOD_CLOSE_FIELD] = period_close
+                    rows.append(row)
+            # dtype=object keeps the values exactly as they were emitted so
+            # that the records can be round-tripped.
+            self._write(field, pd.DataFrame(rows, dtype=object))
+
+        self._write(DAILY_DIR, frame)
+
+        self._sequence += 1
+        self._buffer = DailyStatsRecorder(self._chunksize)
+        self._buffer_year = None
+
+    def close(self):
+        """
+        Flush the remaining sessions and write the risk report.
+
+        Returns
+        -------
+        results : StreamedResults
+            A reader for the written results.
+        """
+        self.flush()
+        if self.risk_report is not None:
+            _dump(self.risk_report, os.path.join(self.path, RISK_REPORT_FILE))
+        return StreamedResults(self.path)
+
+    def rollback(self):
+        """
+        Remove the files written after this writer's current position.
+
+        This is used when a simulation is resumed from a checkpoint: the
+        chunks written between the checkpoint and the interruption are
+        written again by the resumed simulation.
+        """
+        for directory in (DAILY_DIR,) + tuple(sorted(RECORD_FIELDS)):
+            dirpath = os.path.join(self.path, directory)
+            for name in os.listdir(dirpath):
+                if (name.endswith('.pickle') and
+                        _chunk_sequence(name) >= self._sequence):
+                    os.remove(os.path.join(dirpath, name))
+
+        try:
+            os.remove(os.path.join(self.path, RISK_REPORT_FILE))
+        except OSError:
+            pass
+
+
+class StreamedResults(object):
+    """
+    Reader for the results written by a StreamingResultsWriter.
+
+    Nothing is loaded until it is requested, and only the chunks of the
+    requested years are read.
+
+    Parameters
+    ----------
+    path : str
+        The directory the results were written to.
+    """
+    def __init__(self, path):
+        self.path = path
+
+    def __repr__(self):
+        return '<%s: path=%r>' % (type(self).__name__, self.path)
+
+    def _read(self, directory, start, end):
+        dirpath = os.path.join(self.path, directory)
+        try:
+            names = sorted(
+                name for name in os.listdir(dirpath)
+                if name.endswith('.pickle')
+            )
+        except OSError:
+            names = []
+
+        if start is not None:
+            start = _utc(start)
+            names = [n for n in names if _chunk_year(n) >= start.year]
+        if end is not None:
+            end = _utc(end)
+            names = [n for n in names if _chunk_year(n) <= end.year]
+
+        frames = []
+        for name in names:
+            with open(os.path.join(dirpath, name), 'rb') as f:
+                frames.append(pickle.load(f))
+        return frames, start, end
+
+    def daily_stats(self, start=None, end=None):
+        """
+        Load the scalar metrics of each session.
+
+        Parameters
+        ----------
+        start, end : datetime, optional
+            The sessions to load. By default all of the sessions are loaded.
+
+        Returns
+        -------
+        daily_stats : pd.DataFrame
+            The scalar columns of the perf frame.
+        """
+        frames, start, end = self._read(DAILY_DIR, start, end)
+        if not frames:
+            return pd.DataFrame(index=pd.DatetimeIndex([], tz='UTC'))
+        daily_stats = pd.concat(frames).loc[start:end]
+        # Re-infer the dtypes of the combined columns: a chunk where a metric
+        # was always None has an object column even if the metric is a float
+        # everywhere else.
+        return pd.DataFrame(
+            {
+                name: column.tolist()
+                for name, column in daily_stats.iteritems()
+            },
+            index=daily_stats.index,
+        )
+
+    def records(self, field, start=None, end=None):
+        """
+        Load the transactions, orders or positions of each session.
+
+        Parameters
+        ----------
+        field : {'transactions', 'orders', 'positions'}
+            The records to load.
+        start, end : datetime, optional
+            The sessions to load. By default all of the sessions are loaded.
+
+        Returns
+        -------
+        records : pd.DataFrame
+            One row per record, with a ``period_close`` column holding the
+            close of the session the record was emitted in.
+        """
+        if field not in RECORD_FIELDS:
+            raise ValueError(
+                "field must be one of %s, got %r" % (
+                    sorted(RECORD_FIELDS),
+                    field,
+                )
+            )
+        frames, start, end = self._read(field, start, end)
+        frames = [f for f in frames if len(f)]
+        if not frames:
+            return pd.DataFrame(columns=[PERIOD_CLOSE_FIELD])
+
+        records = pd.concat(frames, ignore_index=True)
+        period_closes = pd.DatetimeIndex(records[PERIOD_CLOSE_FIELD])
+        keep = pd.Series(True, index=records.index)
+        if start is not None:
+            keep &= period_closes >= start
+        if end is not None:
+            keep &= period_closes <= end
+        return records[keep.values].reset_index(drop=True)
+
+    @property
+    def risk_report(self):
+        """
+        The risk report emitted at the end of the simulation, or None if the
+        simulation didn't finish.
+        """
+        try:
+            with open(os.path.join(self.path, RISK_REPORT_FILE), 'rb') as f:
+                return pickle.load(f)
+        except IOError:
+            return None
+
+    def to_frame(self, start=None, end=None):
+        """
+        Reassemble the perf frame returned by ``TradingAlgorithm.run``.
+
+        Parameters
+        ----------
+        start, end : datetime, optional
+            The sessions to load. By default all of the sessions are loaded.
+
+        Returns
+        -------
+        perf : pd.DataFrame
+        """
+        daily_stats = self.daily_stats(start, end).copy()
+        for field in RECORD_FIELDS:
+            if not os.listdir(os.path.join(self.path, field)):
+                # The simulation didn't emit these records.
+                continue
+
+            by_close = {close: [] for close in daily_stats.index}
+            records = self.records(field, start, end)
+            columns = [c for c in records.columns if c != PERIOD_CLOSE_FIELD]
+            for close, row in zip(records[PERIOD_CLOSE_FIELD],
+                                  records[columns].itertuples(index=False)):
+                by_close[pd.Timestamp(close)].append(dict(zip(columns, row)))
+            daily_stats[field] = [by_close[c] for c in daily_stats.index]
+
+        return daily_stats.reindex_axis(sorted(daily_stats.columns), axis=1)
+
+    def to_pickle(self, path):
+        """
+        Write the reassembled perf frame to a pickle file.
+        """
+        self.to_frame().to_pickle(path)
+
+    def summary(self):
+        """
+        Describe the results for printing.
+
+        Only the scalar metrics of each session are loaded. The transactions,
+        orders and positions are left on disk.
+
+        Returns
+        -------
+        summary : str
+            The daily stats, followed by where the full results can be loaded
+            from.
+        """
+        return (
+            '%s\n\nThe full results were streamed to %s. Load them with'
+            ' %s(%r).to_frame().' % (
+                self.daily_stats(),
+                self.path,
+                type(self).__name__,
+                self.path,
+            )
+        )
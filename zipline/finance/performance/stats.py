@@ -0,0 +1,191 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from numbers import Integral, Real
+
+import numpy as np
+import pandas as pd
+from six import iteritems
+
+# Fields of the daily performance packet that hold lists of records rather
+# than scalars.
+RECORD_FIELDS = frozenset(['positions', 'transactions', 'orders'])
+
+# The kinds of column, from narrowest to widest. A column is widened when a
+# value that it can't hold is written to it.
+_KINDS = 'ifO'
+_DTYPES = {'i': np.int64, 'f': np.float64, 'O': object}
+
+
+def _value_kind(value):
+    if isinstance(value, bool) or not isinstance(value, Real):
+        return 'O'
+    if isinstance(value, Integral):
+        return 'i'
+    return 'f'
+
+
+def _allocate(kind, capacity):
+    if kind == 'f':
+        return np.full(capacity, np.nan)
+    return np.empty(capacity, dtype=_DTYPES[kind])
+
+
+class DailyStatsRecorder(object):
+    """
+    Accumulates daily performance packets column by column.
+
+    Each field of the daily packets is written into its own preallocated
+    array, so building the final ``perf`` frame doesn't require keeping a
+    dict per session alive for the whole simulation. Numeric fields are
+    stored in int64 or float64 arrays; the record fields and any other values
+    are stored in object arrays.
+
+    Parameters
+    ----------
+    capacity : int
+        The expected number of sessions. The arrays grow if more packets are
+        recorded.
+    metrics_only : bool, optional
+        Don't record the positions, transactions and orders of each session.
+
+    See Also
+    --------
+    zipline.algorithm.TradingAlgorithm.run
+    """
+    def __init__(self, capacity, metrics_only=False):
+        self._capacity = max(capacity, 1)
+        self._metrics_only = metrics_only
+        self._columns = {}
+        # The number of rows written to each column, counting the missing
+        # rows before its last write.
+        self._filled = {}
+        self._period_closes = np.empty(self._capacity, dtype=np.int64)
+        self._count = 0
+        self.risk_report = None
+
+    def __len__(self):
+        return self._count
+
+    def _grow(self):
+        capacity = self._capacity * 2
+        for name, column in iteritems(self._columns):
+            grown = _allocate(column.dtype.kind, capacity)
+            grown[:self._capacity] = column
+            self._columns[name] = grown
+        period_closes = np.empty(capacity, dtype=np.int64)
+        period_closes[:self._capacity] = self._period_closes
+        self._period_closes = period_closes
+        self._capacity = capacity
+
+    def _widen(self, name, column, kind):
+        filled = self._filled[name]
+        if column.dtype.kind == 'i' and filled < self._count:
+            # Integer columns can't hold the missing rows.
+            kind = max(kind, 'f', key=_KINDS.index)
+        if _KINDS.index(kind) <= _KINDS.index(column.dtype.kind):
+            return column
+
+        widened = column.astype(_DTYPES[kind])
+        if column.dtype.kind == 'i':
+            widened[filled:] = np.nan
+        self._columns[name] = widened
+        return widened
+
+    def _write(self, name, value):
+        count = self._count
+        column = self._columns.get(name)
+        if column is None:
+            kind = 'O' if name in RECORD_FIELDS else _value_kind(value)
+            if kind == 'i' and count:
+                # Fields that first appear part way through the simulation
+                # (for example newly recorded variables) are missing before
+                # that.
+                kind = 'f'
+            column = self._columns[name] = _allocate(kind, self._capacity)
+        elif column.dtype.kind != 'O':
+            column = self._widen(
+                name,
+                column,
+                'f' if value is None else _value_kind(value),
+            )
+
+        if value is None and column.dtype.kind == 'f':
+            value = np.nan
+        column[count] = value
+        self._filled[name] = count + 1
+
+    def record(self, packet):
+        """
+        Record a performance packet.
+
+        Packets with a ``daily_perf`` section add a row to the stats. Any
+        other packet is remembered as the risk report, which is the last
+        packet emitted by a simulation.
+
+        Parameters
+        ----------
+        packet : dict
+            A packet emitted by ``TradingAlgorithm.get_generator``.
+        """
+        try:
+            daily_perf = packet['daily_perf']
+        except KeyError:
+            self.risk_report = packet
+            return
+
+        if self._count == self._capacity:
+            self._grow()
+
+        write = self._write
+        skip = RECORD_FIELDS if self._metrics_only else ()
+        # Later sections overwrite earlier ones, as in the dict based
+        # implementation.
+        for name, value in iteritems(daily_perf):
+            if name != 'recorded_vars' and name not in skip:
+                write(name, value)
+        for name, value in iteritems(daily_perf.get('recorded_vars', {})):
+            write(name, value)
+        for name, value in iteritems(packet['cumulative_risk_metrics']):
+            write(name, value)
+
+        self._period_closes[self._count] = pd.Timestamp(
+            daily_perf['period_close'],
+        ).value
+        self._count += 1
+
+    def to_frame(self):
+        """
+        Build the daily stats DataFrame.
+
+        Returns
+        -------
+        daily_stats : pd.DataFrame
+            A frame indexed by each session's close, with one column per field
+            of the recorded packets.
+        """
+        count = self._count
+        index = pd.DatetimeIndex(
+            self._period_closes[:count].astype('datetime64[ns]'),
+            tz='UTC',
+        )
+        columns = {}
+        for name, column in list(iteritems(self._columns)):
+            column = self._widen(name, column, column.dtype.kind)[:count]
+            if column.dtype.kind == 'O':
+                # Converting through lists lets pandas infer the dtype of
+                # the column the same way it does for a list of dicts.
+                column = column.tolist()
+            columns[name] = column
+        return pd.DataFrame(columns, index=index)
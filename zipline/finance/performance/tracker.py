@@ -76,8 +76,20 @@ log = logbook.Logger('Performance')
 class PerformanceTracker(object):
     """
     Tracks the performance of the algorithm.
+
+    Parameters
+    ----------
+    sim_params : SimulationParameters
+        The parameters of the simulation.
+    trading_calendar : TradingCalendar
+        The calendar of the simulation.
+    env : TradingEnvironment
+        The environment of the simulation.
+    metrics_only : bool, optional
+        Don't include positions, transactions and orders in the daily and
+        minute performance packets.
     """
-    def __init__(self, sim_params, trading_calendar, env):
+    def __init__(self, sim_params, trading_calendar, env, metrics_only=False):
         self.sim_params = sim_params
         self.trading_calendar = trading_calendar
         self.asset_finder = env.asset_finder
@@ -113,11 +125,8 @@ class PerformanceTracker(object):
                     self.trading_calendar
                 )
         elif self.emission_rate == 'minute':
-            self.all_benchmark_returns = pd.Series(index=pd.date_range(
-                self.sim_params.first_open, self.sim_params.last_close,
-                freq='Min')
-            )
-
+            # The benchmark's return since the open is passed to
+            # handle_minute_close, so there is no per-minute series.
             self.cumulative_risk_metrics = \
                 risk.RiskMetricsCumulative(
                     self.sim_params,
@@ -154,9 +163,9 @@ class PerformanceTracker(object):
             # the daily period will be calculated for the market day
             period_open=self.market_open,
             period_close=self.market_close,
-            keep_transactions=True,
-            keep_orders=True,
-            serialize_positions=True,
+            keep_transactions=not metrics_only,
+            keep_orders=not metrics_only,
+            serialize_positions=not metrics_only,
             asset_finder=self.asset_finder,
             name="Daily"
         )
@@ -331,7 +340,7 @@ class PerformanceTracker(object):
         self.cumulative_performance.handle_dividends_paid(net_cash_payment)
         self.todays_performance.handle_dividends_paid(net_cash_payment)
 
-    def handle_minute_close(self, dt, data_portal):
+    def handle_minute_close(self, dt, data_portal, benchmark_since_open):
         """
         Handles the close of the given minute in minute emission.
 
@@ -339,6 +348,10 @@ class PerformanceTracker(object):
         __________
         dt : Timestamp
             The minute that is ending
+        benchmark_since_open : float
+            The return of the benchmark from the start of the day up to
+            ``dt``, as returned by
+            ``BenchmarkSource.get_return_since_open``.
 
         Returns
         _______
@@ -349,13 +362,9 @@ class PerformanceTracker(object):
         todays_date = normalize_date(dt)
         account = self.get_account(False)
 
-        bench_returns = self.all_benchmark_returns.loc[todays_date:dt]
-        # cumulative returns
-        bench_since_open = (1. + bench_returns).prod() - 1
-
         self.cumulative_risk_metrics.update(todays_date,
                                             self.todays_performance.returns,
-                                            bench_since_open,
+                                            benchmark_since_open,
                                             account.leverage)
 
         minute_packet = self.to_dict(emission_type='minute')
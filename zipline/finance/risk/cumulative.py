@@ -23,6 +23,7 @@ from pandas.tseries.tools import normalize_date
 from six import iteritems
 
 from . risk import (
+    as_treasury_curves,
     check_entry,
     choose_treasury
 )
@@ -66,6 +67,7 @@ class RiskMetricsCumulative(object):
     def __init__(self, sim_params, treasury_curves, trading_calendar,
                  create_first_day_stats=False):
         self.treasury_curves = treasury_curves
+        self._treasury_curves = as_treasury_curves(treasury_curves)
         self.trading_calendar = trading_calendar
         self.start_session = sim_params.start_session
         self.end_session = sim_params.end_session
@@ -137,7 +139,9 @@ class RiskMetricsCumulative(object):
         self.max_leverages = empty_cont.copy()
         self.max_leverage = 0
         self.current_max = -np.inf
-        self.daily_treasury = pd.Series(index=self.sessions)
+        # The treasury return of each session, filled in as it is first
+        # needed.
+        self.daily_treasury = np.full(len(self.sessions), np.nan)
         self.treasury_period_return = np.nan
 
         self.num_trading_days = 0
@@ -241,17 +245,17 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
         # caching the treasury rates for the minutely case is a
         # big speedup, because it avoids searching the treasury
         # curves on every minute.
-        # In both minutely and daily, the daily curve is always used.
-        treasury_end = dt.replace(hour=0, minute=0)
-        if np.isnan(self.daily_treasury[treasury_end]):
-            treasury_period_return = choose_treasury(
-                self.treasury_curves,
+        # In both minutely and daily, the daily curve is always used. ``dt``
+        # is always a session, so ``dt_loc`` is also its position in
+        # ``daily_treasury``.
+        if np.isnan(self.daily_treasury[dt_loc]):
+            self.daily_treasury[dt_loc] = choose_treasury(
+                self._treasury_curves,
                 self.start_session,
-                treasury_end,
+                dt.replace(hour=0, minute=0),
                 self.trading_calendar,
             )
-            self.daily_treasury[treasury_end] = treasury_period_return
-        self.treasury_period_return = self.daily_treasury[treasury_end]
+        self.treasury_period_return = self.daily_treasury[dt_loc]
         self.excess_returns[dt_loc] = (
             self.algorithm_cumulative_returns[dt_loc] -
             self.treasury_period_return)
@@ -45,15 +45,9 @@ choose_treasury = functools.partial(risk.choose_treasury,
 class RiskMetricsPeriod(object):
     def __init__(self, start_session, end_session, returns, trading_calendar,
                  treasury_curves, benchmark_returns, algorithm_leverages=None):
-        if treasury_curves.index[-1] >= start_session:
-            mask = ((treasury_curves.index >= start_session) &
-                    (treasury_curves.index <= end_session))
-
-            self.treasury_curves = treasury_curves[mask]
-        else:
-            # our test is beyond the treasury curve history
-            # so we'll use the last available treasury curve
-            self.treasury_curves = treasury_curves[-1:]
+        self._treasury_curves = risk.as_treasury_curves(
+            treasury_curves,
+        ).between(start_session, end_session)
 
         self._start_session = start_session
         self._end_session = end_session
@@ -75,6 +69,10 @@ class RiskMetricsPeriod(object):
 
         self.calculate_metrics()
 
+    @property
+    def treasury_curves(self):
+        return self._treasury_curves.frame
+
     def calculate_metrics(self):
         self.benchmark_period_returns = \
             cum_returns(self.benchmark_returns).iloc[-1]
@@ -106,7 +104,7 @@ class RiskMetricsPeriod(object):
         self.algorithm_volatility = annual_volatility(self.algorithm_returns)
 
         self.treasury_period_return = choose_treasury(
-            self.treasury_curves,
+            self._treasury_curves,
             self._start_session,
             self._end_session,
             self.trading_calendar,
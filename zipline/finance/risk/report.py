@@ -62,6 +62,7 @@ import datetime
 from dateutil.relativedelta import relativedelta
 
 from . period import RiskMetricsPeriod
+from . risk import as_treasury_curves
 
 log = logbook.Logger('Risk Report')
 
@@ -82,6 +83,8 @@ class RiskReport(object):
         self.sim_params = sim_params
         self.trading_calendar = trading_calendar
         self.treasury_curves = treasury_curves
+        # Shared by every period so that the curves are only indexed once.
+        self._treasury_curves = as_treasury_curves(treasury_curves)
         self.benchmark_returns = benchmark_returns
         self.algorithm_leverages = algorithm_leverages
 
@@ -151,7 +154,7 @@ class RiskReport(object):
                 returns=self.algorithm_returns,
                 benchmark_returns=self.benchmark_returns,
                 trading_calendar=self.trading_calendar,
-                treasury_curves=self.treasury_curves,
+                treasury_curves=self._treasury_curves,
                 algorithm_leverages=self.algorithm_leverages,
             )
 
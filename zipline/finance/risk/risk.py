@@ -58,6 +58,9 @@ Risk Report
 
 """
 
+from bisect import bisect_left
+from copy import copy
+
 import logbook
 import numpy as np
 
@@ -69,6 +72,17 @@ TREASURY_DURATIONS = [
     '1year', '2year', '3year', '5year',
     '7year', '10year', '30year'
 ]
+_TREASURY_DURATION_POSITIONS = {
+    duration: i for i, duration in enumerate(TREASURY_DURATIONS)
+}
+
+# The longest period, in days, that each of the TREASURY_DURATIONS but the
+# last is used for. Longer periods use the last duration.
+_TREASURY_DURATION_MAX_DAYS = [
+    31, 93, 186, 366,
+    365 * 2 + 1, 365 * 3 + 1, 365 * 5 + 2,
+    365 * 7 + 2, 365 * 10 + 2,
+]
 
 
 # check if a field in rval is nan, and replace it with
@@ -97,28 +111,177 @@ def get_treasury_rate(treasury_curves, treasury_duration, day):
 
 def select_treasury_duration(start_date, end_date):
     td = end_date - start_date
-    if td.days <= 31:
-        treasury_duration = '1month'
-    elif td.days <= 93:
-        treasury_duration = '3month'
-    elif td.days <= 186:
-        treasury_duration = '6month'
-    elif td.days <= 366:
-        treasury_duration = '1year'
-    elif td.days <= 365 * 2 + 1:
-        treasury_duration = '2year'
-    elif td.days <= 365 * 3 + 1:
-        treasury_duration = '3year'
-    elif td.days <= 365 * 5 + 2:
-        treasury_duration = '5year'
-    elif td.days <= 365 * 7 + 2:
-        treasury_duration = '7year'
-    elif td.days <= 365 * 10 + 2:
-        treasury_duration = '10year'
-    else:
-        treasury_duration = '30year'
+    return TREASURY_DURATIONS[
+        bisect_left(_TREASURY_DURATION_MAX_DAYS, td.days)
+    ]
+
+
+class TreasuryCurves(object):
+    """
+    Treasury curves stored as arrays for fast rate lookups.
+
+    The rates of each duration are stored in a contiguous float64 array, with
+    missing rates filled from the next longer duration like
+    ``get_treasury_rate``, and the dates are stored as int64 nanoseconds.
+    Finding the latest rate at or before a date is then a binary search and
+    an array lookup instead of a pandas search.
+
+    Parameters
+    ----------
+    treasury_curves : pd.DataFrame
+        The treasury curves, indexed by date with a column for each of the
+        ``TREASURY_DURATIONS``.
+    """
+    def __init__(self, treasury_curves):
+        self._frame = treasury_curves
+        self.index = treasury_curves.index
+        self.dates = self.index.asi8
+        self.first = 0
+        self.last = len(self.dates) - 1
+
+        shape = len(TREASURY_DURATIONS), len(self.dates)
+        self.rates = rates = np.full(shape, np.nan)
+        has_rate = np.zeros(shape, dtype=bool)
+        for i in reversed(range(len(TREASURY_DURATIONS))):
+            duration = TREASURY_DURATIONS[i]
+            if duration in treasury_curves:
+                column = treasury_curves[duration].values
+                if column.dtype == object:
+                    present = np.array([v is not None for v in column],
+                                       dtype=bool)
+                else:
+                    present = np.ones(len(column), dtype=bool)
+            else:
+                column = rates[i]
+                present = np.zeros(len(column), dtype=bool)
+
+            if i + 1 < len(TREASURY_DURATIONS):
+                rates[i] = np.where(present, column, rates[i + 1])
+                has_rate[i] = present | has_rate[i + 1]
+            else:
+                rates[i] = np.where(present, column, np.nan)
+                has_rate[i] = present
+
+        self.has_rate = has_rate
+        # The position of the latest date at or before each date with a rate
+        # for each duration, or -1.
+        self.last_rate_position = np.maximum.accumulate(
+            np.where(has_rate, np.arange(shape[1]), -1),
+            axis=1,
+        )
+
+    def __copy__(self):
+        # Share the arrays instead of rebuilding them with ``__reduce__``.
+        result = object.__new__(type(self))
+        result.__dict__.update(self.__dict__)
+        return result
+
+    def __reduce__(self):
+        # The arrays are cheap to rebuild, so only pickle the frame, which
+        # can be shared with the rest of the simulation.
+        return _unpickle_treasury_curves, (self._frame, self.first, self.last)
+
+    def __repr__(self):
+        return '<%s: %d dates>' % (
+            type(self).__name__,
+            self.last - self.first + 1,
+        )
+
+    @property
+    def frame(self):
+        """
+        The treasury curves between ``first`` and ``last`` as a DataFrame.
+        """
+        return self._frame.iloc[self.first:self.last + 1]
+
+    def between(self, start_session, end_session):
+        """
+        Restrict the curves to the dates in a range, or to the last date if
+        every date is before the range.
 
-    return treasury_duration
+        The returned object shares the arrays of this one.
+
+        Parameters
+        ----------
+        start_session : pd.Timestamp
+            The first date of the range.
+        end_session : pd.Timestamp
+            The last date of the range.
+
+        Returns
+        -------
+        treasury_curves : TreasuryCurves
+        """
+        dates = self.dates[self.first:self.last + 1]
+        result = copy(self)
+        if dates[-1] >= start_session.value:
+            result.first = self.first + dates.searchsorted(
+                start_session.value,
+            )
+            result.last = self.first + dates.searchsorted(
+                end_session.value,
+                side='right',
+            ) - 1
+        else:
+            # Our test is beyond the treasury curve history, so we'll use the
+            # last available treasury curve.
+            result.first = self.last
+        return result
+
+    def find_rate(self, treasury_duration, day):
+        """
+        Find the latest date at or before ``day`` with a rate for a duration.
+
+        Parameters
+        ----------
+        treasury_duration : str
+            One of the ``TREASURY_DURATIONS``.
+        day : pd.Timestamp
+            The date to search back from.
+
+        Returns
+        -------
+        position : int
+            The position of the date with the rate, or -1 if there is none.
+        exact : bool
+            Whether the rate is for ``day`` itself.
+        """
+        duration = _TREASURY_DURATION_POSITIONS[treasury_duration]
+        first, last = self.first, self.last
+        end = self.dates[first:last + 1].searchsorted(day.value) + first
+
+        if (end <= last and
+                self.dates[end] == day.value and
+                self.has_rate[duration, end]):
+            return end, True
+
+        # Like searching back through ``dates[end - 1::-1]``, wrap around to
+        # the last date if there are no dates before ``day``.
+        search_from = end - 1 if end > first else last
+        if search_from < first:
+            return -1, False
+        position = self.last_rate_position[duration, search_from]
+        if position < first:
+            return -1, False
+        return position, False
+
+
+def _unpickle_treasury_curves(frame, first, last):
+    treasury_curves = TreasuryCurves(frame)
+    treasury_curves.first = first
+    treasury_curves.last = last
+    return treasury_curves
+
+
+def as_treasury_curves(treasury_curves):
+    """
+    Convert a treasury curves DataFrame to TreasuryCurves.
+
+    TreasuryCurves are returned unchanged.
+    """
+    if isinstance(treasury_curves, TreasuryCurves):
+        return treasury_curves
+    return TreasuryCurves(treasury_curves)
 
 
 def choose_treasury(select_treasury, treasury_curves, start_session,
@@ -130,37 +293,30 @@ def choose_treasury(select_treasury, treasury_curves, start_session,
     If we find one but it's more than a trading day ago from the date we're
     looking for, then we log a warning
     """
+    treasury_curves = as_treasury_curves(treasury_curves)
     treasury_duration = select_treasury(start_session, end_session)
+    position, exact = treasury_curves.find_rate(treasury_duration,
+                                                end_session)
     search_day = None
 
-    if end_session in treasury_curves.index:
-        rate = get_treasury_rate(treasury_curves,
-                                 treasury_duration,
-                                 end_session)
-        if rate is not None:
+    if position >= 0:
+        rate = treasury_curves.rates[
+            _TREASURY_DURATION_POSITIONS[treasury_duration],
+            position,
+        ]
+        if exact:
             search_day = end_session
-
-    if not search_day:
-        # in case end date is not a trading day or there is no treasury
-        # data, search for the previous day with an interest rate.
-        search_days = treasury_curves.index
-
-        # Find rightmost value less than or equal to end_session
-        i = search_days.searchsorted(end_session)
-        for prev_day in search_days[i - 1::-1]:
-            rate = get_treasury_rate(treasury_curves,
-                                     treasury_duration,
-                                     prev_day)
-            if rate is not None:
-                search_day = prev_day
-                search_dist = trading_calendar.session_distance(
-                    end_session, prev_day
-                )
-                break
-
-        if search_day:
+        else:
+            # in case end date is not a trading day or there is no treasury
+            # data, use the previous day with an interest rate.
+            search_day = treasury_curves.index[position]
+            search_dist = trading_calendar.session_distance(
+                end_session, search_day
+            )
+            dates = treasury_curves.dates
             if (search_dist is None or search_dist > 1) and \
-                    search_days[0] <= end_session <= search_days[-1]:
+                    dates[treasury_curves.first] <= end_session.value <= \
+                    dates[treasury_curves.last]:
                 message = "No rate within 1 trading day of end date = \
 {dt} and term = {term}. Using {search_day}. Check that date doesn't exceed \
 treasury history range."
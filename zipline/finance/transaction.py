@@ -14,13 +14,14 @@
 # limitations under the License.
 from __future__ import division
 
-from copy import copy
-
 from zipline.assets import Asset
 from zipline.protocol import DATASOURCE_TYPE
 
 
 class Transaction(object):
+    # Simulations create a transaction for every fill, so keep them small.
+    __slots__ = ['sid', 'amount', 'dt', 'price', 'order_id', 'commission',
+                 'type']
 
     def __init__(self, sid, amount, dt, price, order_id, commission=None):
         assert isinstance(sid, Asset)
@@ -34,12 +35,14 @@ class Transaction(object):
         self.type = DATASOURCE_TYPE.TRANSACTION
 
     def __getitem__(self, name):
-        return self.__dict__[name]
+        if name not in self.__slots__:
+            raise KeyError(name)
+        return getattr(self, name)
 
     def to_dict(self):
-        py = copy(self.__dict__)
-        del py['type']
-        return py
+        return {name: getattr(self, name)
+                for name in self.__slots__
+                if name != 'type'}
 
 
 def create_transaction(order, dt, price, amount):
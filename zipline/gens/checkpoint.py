@@ -0,0 +1,371 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Snapshots of the state of a running simulation.
+"""
+import os
+import pickle
+
+from six import iteritems
+
+from zipline.errors import CheckpointMismatch, UnpicklableCheckpointState
+from zipline.finance.performance import StreamingResultsWriter
+from zipline.utils.cache import working_file
+
+CHECKPOINT_VERSION = 0
+
+# The attributes of a TradingAlgorithm that change as the simulation runs.
+# Everything else is either recreated by calling ``initialize`` again or is
+# part of the algorithm's context.
+ALGORITHM_STATE = (
+    'blotter',
+    'perf_tracker',
+    '_recorded_vars',
+    '_symbol_lookup_date',
+    'capital_change_deltas',
+)
+
+
+def _shared_objects(algo):
+    """
+    The objects that are shared with the rest of the simulation.
+
+    These are written to checkpoints by name and are replaced by the objects
+    of the resuming algorithm when a checkpoint is read.
+    """
+    env = algo.trading_environment
+    shared = {
+        'algorithm': algo,
+        'trading_environment': env,
+        'asset_finder': algo.asset_finder,
+        'benchmark_returns': env.benchmark_returns,
+        'treasury_curves': env.treasury_curves,
+        'trading_calendar': algo.trading_calendar,
+        'sim_params': algo.sim_params,
+        'data_portal': algo.data_portal,
+    }
+    return {name: obj for name, obj in iteritems(shared) if obj is not None}
+
+
+def _sim_params_key(sim_params):
+    return {
+        'start_session': sim_params.start_session,
+        'end_session': sim_params.end_session,
+        'capital_base': sim_params.capital_base,
+        'data_frequency': sim_params.data_frequency,
+        'emission_rate': sim_params.emission_rate,
+    }
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file, shared):
+        pickle.Pickler.__init__(self, file, pickle.HIGHEST_PROTOCOL)
+        self._shared_names = {id(obj): name for name, obj in iteritems(shared)}
+
+    def persistent_id(self, obj):
+        return self._shared_names.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, shared):
+        pickle.Unpickler.__init__(self, file)
+        self._shared = shared
+
+    def persistent_load(self, name):
+        try:
+            return self._shared[name]
+        except KeyError:
+            raise pickle.UnpicklingError(
+                "The checkpoint refers to a %r, but the resuming algorithm"
+                " doesn't have one." % name
+            )
+
+
+def _dumps(obj, shared):
+    with open(os.devnull, 'wb') as f:
+        _Pickler(f, shared).dump(obj)
+
+
+def context_attributes(algo):
+    """
+    Get the attributes that were set on an algorithm's context by the user's
+    code.
+
+    Parameters
+    ----------
+    algo : TradingAlgorithm
+        The algorithm to get the context of.
+
+    Returns
+    -------
+    context : dict[str -> any]
+    """
+    internal = algo._internal_attributes
+    return {
+        name: value
+        for name, value in iteritems(vars(algo))
+        if name not in internal
+    }
+
+
+class Checkpoint(object):
+    """
+    The state of a simulation at the close of a session.
+
+    Parameters
+    ----------
+    session : pd.Timestamp
+        The last session that was simulated.
+    recorder : DailyStatsRecorder or StreamingResultsWriter
+        The object recording the results of the simulation.
+    state : dict[str -> any]
+        The values of the attributes named in ``ALGORITHM_STATE``.
+    context : dict[str -> any]
+        The attributes of the algorithm's context.
+
+    See Also
+    --------
+    zipline.gens.checkpoint.CheckpointWriter
+    zipline.algorithm.TradingAlgorithm.resume
+    """
+    def __init__(self, session, recorder, state, context):
+        self.session = session
+        self.recorder = recorder
+        self.state = state
+        self.context = context
+
+    def __repr__(self):
+        return '<%s: session=%s>' % (type(self).__name__, self.session.date())
+
+    @classmethod
+    def capture(cls, algo, session, recorder):
+        """
+        Capture the current state of a simulation.
+
+        Parameters
+        ----------
+        algo : TradingAlgorithm
+            The running algorithm.
+        session : pd.Timestamp
+            The session that was just closed.
+        recorder : DailyStatsRecorder or StreamingResultsWriter
+            The object recording the results of the simulation.
+        """
+        return cls(
+            session,
+            recorder,
+            {name: getattr(algo, name) for name in ALGORITHM_STATE},
+            context_attributes(algo),
+        )
+
+    def write(self, path, algo):
+        """
+        Write the checkpoint to ``path``.
+
+        The file is replaced atomically, so the previous checkpoint is kept
+        if the process dies while writing.
+
+        Parameters
+        ----------
+        path : str
+            The file to write.
+        algo : TradingAlgorithm
+            The algorithm the checkpoint was captured from.
+
+        Raises
+        ------
+        UnpicklableCheckpointState
+            Raised if an attribute of the algorithm's context can't be
+            pickled.
+        """
+        shared = _shared_objects(algo)
+        header = {
+            'version': CHECKPOINT_VERSION,
+            'session': self.session,
+            'sim_params': _sim_params_key(algo.sim_params),
+        }
+        payload = {
+            'recorder': self.recorder,
+            'state': self.state,
+            'context': self.context,
+        }
+        with working_file(path) as wf, open(wf.path, 'wb') as f:
+            pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+            try:
+                _Pickler(f, shared).dump(payload)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                # Find the attribute of the context that can't be pickled to
+                # give a useful error.
+                for name, value in sorted(iteritems(self.context)):
+                    try:
+                        _dumps(value, shared)
+                    except (pickle.PicklingError,
+                            TypeError,
+                            AttributeError) as attr_error:
+                        raise UnpicklableCheckpointState(
+                            name=name,
+                            error=attr_error,
+                        )
+                raise e
+
+    @classmethod
+    def read(cls, path, algo):
+        """
+        Read a checkpoint written by ``Checkpoint.write``.
+
+        Parameters
+        ----------
+        path : str
+            The file to read.
+        algo : TradingAlgorithm
+            The algorithm that is resuming. The checkpoint's references to the
+            environment, calendar, asset finder and data are replaced by
+            ``algo``'s.
+
+        Raises
+        ------
+        CheckpointMismatch
+            Raised if the checkpoint was written by a different version of
+            zipline or for a simulation with different parameters.
+        """
+        with open(path, 'rb') as f:
+            header = pickle.load(f)
+            if header['version'] != CHECKPOINT_VERSION:
+                raise CheckpointMismatch(
+                    path=path,
+                    reason='unsupported checkpoint version %r' % (
+                        header['version'],
+                    ),
+                )
+            expected = _sim_params_key(algo.sim_params)
+            for key, value in sorted(iteritems(header['sim_params'])):
+                if expected[key] != value:
+                    raise CheckpointMismatch(
+                        path=path,
+                        reason='it was written with %s=%r, not %r' % (
+                            key,
+                            value,
+                            expected[key],
+                        ),
+                    )
+            payload = _Unpickler(f, _shared_objects(algo)).load()
+
+        return cls(
+            header['session'],
+            payload['recorder'],
+            payload['state'],
+            payload['context'],
+        )
+
+    def restore(self, algo):
+        """
+        Restore the state of ``algo`` from the checkpoint.
+
+        This should be called after ``initialize`` so that anything set by
+        ``initialize`` is overwritten by the state of the simulation.
+
+        Parameters
+        ----------
+        algo : TradingAlgorithm
+            The algorithm to restore.
+        """
+        for name, value in iteritems(self.state):
+            setattr(algo, name, value)
+        for name, value in iteritems(self.context):
+            setattr(algo, name, value)
+
+        algo.portfolio_needs_update = True
+        algo.account_needs_update = True
+        algo.performance_needs_update = True
+
+        if isinstance(self.recorder, StreamingResultsWriter):
+            self.recorder.rollback()
+
+
+class CheckpointWriter(object):
+    """
+    Periodically writes checkpoints of a running simulation.
+
+    Each checkpoint replaces the previous one. A simulation that is
+    interrupted can be continued from the last checkpoint with
+    ``TradingAlgorithm.resume``.
+
+    Parameters
+    ----------
+    path : str
+        The file to write the checkpoints to.
+    frequency : int, optional
+        The number of sessions between checkpoints.
+
+    Notes
+    -----
+    The results recorded so far are part of each checkpoint. For long
+    simulations, pass a ``results_sink`` to ``TradingAlgorithm.run`` so that
+    the results are written to disk instead of being rewritten in every
+    checkpoint.
+
+    See Also
+    --------
+    zipline.algorithm.TradingAlgorithm.run
+    zipline.algorithm.TradingAlgorithm.resume
+    """
+    def __init__(self, path, frequency=21):
+        if frequency < 1:
+            raise ValueError(
+                'frequency must be a positive number of sessions, got %r' % (
+                    frequency,
+                ),
+            )
+        self.path = path
+        self.frequency = frequency
+        self._sessions = 0
+
+    def __repr__(self):
+        return '<%s: path=%r, frequency=%d>' % (
+            type(self).__name__,
+            self.path,
+            self.frequency,
+        )
+
+    def record(self, algo, packet, recorder):
+        """
+        Count a performance packet, writing a checkpoint every ``frequency``
+        sessions.
+
+        This must be called after ``packet`` has been passed to ``recorder``
+        and before the simulation advances.
+
+        Parameters
+        ----------
+        algo : TradingAlgorithm
+            The running algorithm.
+        packet : dict
+            A packet emitted by ``TradingAlgorithm.get_generator``.
+        recorder : DailyStatsRecorder or StreamingResultsWriter
+            The object recording the results of the simulation.
+        """
+        try:
+            daily_perf = packet['daily_perf']
+        except KeyError:
+            return
+
+        self._sessions += 1
+        if self._sessions % self.frequency:
+            return
+
+        session = algo.trading_calendar.minute_to_session_label(
+            daily_perf['period_close'],
+        )
+        Checkpoint.capture(algo, session, recorder).write(self.path, algo)
@@ -115,3 +115,106 @@ cdef class MinuteSimulationClock:
             yield minute, BAR
             if minute_emission:
                 yield minute, MINUTE_END
+
+
+cdef class SparseMinuteSimulationClock:
+    """
+    A minute clock that skips the minutes at which the algorithm has nothing
+    to do.
+
+    Every session emits SESSION_START, BEFORE_TRADING_START_BAR and
+    SESSION_END like ``MinuteSimulationClock``, but BAR events are only
+    emitted at the trigger minutes, at the last minute of the session, and at
+    every minute while ``needs_every_minute()`` returns True.
+
+    Parameters
+    ----------
+    sessions : pd.DatetimeIndex
+        The sessions to simulate.
+    market_opens, market_closes : pd.Series
+        The first and last minute of each session.
+    before_trading_start_minutes : pd.DatetimeIndex
+        The minute at which ``before_trading_start`` runs in each session.
+    trigger_minutes : np.ndarray[int64]
+        The sorted minutes at which a BAR must be emitted, as nanoseconds since
+        the epoch.
+    needs_every_minute : callable[() -> bool]
+        Called before choosing each bar. While this returns True, for example
+        while the algorithm has open orders, every minute is emitted.
+    """
+    cdef np.int64_t[:] market_opens_nanos, market_closes_nanos, bts_nanos, \
+        sessions_nanos, trigger_nanos
+    cdef object needs_every_minute
+
+    def __init__(self,
+                 sessions,
+                 market_opens,
+                 market_closes,
+                 before_trading_start_minutes,
+                 trigger_minutes,
+                 needs_every_minute):
+        self.market_opens_nanos = market_opens.values.astype(np.int64)
+        self.market_closes_nanos = market_closes.values.astype(np.int64)
+        self.sessions_nanos = sessions.values.astype(np.int64)
+        self.bts_nanos = before_trading_start_minutes.values.astype(np.int64)
+        self.trigger_nanos = np.asarray(trigger_minutes, dtype=np.int64)
+        self.needs_every_minute = needs_every_minute
+
+    def __iter__(self):
+        cdef Py_ssize_t idx
+        cdef Py_ssize_t trigger_idx = 0
+        cdef Py_ssize_t num_triggers = len(self.trigger_nanos)
+        cdef np.int64_t[:] trigger_nanos = self.trigger_nanos
+        cdef np.int64_t market_open, market_close, bts, minute, bar
+        cdef bint bts_pending
+
+        needs_every_minute = self.needs_every_minute
+
+        for idx in range(len(self.sessions_nanos)):
+            yield pd.Timestamp(self.sessions_nanos[idx], tz='UTC'), \
+                SESSION_START
+
+            market_open = self.market_opens_nanos[idx]
+            market_close = self.market_closes_nanos[idx]
+            bts = self.bts_nanos[idx]
+
+            # Like MinuteSimulationClock, before_trading_start is not emitted
+            # if it is after the close.
+            bts_pending = bts <= market_close
+
+            # The first minute of the session that hasn't been considered.
+            minute = market_open
+            while minute <= market_close:
+                if bts_pending and bts <= minute:
+                    bts_pending = False
+                    yield pd.Timestamp(bts, tz='UTC'), \
+                        BEFORE_TRADING_START_BAR
+
+                if needs_every_minute():
+                    bar = minute
+                else:
+                    while (trigger_idx < num_triggers and
+                           trigger_nanos[trigger_idx] < minute):
+                        trigger_idx += 1
+
+                    if (trigger_idx < num_triggers and
+                            trigger_nanos[trigger_idx] < market_close):
+                        bar = trigger_nanos[trigger_idx]
+                    else:
+                        # The last minute of the session is always emitted.
+                        bar = market_close
+
+                    if bts_pending and bar >= bts:
+                        # Emit before_trading_start first, then choose the
+                        # next bar again, starting from the first minute at
+                        # or after it.
+                        minute = market_open + (
+                            (bts - market_open + _nanos_in_minute - 1) //
+                            _nanos_in_minute
+                        ) * _nanos_in_minute
+                        continue
+
+                yield pd.Timestamp(bar, tz='UTC'), BAR
+                minute = bar + _nanos_in_minute
+
+            yield pd.Timestamp(market_close, tz='UTC'), SESSION_END
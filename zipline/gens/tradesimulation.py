@@ -17,7 +17,7 @@ from logbook import Logger, Processor
 from pandas.tslib import normalize_date
 from zipline.protocol import BarData
 from zipline.utils.api_support import ZiplineAPI
-from six import viewkeys
+from six import iteritems, itervalues, viewkeys
 
 from zipline.gens.sim_engine import (
     BAR,
@@ -97,6 +97,39 @@ class AlgorithmSimulator(object):
         Main generator work loop.
         """
         algo = self.algo
+        handle_event = self.event_handler()
+
+        def on_exit():
+            # Remove references to algo, data portal, et al to break cycles
+            # and ensure deterministic cleanup of these objects when the
+            # simulation finishes.
+            self.algo = None
+            self.benchmark_source = self.current_data = self.data_portal = None
+
+        with ExitStack() as stack:
+            stack.callback(on_exit)
+            stack.enter_context(self.processor)
+            stack.enter_context(ZiplineAPI(self.algo))
+
+            for dt, action in self.clock:
+                for packet in handle_event(dt, action):
+                    yield packet
+
+        risk_message = algo.perf_tracker.handle_simulation_end()
+        yield risk_message
+
+    def event_handler(self):
+        """
+        Get the function that processes the events of the simulation clock.
+
+        Returns
+        -------
+        handle_event : callable[(pd.Timestamp, int) -> iterable[dict]]
+            A generator function that processes one event of the clock and
+            yields the performance packets that it produces. The algorithm
+            must be the current ZiplineAPI algorithm while it runs.
+        """
+        algo = self.algo
         emission_rate = algo.perf_tracker.emission_rate
 
         def every_bar(dt_to_use, current_data=self.current_data,
@@ -161,6 +194,10 @@ class AlgorithmSimulator(object):
             self.simulation_dt = midnight_dt
             algo.on_dt_changed(midnight_dt)
 
+            # The orders closed in earlier sessions have been relayed in the
+            # performance packets, so they no longer need to be objects.
+            algo.blotter.archive_closed_orders()
+
             # process any capital changes that came overnight
             for capital_change in algo.calculate_capital_changes(
                     midnight_dt, emission_rate=emission_rate,
@@ -187,61 +224,51 @@ class AlgorithmSimulator(object):
             algo.perf_tracker.all_benchmark_returns[date] = \
                 benchmark_source.get_value(date)
 
-        def on_exit():
-            # Remove references to algo, data portal, et al to break cycles
-            # and ensure deterministic cleanup of these objects when the
-            # simulation finishes.
-            self.algo = None
-            self.benchmark_source = self.current_data = self.data_portal = None
-
-        with ExitStack() as stack:
-            stack.callback(on_exit)
-            stack.enter_context(self.processor)
-            stack.enter_context(ZiplineAPI(self.algo))
-
-            if algo.data_frequency == 'minute':
-                def execute_order_cancellation_policy():
-                    algo.blotter.execute_cancel_policy(SESSION_END)
-
-                def calculate_minute_capital_changes(dt):
-                    # process any capital changes that came between the last
-                    # and current minutes
-                    return algo.calculate_capital_changes(
-                        dt, emission_rate=emission_rate, is_interday=False)
-            else:
-                def execute_order_cancellation_policy():
-                    pass
-
-                def calculate_minute_capital_changes(dt):
-                    return []
-
-            for dt, action in self.clock:
-                if action == BAR:
-                    for capital_change_packet in every_bar(dt):
-                        yield capital_change_packet
-                elif action == SESSION_START:
-                    for capital_change_packet in once_a_day(dt):
-                        yield capital_change_packet
-                elif action == SESSION_END:
-                    # End of the session.
-                    if emission_rate == 'daily':
-                        handle_benchmark(normalize_date(dt))
-                    execute_order_cancellation_policy()
-
-                    yield self._get_daily_message(dt, algo, algo.perf_tracker)
-                elif action == BEFORE_TRADING_START_BAR:
-                    self.simulation_dt = dt
-                    algo.on_dt_changed(dt)
-                    algo.before_trading_start(self.current_data)
-                elif action == MINUTE_END:
-                    handle_benchmark(dt)
-                    minute_msg = \
-                        self._get_minute_message(dt, algo, algo.perf_tracker)
-
-                    yield minute_msg
-
-        risk_message = algo.perf_tracker.handle_simulation_end()
-        yield risk_message
+        if algo.data_frequency == 'minute':
+            def execute_order_cancellation_policy():
+                algo.blotter.execute_cancel_policy(SESSION_END)
+
+            def calculate_minute_capital_changes(dt):
+                # process any capital changes that came between the last
+                # and current minutes
+                return algo.calculate_capital_changes(
+                    dt, emission_rate=emission_rate, is_interday=False)
+        else:
+            def execute_order_cancellation_policy():
+                pass
+
+            def calculate_minute_capital_changes(dt):
+                return []
+
+        def handle_event(dt, action, benchmark_source=self.benchmark_source):
+            if action == BAR:
+                for capital_change_packet in every_bar(dt):
+                    yield capital_change_packet
+            elif action == SESSION_START:
+                for capital_change_packet in once_a_day(dt):
+                    yield capital_change_packet
+            elif action == SESSION_END:
+                # End of the session.
+                if emission_rate == 'daily':
+                    handle_benchmark(normalize_date(dt))
+                execute_order_cancellation_policy()
+
+                yield self._get_daily_message(dt, algo, algo.perf_tracker)
+            elif action == BEFORE_TRADING_START_BAR:
+                self.simulation_dt = dt
+                algo.on_dt_changed(dt)
+                algo.before_trading_start(self.current_data)
+            elif action == MINUTE_END:
+                minute_msg = self._get_minute_message(
+                    dt,
+                    algo,
+                    algo.perf_tracker,
+                    benchmark_source.get_return_since_open(dt),
+                )
+
+                yield minute_msg
+
+        return handle_event
 
     def _cleanup_expired_assets(self, dt, position_assets):
         """
@@ -289,15 +316,236 @@ class AlgorithmSimulator(object):
         perf_message['daily_perf']['recorded_vars'] = algo.recorded_vars
         return perf_message
 
-    def _get_minute_message(self, dt, algo, perf_tracker):
+    def _get_minute_message(self, dt, algo, perf_tracker,
+                            benchmark_since_open):
         """
         Get a perf message for the given datetime.
         """
         rvars = algo.recorded_vars
 
         minute_message = perf_tracker.handle_minute_close(
-            dt, self.data_portal,
+            dt, self.data_portal, benchmark_since_open,
         )
 
         minute_message['minute_perf']['recorded_vars'] = rvars
         return minute_message
+
+
+class BarCache(object):
+    """
+    Wraps a data portal to remember the values read during one bar.
+
+    ``MultiAlgorithmSimulator`` gives this to the BarData that its algorithms
+    share, so a value requested by several algorithms in the same bar is read
+    from the underlying readers once. Every other attribute is forwarded to
+    the wrapped data portal.
+
+    Parameters
+    ----------
+    data_portal : DataPortal
+        The data portal to read through.
+    """
+    def __init__(self, data_portal):
+        self.data_portal = data_portal
+        self.dt = None
+        self._values = {}
+
+    def __getattr__(self, name):
+        return getattr(self.data_portal, name)
+
+    def set_dt(self, dt):
+        """
+        Move to a new simulation dt, forgetting the values of the last one.
+        """
+        if dt != self.dt:
+            self.dt = dt
+            self._values.clear()
+
+    def _cached(self, key, read, *args):
+        try:
+            return self._values[key]
+        except KeyError:
+            value = self._values[key] = read(*args)
+            return value
+        except TypeError:
+            # Lists of assets aren't hashable, so they are not cached.
+            return read(*args)
+
+    def get_spot_value(self, asset, field, dt, data_frequency):
+        return self._cached(
+            ('spot', asset, field, dt, data_frequency),
+            self.data_portal.get_spot_value,
+            asset,
+            field,
+            dt,
+            data_frequency,
+        )
+
+    def get_adjusted_value(self,
+                           asset,
+                           field,
+                           dt,
+                           perspective_dt,
+                           data_frequency,
+                           spot_value=None):
+        return self._cached(
+            ('adjusted', asset, field, dt, perspective_dt, data_frequency),
+            self.data_portal.get_adjusted_value,
+            asset,
+            field,
+            dt,
+            perspective_dt,
+            data_frequency,
+            spot_value,
+        )
+
+    def get_last_traded_dt(self, asset, dt, data_frequency):
+        return self._cached(
+            ('last_traded', asset, dt, data_frequency),
+            self.data_portal.get_last_traded_dt,
+            asset,
+            dt,
+            data_frequency,
+        )
+
+
+class MultiAlgorithmSimulator(object):
+    """
+    Runs many algorithms on one simulation clock.
+
+    Every event of the clock is dispatched to each algorithm in turn. The
+    algorithms and their performance trackers read through one ``BarCache``,
+    so a value requested by several of them in the same bar is read once,
+    while each algorithm keeps its own blotter and performance tracker.
+    History windows and pipeline results are not shared.
+
+    Parameters
+    ----------
+    simulators : dict[hashable -> AlgorithmSimulator]
+        The simulators of the algorithms to run. They must share a data
+        portal, and their simulation parameters must have the same sessions,
+        data frequency and emission rate.
+    clock : iterable[(pd.Timestamp, int)]
+        The clock that drives every algorithm.
+
+    See Also
+    --------
+    zipline.utils.sweep.run_multiplexed
+    """
+    def __init__(self, simulators, clock):
+        if not simulators:
+            raise ValueError('MultiAlgorithmSimulator needs at least one'
+                             ' simulator.')
+
+        first = next(iter(simulators.values()))
+        sim_params = first.sim_params
+        data_portal = first.data_portal
+
+        def key(sim_params):
+            return (
+                sim_params.start_session,
+                sim_params.end_session,
+                sim_params.data_frequency,
+                sim_params.emission_rate,
+            )
+
+        for name, simulator in iteritems(simulators):
+            if simulator.data_portal is not data_portal:
+                raise ValueError(
+                    'Simulator %r uses a different data portal.' % (name,),
+                )
+            if key(simulator.sim_params) != key(sim_params):
+                raise ValueError(
+                    'Simulator %r has different simulation parameters.' % (
+                        name,
+                    ),
+                )
+
+        self.simulators = simulators
+        self.sim_params = sim_params
+        self.data_portal = data_portal
+        self.clock = clock
+        self.simulation_dt = None
+
+        # One snapshot of the data for every algorithm, with the union of
+        # their legacy universes.
+        universe_funcs = [
+            simulator.algo._calculate_universe
+            for simulator in itervalues(simulators)
+        ]
+
+        def universe_func():
+            universe = set()
+            for func in universe_funcs:
+                universe.update(func())
+            return list(universe)
+
+        self.bar_cache = BarCache(data_portal)
+        self.current_data = BarData(
+            data_portal=self.bar_cache,
+            simulation_dt_func=self.get_simulation_dt,
+            data_frequency=sim_params.data_frequency,
+            trading_calendar=first.algo.trading_calendar,
+            universe_func=universe_func,
+        )
+        for simulator in itervalues(simulators):
+            simulator.current_data = self.current_data
+            # The performance trackers price positions through the
+            # simulator's data portal, so they share the cache too.
+            simulator.data_portal = self.bar_cache
+
+        def inject_algo_dt(record):
+            if 'algo_dt' not in record.extra:
+                record.extra['algo_dt'] = self.simulation_dt
+        self.processor = Processor(inject_algo_dt)
+
+    def get_simulation_dt(self):
+        return self.simulation_dt
+
+    def transform(self):
+        """
+        Main generator work loop.
+
+        Yields
+        ------
+        name : hashable
+            The name of the algorithm that emitted the packet.
+        packet : dict
+            A performance packet, as emitted by
+            ``AlgorithmSimulator.transform``.
+        """
+        handlers = [
+            (name, simulator.algo, simulator.event_handler())
+            for name, simulator in iteritems(self.simulators)
+        ]
+        sets_dt = frozenset([BAR, SESSION_START, BEFORE_TRADING_START_BAR])
+
+        def on_exit():
+            # Break the cycles between the simulators and their algorithms,
+            # as AlgorithmSimulator.transform does.
+            for simulator in itervalues(self.simulators):
+                simulator.algo = None
+                simulator.benchmark_source = simulator.current_data = \
+                    simulator.data_portal = None
+            self.current_data = self.data_portal = self.bar_cache = None
+
+        with ExitStack() as stack:
+            stack.callback(on_exit)
+            stack.enter_context(self.processor)
+
+            for dt, action in self.clock:
+                if action in sets_dt:
+                    self.simulation_dt = dt
+                    self.bar_cache.set_dt(dt)
+
+                for name, algo, handle_event in handlers:
+                    # Collect the packets so that no algorithm is left as
+                    # the current ZiplineAPI algorithm while we are
+                    # suspended.
+                    with ZiplineAPI(algo):
+                        packets = list(handle_event(dt, action))
+                    for packet in packets:
+                        yield name, packet
+
+        for name, algo, _ in handlers:
+            yield name, algo.perf_tracker.handle_simulation_end()
@@ -28,6 +28,10 @@ cdef class AdjustedArrayWindow:
 
     The arrays yielded by this iterator are always views over the underlying
     data.
+
+    Adjustments may be passed either as a dict mapping row indices to lists of
+    Adjustment objects, or as a Float64AdjustmentTable, which applies all of
+    its adjustments for a step in a single call.
     """
     cdef:
         # ctype must be defined by the file into which this is being copied.
@@ -37,19 +41,29 @@ cdef class AdjustedArrayWindow:
         Py_ssize_t anchor, next_anchor, max_anchor, next_adj
         dict adjustments
         list adjustment_indices
+        object adjustment_table
+        Py_ssize_t next_table_ix
         ndarray last_out
 
     def __cinit__(self,
                   databuffer data not None,
                   dict view_kwargs not None,
-                  dict adjustments not None,
+                  object adjustments not None,
                   Py_ssize_t offset,
                   Py_ssize_t window_length):
 
         self.data = data
         self.view_kwargs = view_kwargs
-        self.adjustments = adjustments
-        self.adjustment_indices = sorted(adjustments, reverse=True)
+        if isinstance(adjustments, dict):
+            self.adjustments = adjustments
+            self.adjustment_table = None
+        else:
+            self.adjustments = {}
+            # Empty tables are skipped entirely so that they can be used with
+            # windows over any type of data.
+            self.adjustment_table = adjustments if len(adjustments) else None
+        self.next_table_ix = 0
+        self.adjustment_indices = sorted(self.adjustments, reverse=True)
         self.window_length = window_length
         self.anchor = window_length + offset
         self.next_anchor = self.anchor
@@ -91,6 +105,13 @@ cdef class AdjustedArrayWindow:
 
             self.next_adj = self.pop_next_adj()
 
+        if self.adjustment_table is not None:
+            self.next_table_ix = self.adjustment_table.apply(
+                self.data,
+                self.next_table_ix,
+                anchor,
+            )
+
         start = anchor - self.window_length
 
         # If our data is a custom subclass of ndarray, preserve that subclass
@@ -17,6 +17,7 @@ from zipline.errors import (
     WindowLengthNotPositive,
     WindowLengthTooLong,
 )
+from zipline.lib.adjustment import Float64AdjustmentTable
 from zipline.lib.labelarray import LabelArray
 from zipline.utils.numpy_utils import (
     datetime64ns_dtype,
@@ -146,9 +147,10 @@ class AdjustedArray(object):
         The baseline data values.
     mask : np.ndarray[bool]
         A mask indicating the locations of missing data.
-    adjustments : dict[int -> list[Adjustment]]
+    adjustments : dict[int -> list[Adjustment]] or Float64AdjustmentTable
         A dict mapping row indices to lists of adjustments to apply when we
-        reach that row.
+        reach that row, or a packed table of adjustments.  Tables may only be
+        used with float64 data.
     missing_value : object
         A value to use to fill missing data in yielded windows.
         Should be a value coercible to `data.dtype`.
@@ -164,6 +166,14 @@ class AdjustedArray(object):
     def __init__(self, data, mask, adjustments, missing_value):
         self._data, self._view_kwargs = _normalize_array(data, missing_value)
 
+        if (isinstance(adjustments, Float64AdjustmentTable) and
+                len(adjustments) and
+                self._data.dtype != float64_dtype):
+            raise TypeError(
+                "Float64AdjustmentTable can't be used with data of type %s." %
+                self.dtype
+            )
+
         self.adjustments = adjustments
         self.missing_value = missing_value
 
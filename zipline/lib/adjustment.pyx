@@ -2,8 +2,8 @@
 from cpython cimport Py_EQ
 
 from pandas import isnull, Timestamp
-from numpy cimport float64_t, uint8_t, int64_t
-from numpy import datetime64, float64
+from numpy cimport float64_t, uint8_t, int64_t, ndarray
+from numpy import asarray, datetime64, float64, int64, uint8
 # Purely for readability. There aren't C-level declarations for these types.
 ctypedef object Int64Index_t
 ctypedef object DatetimeIndex_t
@@ -29,6 +29,9 @@ cdef dict _float_adjustment_types = {
 cdef dict _datetime_adjustment_types = {
     OVERWRITE: Datetime64Overwrite,
 }
+cdef dict _float_adjustment_kinds = {
+    type_: kind for kind, type_ in _float_adjustment_types.items()
+}
 
 cdef _is_float(object value):
     return isinstance(value, (float, float64))
@@ -592,3 +595,225 @@ cdef class ObjectOverwrite(_ObjectAdjustment):
         # code in the array's categories once.
         data[self.first_row:self.last_row + 1,
              self.first_col:self.last_col + 1] = self.value
+
+
+cdef class Float64AdjustmentTable:
+    """
+    A packed table of adjustments to float64 data.
+
+    Each entry of the table describes one MULTIPLY, ADD or OVERWRITE
+    adjustment.  Entries are stored in flat arrays sorted by the index at which
+    they are applied, so AdjustedArrayWindow can apply them in a single loop
+    instead of calling ``mutate`` on one Adjustment object at a time.
+
+    Parameters
+    ----------
+    adj_locs : np.ndarray[int64]
+        The index at which each adjustment is applied.  This is the key under
+        which the adjustment would be stored in a dict of adjustments.
+    first_rows : np.ndarray[int64]
+        The first row affected by each adjustment.
+    last_rows : np.ndarray[int64]
+        The last row affected by each adjustment.
+    first_cols : np.ndarray[int64]
+        The first column affected by each adjustment.
+    last_cols : np.ndarray[int64]
+        The last column affected by each adjustment.
+    kinds : np.ndarray[uint8]
+        The AdjustmentKind of each adjustment.
+    values : np.ndarray[float64]
+        The value of each adjustment.
+
+    Notes
+    -----
+    Adjustments with the same ``adj_loc`` are applied in the order in which
+    they are passed.
+    """
+    cdef:
+        readonly ndarray adj_locs
+        readonly ndarray first_rows
+        readonly ndarray last_rows
+        readonly ndarray first_cols
+        readonly ndarray last_cols
+        readonly ndarray kinds
+        readonly ndarray values
+
+        int64_t[:] _adj_locs
+        int64_t[:] _first_rows
+        int64_t[:] _last_rows
+        int64_t[:] _first_cols
+        int64_t[:] _last_cols
+        uint8_t[:] _kinds
+        float64_t[:] _values
+
+    def __init__(self,
+                 adj_locs,
+                 first_rows,
+                 last_rows,
+                 first_cols,
+                 last_cols,
+                 kinds,
+                 values):
+        cdef Py_ssize_t n
+
+        adj_locs = asarray(adj_locs, dtype=int64)
+        first_rows = asarray(first_rows, dtype=int64)
+        last_rows = asarray(last_rows, dtype=int64)
+        first_cols = asarray(first_cols, dtype=int64)
+        last_cols = asarray(last_cols, dtype=int64)
+        kinds = asarray(kinds, dtype=uint8)
+        values = asarray(values, dtype=float64)
+
+        n = len(adj_locs)
+        for array in (first_rows, last_rows, first_cols, last_cols, kinds,
+                      values):
+            if array.ndim != 1 or len(array) != n:
+                raise ValueError(
+                    "All the arrays of an adjustment table must be"
+                    " one-dimensional with the same length."
+                )
+        if ((first_rows < 0) | (first_rows > last_rows) |
+                (first_cols < 0) | (first_cols > last_cols)).any():
+            raise ValueError("Invalid adjustment bounds.")
+        if (kinds > OVERWRITE).any():
+            raise ValueError("Unknown adjustment kind.")
+
+        # Use a stable sort so that adjustments applied at the same index keep
+        # their order.
+        order = adj_locs.argsort(kind='mergesort')
+        self.adj_locs = adj_locs[order]
+        self.first_rows = first_rows[order]
+        self.last_rows = last_rows[order]
+        self.first_cols = first_cols[order]
+        self.last_cols = last_cols[order]
+        self.kinds = kinds[order]
+        self.values = values[order]
+
+        self._adj_locs = self.adj_locs
+        self._first_rows = self.first_rows
+        self._last_rows = self.last_rows
+        self._first_cols = self.first_cols
+        self._last_cols = self.last_cols
+        self._kinds = self.kinds
+        self._values = self.values
+
+    @classmethod
+    def from_dict(cls, dict adjustments):
+        """
+        Pack a dict of Float64Adjustment objects into a table.
+
+        Parameters
+        ----------
+        adjustments : dict[int -> list[Float64Adjustment]]
+            A dict mapping row indices to lists of adjustments to apply when
+            we reach that row.
+        """
+        cdef list adj_locs = []
+        cdef list first_rows = []
+        cdef list last_rows = []
+        cdef list first_cols = []
+        cdef list last_cols = []
+        cdef list kinds = []
+        cdef list values = []
+        cdef Float64Adjustment adjustment
+
+        for adj_loc in sorted(adjustments):
+            for adjustment in adjustments[adj_loc]:
+                adj_locs.append(adj_loc)
+                first_rows.append(adjustment.first_row)
+                last_rows.append(adjustment.last_row)
+                first_cols.append(adjustment.first_col)
+                last_cols.append(adjustment.last_col)
+                kinds.append(_float_adjustment_kinds[type(adjustment)])
+                values.append(adjustment.value)
+
+        return cls(
+            adj_locs,
+            first_rows,
+            last_rows,
+            first_cols,
+            last_cols,
+            kinds,
+            values,
+        )
+
+    def to_dict(self):
+        """
+        Unpack this table into a dict of Float64Adjustment objects.
+
+        Returns
+        -------
+        adjustments : dict[int -> list[Float64Adjustment]]
+            A dict mapping row indices to lists of adjustments to apply when
+            we reach that row.
+        """
+        cdef dict out = {}
+        cdef Py_ssize_t ix
+
+        for ix in range(len(self)):
+            adjustment = _float_adjustment_types[self._kinds[ix]](
+                self._first_rows[ix],
+                self._last_rows[ix],
+                self._first_cols[ix],
+                self._last_cols[ix],
+                self._values[ix],
+            )
+            try:
+                out[self._adj_locs[ix]].append(adjustment)
+            except KeyError:
+                out[self._adj_locs[ix]] = [adjustment]
+        return out
+
+    def __len__(self):
+        return self._adj_locs.shape[0]
+
+    def __repr__(self):
+        return "<%s: %d adjustments>" % (type(self).__name__, len(self))
+
+    cpdef Py_ssize_t apply(self,
+                           float64_t[:, :] data,
+                           Py_ssize_t start,
+                           Py_ssize_t stop_loc):
+        """
+        Apply adjustments to ``data`` in place, starting with the adjustment
+        at position ``start`` and stopping at the first adjustment whose
+        ``adj_loc`` is not less than ``stop_loc``.
+
+        Returns
+        -------
+        next_start : int
+            The position of the first adjustment that was not applied.
+        """
+        cdef:
+            Py_ssize_t ix = start
+            Py_ssize_t n = self._adj_locs.shape[0]
+            Py_ssize_t row, col
+            Py_ssize_t first_row, last_row, first_col, last_col
+            uint8_t kind
+            float64_t value
+
+        while ix < n and self._adj_locs[ix] < stop_loc:
+            first_row = self._first_rows[ix]
+            last_row = self._last_rows[ix]
+            first_col = self._first_cols[ix]
+            last_col = self._last_cols[ix]
+            kind = self._kinds[ix]
+            value = self._values[ix]
+
+            # last_col + 1 and last_row + 1 because the last column and row
+            # should also be affected.
+            if kind == MULTIPLY:
+                for col in range(first_col, last_col + 1):
+                    for row in range(first_row, last_row + 1):
+                        data[row, col] *= value
+            elif kind == ADD:
+                for col in range(first_col, last_col + 1):
+                    for row in range(first_row, last_row + 1):
+                        data[row, col] += value
+            else:
+                for col in range(first_col, last_col + 1):
+                    for row in range(first_row, last_row + 1):
+                        data[row, col] = value
+            ix += 1
+
+        return ix
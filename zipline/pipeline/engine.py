@@ -5,33 +5,43 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from functools import reduce
+from operator import or_
 from uuid import uuid4
 
 from six import (
     iteritems,
+    itervalues,
     with_metaclass,
 )
-from numpy import array
-from pandas import DataFrame, MultiIndex
+from six.moves import range
+from numpy import array, empty, recarray
+from pandas import DataFrame
 from toolz import groupby, juxt
 from toolz.curried.operator import getitem
 
-from zipline.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
+from zipline.lib.adjusted_array import (
+    AdjustedArray,
+    ensure_adjusted_array,
+    ensure_ndarray,
+)
 from zipline.errors import NoFurtherDataError
 from zipline.utils.numpy_utils import (
     as_column,
-    repeat_first_axis,
-    repeat_last_axis,
+    categorical_dtype,
 )
 from zipline.utils.pandas_utils import explode
 
+from .graph import ExecutionPlan
+from .mixins import DownsampledMixin
+from .results import PipelineResult
 from .term import AssetExists, InputDates, LoadableTerm
 
 
 class PipelineEngine(with_metaclass(ABCMeta)):
 
     @abstractmethod
-    def run_pipeline(self, pipeline, start_date, end_date):
+    def run_pipeline(self, pipeline, start_date, end_date, columnar=False):
         """
         Compute values for `pipeline` between `start_date` and `end_date`.
 
@@ -45,6 +55,9 @@ class PipelineEngine(with_metaclass(ABCMeta)):
             Start date of the computed matrix.
         end_date : pd.Timestamp
             End date of the computed matrix.
+        columnar : bool, optional
+            If True, return a ``zipline.pipeline.results.PipelineResult``
+            instead of a DataFrame.
 
         Returns
         -------
@@ -74,7 +87,23 @@ class ExplodingPipelineEngine(PipelineEngine):
     """
     A PipelineEngine that doesn't do anything.
     """
-    def run_pipeline(self, pipeline, start_date, end_date):
+    def run_pipeline(self, pipeline, start_date, end_date, columnar=False):
+        raise NoEngineRegistered(
+            "Attempted to run a pipeline but no pipeline "
+            "resources were registered."
+        )
+
+    def run_pipelines(self,
+                      pipelines,
+                      start_date,
+                      end_date,
+                      columnar=False):
+        raise NoEngineRegistered(
+            "Attempted to run a pipeline but no pipeline "
+            "resources were registered."
+        )
+
+    def iter_pipeline(self, pipeline, start_date, end_date, chunksize=126):
         raise NoEngineRegistered(
             "Attempted to run a pipeline but no pipeline "
             "resources were registered."
@@ -96,25 +125,32 @@ class SimplePipelineEngine(object):
     asset_finder : zipline.assets.AssetFinder
         An AssetFinder instance.  We depend on the AssetFinder to determine
         which assets are in the top-level universe at any point in time.
+    prune_assets : bool, optional
+        Whether to compute a pipeline's screen before its other columns and
+        drop assets that never pass the screen before computing the remaining
+        terms.  Pruning is only applied when every term that isn't needed by
+        the screen is ``columnwise``.  Default is True.
     """
     __slots__ = (
         '_get_loader',
         '_calendar',
         '_finder',
+        '_prune_assets',
         '_root_mask_term',
         '_root_mask_dates_term',
         '__weakref__',
     )
 
-    def __init__(self, get_loader, calendar, asset_finder):
+    def __init__(self, get_loader, calendar, asset_finder, prune_assets=True):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
+        self._prune_assets = prune_assets
 
         self._root_mask_term = AssetExists()
         self._root_mask_dates_term = InputDates()
 
-    def run_pipeline(self, pipeline, start_date, end_date):
+    def run_pipeline(self, pipeline, start_date, end_date, columnar=False):
         """
         Compute a pipeline.
 
@@ -126,6 +162,11 @@ class SimplePipelineEngine(object):
             Start date of the computed matrix.
         end_date : pd.Timestamp
             End date of the computed matrix.
+        columnar : bool, optional
+            If True, return a ``zipline.pipeline.results.PipelineResult``
+            instead of a DataFrame.  This avoids building a (date, asset)
+            MultiIndex over the whole result, which is useful when results
+            are only looked up one date at a time.  Default is False.
 
         The algorithm implemented here can be broken down into the following
         stages:
@@ -140,33 +181,219 @@ class SimplePipelineEngine(object):
 
         2. Compute each term in the dependency order determined in (0), caching
            the results in a a dictionary to that they can be fed into future
-           terms.
+           terms.  If the screen can be computed independently of the other
+           columns, it is computed first and any assets that never pass the
+           screen are dropped before computing the remaining terms.
 
         3. For each date, determine the number of assets passing
-           pipeline.screen.  The sum, N, of all these values is the total
-           number of rows in our output frame, so we pre-allocate an output
-           array of length N for each factor in `terms`.
+           pipeline.screen.  The running sum of these values gives the offset
+           of the first row for each date in our flat output arrays.
 
-        4. Fill in the arrays allocated in (3) by copying computed values from
-           our output cache into the corresponding rows.
+        4. Fill in the flat output arrays by copying the computed values that
+           passed pipeline.screen out of our output cache.
 
         5. Stick the values computed in (4) into a DataFrame and return it.
+           If ``columnar`` is True, the flat arrays are returned as-is in a
+           ``PipelineResult``.
 
-        Step 0 is performed by ``Pipeline.to_graph``.
+        Step 0 is performed by ``SimplePipelineEngine._execution_plan_for``.
         Step 1 is performed in ``SimplePipelineEngine._compute_root_mask``.
-        Step 2 is performed in ``SimplePipelineEngine.compute_chunk``.
-        Steps 3, 4, and 5 are performed in ``SimplePiplineEngine._to_narrow``.
+        Step 2 is performed in ``SimplePipelineEngine.compute_chunk`` and
+        ``SimplePipelineEngine._compute_pruned_chunk``.
+        Steps 3 and 4 are performed in ``PipelineResult.from_mask``.
+        Step 5 is performed in ``PipelineResult.frame``.
 
         See Also
         --------
         PipelineEngine.run_pipeline
         """
+        return self.run_pipelines(
+            {None: pipeline},
+            start_date,
+            end_date,
+            columnar=columnar,
+        )[None]
+
+    def run_pipelines(self,
+                      pipelines,
+                      start_date,
+                      end_date,
+                      columnar=False):
+        """
+        Compute several pipelines at once.
+
+        The terms of all the pipelines are combined into a single execution
+        plan, so terms shared between pipelines are only loaded and computed
+        once.  The results of each pipeline are then narrowed separately.
+
+        Parameters
+        ----------
+        pipelines : dict[hashable -> zipline.pipeline.Pipeline]
+            The pipelines to run, keyed by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+        columnar : bool, optional
+            If True, return ``PipelineResult`` objects instead of DataFrames.
+            Default is False.
+
+        Returns
+        -------
+        results : dict[hashable -> pd.DataFrame or PipelineResult]
+            Map from pipeline name to the results of that pipeline, in the
+            format returned by ``run_pipeline``.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline
+        """
         if end_date < start_date:
             raise ValueError(
                 "start_date must be before or equal to end_date \n"
                 "start_date=%s, end_date=%s" % (start_date, end_date)
             )
 
+        screen_names = {name: uuid4().hex for name in pipelines}
+        graph = self._execution_plan_for(
+            pipelines,
+            screen_names,
+            start_date,
+            end_date,
+        )
+        extra_rows = graph.extra_rows[self._root_mask_term]
+        root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
+        dates, assets, root_mask_values = explode(root_mask)
+
+        initial_workspace = {
+            self._root_mask_term: root_mask_values,
+            self._root_mask_dates_term: as_column(dates.values)
+        }
+        screens = [
+            graph.outputs[name, screen_name]
+            for name, screen_name in iteritems(screen_names)
+        ]
+        if self._prune_assets and graph.can_prune_assets(screens):
+            assets, results = self._compute_pruned_chunk(
+                graph,
+                screens,
+                dates,
+                assets,
+                initial_workspace,
+            )
+        else:
+            results = self.compute_chunk(
+                graph,
+                dates,
+                assets,
+                initial_workspace,
+            )
+
+        out = {}
+        for name, pipeline in iteritems(pipelines):
+            columns = {
+                column_name: graph.outputs[name, column_name]
+                for column_name in pipeline.columns
+            }
+            result = PipelineResult.from_mask(
+                columns,
+                {
+                    column_name: results[name, column_name]
+                    for column_name in columns
+                },
+                results[name, screen_names[name]],
+                dates[extra_rows:],
+                assets,
+                self._finder,
+            )
+            out[name] = result if columnar else result.frame
+        return out
+
+    def _execution_plan_for(self,
+                            pipelines,
+                            screen_names,
+                            start_date,
+                            end_date):
+        """
+        Build a single ExecutionPlan computing the terms of all of
+        ``pipelines``.
+
+        The outputs of the plan are keyed by (pipeline name, column name).
+        Each pipeline's screen is stored under (pipeline name, screen name),
+        where the screen name is taken from ``screen_names``.
+        """
+        terms = {}
+        for name, pipeline in iteritems(pipelines):
+            graph_terms = pipeline.graph_terms(
+                screen_names[name],
+                self._root_mask_term,
+            )
+            for column_name, term in iteritems(graph_terms):
+                terms[name, column_name] = term
+
+        return ExecutionPlan(terms, self._calendar, start_date, end_date)
+
+    def iter_pipeline(self, pipeline, start_date, end_date, chunksize=126):
+        """
+        Lazily compute a pipeline one date at a time.
+
+        Raw inputs are loaded ``chunksize`` dates at a time, but terms are only
+        computed for a date when the result for that date is requested.
+        Rolling windows over loaded inputs are kept between dates, so computing
+        each new date only computes one new row of each term.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+        chunksize : int, optional
+            The number of dates of raw inputs to load at a time.
+
+        Yields
+        ------
+        (date, result) : (pd.Timestamp, pd.DataFrame)
+            Each date between ``start_date`` and ``end_date`` paired with the
+            results of ``pipeline`` for that date.  ``result`` is indexed by
+            asset and contains the same values as
+            ``run_pipeline(pipeline, start_date, end_date).loc[date]``.
+
+        Notes
+        -----
+        Pipelines containing downsampled terms or computed categorical terms
+        can't be computed one row at a time.  Those pipelines are computed
+        with ``run_pipeline`` one chunk at a time instead.
+
+        See Also
+        --------
+        PipelineEngine.run_pipeline
+        """
+        if end_date < start_date:
+            raise ValueError(
+                "start_date must be before or equal to end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+
+        start_idx, end_idx = self._calendar.slice_locs(start_date, end_date)
+        for chunk_start in range(start_idx, end_idx, chunksize):
+            chunk_end = min(chunk_start + chunksize, end_idx) - 1
+            for item in self._iter_chunk(pipeline,
+                                         self._calendar[chunk_start],
+                                         self._calendar[chunk_end]):
+                yield item
+
+    def _iter_chunk(self, pipeline, start_date, end_date):
+        """
+        Compute ``pipeline`` one date at a time between ``start_date`` and
+        ``end_date``.
+
+        See Also
+        --------
+        SimplePipelineEngine.iter_pipeline
+        """
         screen_name = uuid4().hex
         graph = pipeline.to_execution_plan(
             screen_name,
@@ -175,27 +402,170 @@ class SimplePipelineEngine(object):
             start_date,
             end_date,
         )
+
+        if not self._can_compute_incrementally(graph):
+            results = self.run_pipeline(
+                pipeline,
+                start_date,
+                end_date,
+                columnar=True,
+            )
+            for date in results.dates:
+                yield date, results.frame_for(date)
+            return
+
         extra_rows = graph.extra_rows[self._root_mask_term]
         root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
         dates, assets, root_mask_values = explode(root_mask)
+        resolved_assets = array(self._finder.retrieve_all(assets))
+
+        workspace = {
+            self._root_mask_term: root_mask_values,
+            self._root_mask_dates_term: as_column(dates.values)
+        }
+        self._validate_compute_chunk_params(dates, assets, workspace)
 
-        results = self.compute_chunk(
+        # Load all the raw inputs for the chunk up front.
+        self._compute_terms(
             graph,
+            graph.loadable_terms,
             dates,
             assets,
-            initial_workspace={
-                self._root_mask_term: root_mask_values,
-                self._root_mask_dates_term: as_column(dates.values)
-            },
+            workspace,
+            refcounts=graph.initial_refcounts(workspace),
         )
+        to_compute = [term for term in graph.ordered()
+                      if term not in workspace]
 
-        return self._to_narrow(
-            graph.outputs,
-            results,
-            results.pop(screen_name),
-            dates[extra_rows:],
-            assets,
-        )
+        # Rolling windows over loaded inputs.  Each window applies adjustments
+        # as it advances, so we only create them once per chunk.
+        offsets = graph.offset
+        windows = {
+            (term, input_): workspace[input_].traverse(
+                window_length=term.window_length,
+                offset=offsets[term, input_],
+            )
+            for term in to_compute if term.windowed
+            for input_ in term.inputs
+            if isinstance(workspace[input_], AdjustedArray)
+        }
+
+        # Number of rows of each computed term that we've filled so far.
+        rows_computed = {}
+        screen = graph.outputs[screen_name]
+        columns = {
+            name: term for name, term in iteritems(graph.outputs)
+            if name != screen_name
+        }
+        for i, date in enumerate(dates[extra_rows:]):
+            for term in to_compute:
+                self._compute_rows(
+                    term,
+                    graph,
+                    dates,
+                    assets,
+                    workspace,
+                    windows,
+                    start=rows_computed.get(term, 0),
+                    stop=graph.extra_rows[term] + i + 1,
+                )
+                rows_computed[term] = graph.extra_rows[term] + i + 1
+
+            keep = workspace[screen][graph.extra_rows[screen] + i]
+            yield date, DataFrame(
+                data={
+                    name: term.postprocess(
+                        workspace[term][graph.extra_rows[term] + i][keep]
+                    )
+                    for name, term in iteritems(columns)
+                },
+                index=resolved_assets[keep],
+            )
+
+    @staticmethod
+    def _can_compute_incrementally(graph):
+        """
+        Check whether each term in ``graph`` can be computed one row at a time.
+        """
+        for term in graph:
+            if isinstance(term, DownsampledMixin):
+                # Downsampled terms choose the rows they compute based on the
+                # full range of dates being computed.
+                return False
+            if (not isinstance(term, LoadableTerm) and
+                    term.dtype == categorical_dtype):
+                # Computed LabelArrays can't be filled in a row at a time,
+                # since each computation may produce different categories.
+                return False
+        return True
+
+    def _compute_rows(self,
+                      term,
+                      graph,
+                      dates,
+                      assets,
+                      workspace,
+                      windows,
+                      start,
+                      stop):
+        """
+        Compute rows ``start`` through ``stop - 1`` of ``term``, storing the
+        results in ``workspace``.
+
+        Row indices are relative to the first row computed for ``term``, so row
+        ``graph.extra_rows[term]`` is the first date of output.
+        """
+        if start >= stop:
+            return
+
+        extra_rows = graph.extra_rows
+        offsets = graph.offset
+
+        mask_offset = extra_rows[term.mask] - extra_rows[term]
+        mask = workspace[term.mask][mask_offset + start:mask_offset + stop]
+        dates_offset = extra_rows[self._root_mask_term] - extra_rows[term]
+        mask_dates = dates[dates_offset + start:dates_offset + stop]
+
+        inputs = []
+        for input_ in term.inputs:
+            offset = offsets[term, input_]
+            if not term.windowed:
+                inputs.append(
+                    ensure_ndarray(workspace[input_])[
+                        offset + start:offset + stop
+                    ]
+                )
+            elif (term, input_) in windows:
+                inputs.append(windows[term, input_])
+            else:
+                # Computed inputs don't have adjustments, so we only need to
+                # traverse the rows covered by the new windows.
+                window_length = term.window_length
+                inputs.append(
+                    ensure_adjusted_array(
+                        workspace[input_][
+                            offset + start:offset + stop + window_length - 1
+                        ],
+                        input_.missing_value,
+                    ).traverse(window_length=window_length)
+                )
+
+        result = term._compute(inputs, mask_dates, assets, mask)
+        if term.ndim == 2:
+            assert result.shape == mask.shape
+        else:
+            assert result.shape == (mask.shape[0], 1)
+
+        if term not in workspace:
+            out = empty(
+                (extra_rows[term] + len(dates) -
+                 extra_rows[self._root_mask_term],) + result.shape[1:],
+                dtype=result.dtype,
+            )
+            if isinstance(result, recarray):
+                out = out.view(recarray)
+            workspace[term] = out
+        workspace[term][start:stop] = result
 
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
@@ -310,6 +680,160 @@ class SimplePipelineEngine(object):
     def get_loader(self, term):
         return self._get_loader(term)
 
+    def _compute_pruned_chunk(self,
+                              graph,
+                              screens,
+                              dates,
+                              assets,
+                              initial_workspace):
+        """
+        Compute the terms in ``graph``, computing ``screens`` first and
+        computing the remaining terms only for assets that pass at least one
+        of ``screens`` on at least one output date.
+
+        Parameters
+        ----------
+        graph : zipline.pipeline.graph.ExecutionPlan
+        screens : list[zipline.pipeline.Filter]
+            The terms used to screen the outputs of ``graph``.
+        dates : pd.DatetimeIndex
+            Row labels for our root mask.
+        assets : pd.Int64Index
+            Column labels for our root mask.
+        initial_workspace : dict
+            Map from term -> output.
+
+        Returns
+        -------
+        assets : pd.Int64Index
+            The column labels of ``results``.  This is a subset of the input
+            ``assets`` in the same order.
+        results : dict
+            Dictionary mapping requested results to outputs.
+
+        Notes
+        -----
+        The caller must ensure that ``graph.can_prune_assets(screens)`` is
+        True.  Terms needed by the screens are computed for every asset.
+        Terms needed only by the other outputs are columnwise, so computing
+        them for a subset of the assets yields the same values as computing
+        them for all the assets and then dropping columns.
+        """
+        self._validate_compute_chunk_params(dates, assets, initial_workspace)
+
+        screen_terms = graph.dependencies_of(*screens)
+        workspace = initial_workspace.copy()
+
+        # Keep every term needed by the screens alive through the first pass
+        # so that the second pass doesn't load or compute them again.
+        refcounts = graph.initial_refcounts(workspace)
+        for term in screen_terms:
+            refcounts[term] += 1
+        self._compute_terms(
+            graph,
+            (term for term in graph.ordered() if term in screen_terms),
+            dates,
+            assets,
+            workspace,
+            refcounts=refcounts,
+        )
+
+        keep = reduce(
+            or_,
+            (
+                workspace[screen][graph.extra_rows[screen]:].any(axis=0)
+                for screen in screens
+            ),
+        )
+        if keep.all():
+            # Every asset passes the screen at least once, so there's nothing
+            # to prune.
+            return assets, self._compute_remaining_terms(
+                graph,
+                screen_terms,
+                dates,
+                assets,
+                workspace,
+            )
+
+        if not keep.any():
+            # Keep a single column so that downstream terms still receive
+            # well-formed inputs.  Nothing will pass the screen anyway.
+            keep[0] = True
+
+        # Loaded terms are stored as AdjustedArrays, whose adjustments are
+        # indexed by column.  We let those be reloaded for the narrowed
+        # assets instead of trying to slice them.
+        narrowed_workspace = {
+            term: value if term.ndim == 1 else value[:, keep]
+            for term, value in iteritems(workspace)
+            if not isinstance(term, LoadableTerm)
+        }
+        narrowed_assets = assets[keep]
+        return narrowed_assets, self._compute_remaining_terms(
+            graph,
+            screen_terms,
+            dates,
+            narrowed_assets,
+            narrowed_workspace,
+        )
+
+    def _compute_remaining_terms(self,
+                                 graph,
+                                 screen_terms,
+                                 dates,
+                                 assets,
+                                 workspace):
+        """
+        Compute the terms in ``graph`` that aren't needed by the screens,
+        after the screens have been computed by ``_compute_pruned_chunk``.
+
+        Loadable terms needed by the screens are also loaded again if they
+        are missing from ``workspace`` and needed by one of the other terms.
+
+        Parameters
+        ----------
+        graph : zipline.pipeline.graph.ExecutionPlan
+        screen_terms : frozenset[Term]
+            The screens and every term they depend on.
+        dates : pd.DatetimeIndex
+            Row labels for our root mask.
+        assets : pd.Int64Index
+            Column labels for our root mask.
+        workspace : dict
+            Map from term -> output.  This is updated in place.
+
+        Returns
+        -------
+        results : dict
+            Dictionary mapping requested results to outputs.
+        """
+        ordered = graph.ordered()
+        remaining = [term for term in ordered if term not in screen_terms]
+        needed = set(remaining)
+        needed.update(parent for parent, _ in graph.in_edges(remaining))
+
+        # Drop the terms that were only kept alive for the screens.
+        outputs = set(itervalues(graph.outputs))
+        for term in screen_terms - needed - outputs:
+            workspace.pop(term, None)
+
+        self._compute_terms(
+            graph,
+            (term for term in ordered if term in needed),
+            dates,
+            assets,
+            workspace,
+            refcounts=graph.initial_refcounts(workspace),
+        )
+
+        out = {}
+        graph_extra_rows = graph.extra_rows
+        for name, term in iteritems(graph.outputs):
+            # Truncate off extra rows from outputs.
+            out[name] = workspace[term][graph_extra_rows[term]:]
+        return out
+
     def compute_chunk(self, graph, dates, assets, initial_workspace):
         """
         Compute the Pipeline terms in the graph for the requested start and end
@@ -334,19 +858,63 @@ class SimplePipelineEngine(object):
             Dictionary mapping requested results to outputs.
         """
         self._validate_compute_chunk_params(dates, assets, initial_workspace)
-        get_loader = self.get_loader
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = initial_workspace.copy()
 
+        self._compute_terms(
+            graph,
+            graph.ordered(),
+            dates,
+            assets,
+            workspace,
+            refcounts=graph.initial_refcounts(workspace),
+        )
+
+        out = {}
+        graph_extra_rows = graph.extra_rows
+        for name, term in iteritems(graph.outputs):
+            # Truncate off extra rows from outputs.
+            out[name] = workspace[term][graph_extra_rows[term]:]
+        return out
+
+    def _compute_terms(self,
+                       graph,
+                       terms,
+                       dates,
+                       assets,
+                       workspace,
+                       refcounts):
+        """
+        Compute ``terms`` in order, storing the results in ``workspace``.
+
+        Parameters
+        ----------
+        graph : zipline.pipeline.graph.ExecutionPlan
+        terms : iterable[Term]
+            The terms to compute, in a valid topological order.
+        dates : pd.DatetimeIndex
+            Row labels for our root mask.
+        assets : pd.Int64Index
+            Column labels for our root mask.
+        workspace : dict
+            Map from term -> output.  This is updated in place.
+        refcounts : dict[Term -> int]
+            Refcounts used to clear terms that are no longer needed from
+            ``workspace``.  This is updated in place.
+        """
+        get_loader = self.get_loader
+        terms = list(terms)
+
         # If loadable terms share the same loader and extra_rows, load them all
         # together.
         loader_group_key = juxt(get_loader, getitem(graph.extra_rows))
-        loader_groups = groupby(loader_group_key, graph.loadable_terms)
-
-        refcounts = graph.initial_refcounts(workspace)
+        loader_groups = groupby(
+            loader_group_key,
+            (term for term in terms if isinstance(term, LoadableTerm)),
+        )
 
-        for term in graph.ordered():
+        for term in terms:
             # `term` may have been supplied in `initial_workspace`, and in the
             # future we may pre-compute loadable terms coming from the same
             # dataset.  In either case, we will already have an entry for this
@@ -387,79 +955,6 @@ class SimplePipelineEngine(object):
                 for garbage_term in graph.decref_dependencies(term, refcounts):
                     del workspace[garbage_term]
 
-        out = {}
-        graph_extra_rows = graph.extra_rows
-        for name, term in iteritems(graph.outputs):
-            # Truncate off extra rows from outputs.
-            out[name] = workspace[term][graph_extra_rows[term]:]
-        return out
-
-    def _to_narrow(self, terms, data, mask, dates, assets):
-        """
-        Convert raw computed pipeline results into a DataFrame for public APIs.
-
-        Parameters
-        ----------
-        terms : dict[str -> Term]
-            Dict mapping column names to terms.
-        data : dict[str -> ndarray[ndim=2]]
-            Dict mapping column names to computed results for those names.
-        mask : ndarray[bool, ndim=2]
-            Mask array of values to keep.
-        dates : ndarray[datetime64, ndim=1]
-            Row index for arrays `data` and `mask`
-        assets : ndarray[int64, ndim=2]
-            Column index for arrays `data` and `mask`
-
-        Returns
-        -------
-        results : pd.DataFrame
-            The indices of `results` are as follows:
-
-            index : two-tiered MultiIndex of (date, asset).
-                Contains an entry for each (date, asset) pair corresponding to
-                a `True` value in `mask`.
-            columns : Index of str
-                One column per entry in `data`.
-
-        If mask[date, asset] is True, then result.loc[(date, asset), colname]
-        will contain the value of data[colname][date, asset].
-        """
-        if not mask.any():
-            # Manually handle the empty DataFrame case. This is a workaround
-            # to pandas failing to tz_localize an empty dataframe with a
-            # MultiIndex. It also saves us the work of applying a known-empty
-            # mask to each array.
-            #
-            # Slicing `dates` here to preserve pandas metadata.
-            empty_dates = dates[:0]
-            empty_assets = array([], dtype=object)
-            return DataFrame(
-                data={
-                    name: array([], dtype=arr.dtype)
-                    for name, arr in iteritems(data)
-                },
-                index=MultiIndex.from_arrays([empty_dates, empty_assets]),
-            )
-
-        resolved_assets = array(self._finder.retrieve_all(assets))
-        dates_kept = repeat_last_axis(dates.values, len(assets))[mask]
-        assets_kept = repeat_first_axis(resolved_assets, len(dates))[mask]
-
-        final_columns = {}
-        for name in data:
-            # Each term that computed an output has its postprocess method
-            # called on the filtered result.
-            #
-            # As of Mon May 2 15:38:47 2016, we only use this to convert
-            # LabelArrays into categoricals.
-            final_columns[name] = terms[name].postprocess(data[name][mask])
-
-        return DataFrame(
-            data=final_columns,
-            index=MultiIndex.from_arrays([dates_kept, assets_kept]),
-        ).tz_localize('UTC', level=0)
-
     def _validate_compute_chunk_params(self, dates, assets, initial_workspace):
         """
         Verify that the values passed to compute_chunk are well-formed.
@@ -180,6 +180,7 @@ class NumericalExpression(ComputableTerm):
         The dtype for the expression.
     """
     window_length = 0
+    columnwise = True
 
     def __new__(cls, expr, binds, dtype):
         return super(NumericalExpression, cls).__new__(
@@ -28,6 +28,7 @@ class BusinessDaysSincePreviousEvent(Factor):
 
     Assets for which the event date is `NaT` will produce a value of `NaN`.
     """
+    columnwise = True
     window_length = 0
     dtype = float64_dtype
 
@@ -63,6 +64,7 @@ class BusinessDaysUntilNextEvent(Factor):
 
     Assets for which the event date is `NaT` will produce a value of `NaN`.
     """
+    columnwise = True
     window_length = 0
     dtype = float64_dtype
 
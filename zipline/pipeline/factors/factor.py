@@ -1478,6 +1478,8 @@ class RecarrayField(SingleInputMixin, Factor):
     """
     A single field from a multi-output factor.
     """
+    columnwise = True
+
     def __new__(cls, factor, attribute):
         return super(RecarrayField, cls).__new__(
             cls,
@@ -1512,6 +1514,7 @@ class Latest(LatestMixin, CustomFactor):
     Factor.
     """
     window_length = 1
+    columnwise = True
 
     def compute(self, today, assets, out, data):
         out[:] = data[-1]
@@ -46,6 +46,7 @@ class Returns(CustomFactor):
 
     **Default Inputs**: [USEquityPricing.close]
     """
+    columnwise = True
     inputs = [USEquityPricing.close]
     window_safe = True
 
@@ -70,6 +71,7 @@ class RSI(CustomFactor, SingleInputMixin):
 
     **Default Window Length**: 15
     """
+    columnwise = True
     window_length = 15
     inputs = (USEquityPricing.close,)
 
@@ -93,6 +95,7 @@ class SimpleMovingAverage(CustomFactor, SingleInputMixin):
 
     **Default Window Length**: None
     """
+    columnwise = True
     # numpy's nan functions throw warnings when passed an array containing only
     # nans, but they still returns the desired value (nan), so we ignore the
     # warning.
@@ -110,6 +113,8 @@ class WeightedAverageValue(CustomFactor):
 
     **Default Window Length:** None
     """
+    columnwise = True
+
     def compute(self, today, assets, out, base, weight):
         out[:] = nansum(base * weight, axis=0) / nansum(weight, axis=0)
 
@@ -133,6 +138,7 @@ class MaxDrawdown(CustomFactor, SingleInputMixin):
 
     **Default Window Length:** None
     """
+    columnwise = True
     ctx = ignore_nanwarnings()
 
     def compute(self, today, assets, out, data):
@@ -154,6 +160,7 @@ class AverageDollarVolume(CustomFactor):
 
     **Default Window Length:** None
     """
+    columnwise = True
     inputs = [USEquityPricing.close, USEquityPricing.volume]
 
     def compute(self, today, assets, out, close, volume):
@@ -189,6 +196,7 @@ class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
     from_halflife
     from_center_of_mass
     """
+    columnwise = True
     params = ('decay_rate',)
 
     @staticmethod
@@ -364,6 +372,8 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
     --------
     :func:`pandas.ewma`
     """
+    columnwise = True
+
     def compute(self, today, assets, out, data, decay_rate):
         out[:] = average(
             data,
@@ -380,6 +390,7 @@ class LinearWeightedMovingAverage(CustomFactor, SingleInputMixin):
 
     **Default Window Length**: None
     """
+    columnwise = True
     # numpy's nan functions throw warnings when passed an array containing only
     # nans, but they still returns the desired value (nan), so we ignore the
     # warning.
@@ -431,6 +442,7 @@ class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
     --------
     :func:`pandas.ewmstd`
     """
+    columnwise = True
 
     def compute(self, today, assets, out, data, decay_rate):
         weights = self.weights(len(data), decay_rate)
@@ -468,6 +480,7 @@ class BollingerBands(CustomFactor):
         The number of standard deviations to add or subtract to create the
         upper and lower bands.
     """
+    columnwise = True
     params = ('k',)
     inputs = (USEquityPricing.close,)
     outputs = 'lower', 'middle', 'upper'
@@ -493,6 +506,7 @@ class Aroon(CustomFactor):
         indicator.
     """
 
+    columnwise = True
     inputs = (USEquityPricing.low, USEquityPricing.high)
     outputs = ('down', 'up')
 
@@ -537,6 +551,7 @@ class FastStochasticOscillator(CustomFactor):
     -------
     out: %K oscillator
     """
+    columnwise = True
     inputs = (USEquityPricing.close, USEquityPricing.low, USEquityPricing.high)
     window_safe = True
     window_length = 14
@@ -580,6 +595,7 @@ class IchimokuKinkoHyo(CustomFactor):
         The lag for the chikou span.
     """
 
+    columnwise = True
     params = {
         'tenkan_sen_length': 9,
         'kijun_sen_length': 26,
@@ -639,6 +655,8 @@ class RateOfChangePercentage(CustomFactor):
     price - the current price
     prevPrice - the price n days ago, equals window length
     """
+    columnwise = True
+
     def compute(self, today, assets, out, close):
         today_close = close[-1]
         prev_close = close[0]
@@ -664,6 +682,7 @@ class TrueRange(CustomFactor):
                         :data:`zipline.pipeline.data.USEquityPricing.close`
     **Default Window Length:** 2
     """
+    columnwise = True
     inputs = (
         USEquityPricing.high,
         USEquityPricing.low,
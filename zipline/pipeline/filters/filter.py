@@ -212,6 +212,7 @@ class NumExprFilter(NumericalExpression, Filter):
     """
     A Filter computed from a numexpr expression.
     """
+    columnwise = True
 
     @classmethod
     def create(cls, expr, binds):
@@ -246,6 +247,7 @@ class NullFilter(SingleInputMixin, Filter):
         The factor to compare against its missing_value.
     """
     window_length = 0
+    columnwise = True
 
     def __new__(cls, term):
         return super(NullFilter, cls).__new__(
@@ -270,6 +272,7 @@ class NotNullFilter(SingleInputMixin, Filter):
         The factor to compare against its missing_value.
     """
     window_length = 0
+    columnwise = True
 
     def __new__(cls, term):
         return super(NotNullFilter, cls).__new__(
@@ -427,6 +430,7 @@ class ArrayPredicate(SingleInputMixin, Filter):
         Additional argument to apply to ``op``.
     """
     window_length = 0
+    columnwise = True
 
     @expect_types(term=Term, opargs=tuple)
     def __new__(cls, term, op, opargs):
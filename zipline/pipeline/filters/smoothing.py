@@ -16,6 +16,7 @@ class All(CustomFilter):
 
     **Default Window Length:** None
     """
+    columnwise = True
 
     def compute(self, today, assets, out, arg):
         out[:] = (arg.sum(axis=0) == self.window_length)
@@ -30,6 +31,7 @@ class Any(CustomFilter):
 
     **Default Window Length:** None
     """
+    columnwise = True
 
     def compute(self, today, assets, out, arg):
         out[:] = (arg.sum(axis=0) > 0)
@@ -45,6 +47,7 @@ class AtLeastN(CustomFilter):
     **Default Window Length:** None
     """
 
+    columnwise = True
     params = ('N',)
 
     def compute(self, today, assets, out, arg, N):
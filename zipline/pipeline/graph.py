@@ -3,19 +3,31 @@ Dependency-Graph representation of Pipeline API terms.
 """
 from networkx import (
     DiGraph,
+    ancestors,
     topological_sort,
 )
 from six import iteritems, itervalues
 from zipline.utils.memoize import lazyval
-from zipline.pipeline.visualize import display_graph
 
-from .term import LoadableTerm
+from .term import LoadableTerm, is_columnwise
 
 
 class CyclicDependency(Exception):
     pass
 
 
+def display_graph(g, format='svg', include_asset_exists=False):
+    """
+    Display a TermGraph interactively from within IPython.
+
+    See :func:`zipline.pipeline.visualize.display_graph`.
+    """
+    # The visualize module is only needed to render graphs, so it isn't
+    # imported until a graph is displayed.
+    from zipline.pipeline.visualize import display_graph
+    return display_graph(g, format, include_asset_exists)
+
+
 class TermGraph(DiGraph):
     """
     An abstract representation of Pipeline Term dependencies.
@@ -104,6 +116,48 @@ class TermGraph(DiGraph):
     def loadable_terms(self):
         return tuple(term for term in self if isinstance(term, LoadableTerm))
 
+    def dependencies_of(self, *terms):
+        """
+        Return the set containing ``terms`` and every term they transitively
+        depend on.
+
+        Parameters
+        ----------
+        *terms : zipline.pipeline.Term
+            Terms in ``self``.
+
+        Returns
+        -------
+        dependencies : frozenset[Term]
+        """
+        out = set(terms)
+        for term in terms:
+            out.update(ancestors(self, term))
+        return frozenset(out)
+
+    def can_prune_assets(self, screens):
+        """
+        Check whether the terms in ``self`` that aren't needed to compute
+        ``screens`` can be computed only for the assets that pass at least one
+        of ``screens``.
+
+        This is true when each such term is columnwise, meaning that its
+        value for an asset depends only on its inputs' values for that asset.
+        See ``zipline.pipeline.term.is_columnwise``.
+
+        Parameters
+        ----------
+        screens : list[zipline.pipeline.Term]
+            The terms used to screen the outputs of ``self``.
+
+        Returns
+        -------
+        can_prune : bool
+        """
+        screen_terms = self.dependencies_of(*screens)
+        remaining = [term for term in self if term not in screen_terms]
+        return bool(remaining) and all(map(is_columnwise, remaining))
+
     @lazyval
     def jpeg(self):
         return display_graph(self, 'jpeg')
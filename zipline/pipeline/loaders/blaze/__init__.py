@@ -1,3 +1,4 @@
+from .cache import DatePartitionedQueryCache
 from .core import (
     BlazeLoader,
     NoMetaDataWarning,
@@ -7,6 +8,7 @@ from .core import (
 
 __all__ = (
     'BlazeLoader',
+    'DatePartitionedQueryCache',
     'from_blaze',
     'global_loader',
     'NoMetaDataWarning',
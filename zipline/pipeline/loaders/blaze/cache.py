@@ -0,0 +1,235 @@
+"""
+On-disk cache for the rows loaded by the BlazeLoader.
+"""
+from hashlib import md5
+import os
+
+from odo import odo
+import pandas as pd
+
+from zipline.pipeline.common import SID_FIELD_NAME, TS_FIELD_NAME
+from zipline.utils.cache import dataframe_cache
+from .core import sid_predicate
+
+
+def _naive_utc(dt):
+    """Convert a datetime into a tz-naive pd.Timestamp in UTC.
+    """
+    dt = pd.Timestamp(dt)
+    if dt.tz is not None:
+        dt = dt.tz_convert('utc').tz_localize(None)
+    return dt
+
+
+def _contiguous_runs(ixs):
+    """Split a sorted sequence of integers into runs of consecutive integers.
+    """
+    runs = []
+    for ix in ixs:
+        if runs and runs[-1][-1] == ix - 1:
+            runs[-1].append(ix)
+        else:
+            runs.append([ix])
+    return runs
+
+
+class DatePartitionedQueryCache(object):
+    """An on-disk cache of the rows of blaze expressions, partitioned by the
+    month of the rows' timestamps.
+
+    Pipelines are computed in chunks of consecutive dates, so consecutive
+    queries for an expression mostly overlap. With this cache only the
+    months that have not already been fetched are queried from the backend.
+
+    Parameters
+    ----------
+    path : str
+        The directory in which to store the partitions.
+    serialization : {'msgpack', 'pickle:<n>'}, optional
+        How the partitions should be serialized.
+
+    Notes
+    -----
+    Only months that ended before the time of the query are written to disk:
+    the cache assumes that rows with timestamps in the past never change.
+
+    Partitions are keyed by the name and schema of the expression, so two
+    different datasets with the same name and schema must not share a cache
+    directory.
+
+    See Also
+    --------
+    :class:`zipline.pipeline.loaders.blaze.BlazeLoader`
+    :class:`zipline.utils.cache.dataframe_cache`
+    """
+    def __init__(self, path, serialization='msgpack'):
+        self.path = path
+        self._serialization = serialization
+        self._caches = {}
+
+    def __repr__(self):
+        return '<%s: path=%r>' % (type(self).__name__, self.path)
+
+    def _cache_for(self, name, expr):
+        key = '%s-%s' % (
+            name,
+            md5(str(expr.dshape).encode('utf-8')).hexdigest(),
+        )
+        try:
+            return self._caches[key]
+        except KeyError:
+            cache = self._caches[key] = dataframe_cache(
+                os.path.join(self.path, key),
+                clean_on_failure=False,
+                serialization=self._serialization,
+            )
+            return cache
+
+    def _first_timestamp(self, cache, expr, odo_kwargs):
+        try:
+            return cache['first-timestamp'][TS_FIELD_NAME].iloc[0]
+        except KeyError:
+            pass
+
+        first = odo(expr[TS_FIELD_NAME].min(), pd.Timestamp, **odo_kwargs)
+        if not pd.isnull(first):
+            cache['first-timestamp'] = pd.DataFrame(
+                {TS_FIELD_NAME: [_naive_utc(first)]},
+            )
+        return first
+
+    @staticmethod
+    def _read_partition(cache, key, sids):
+        """Read a partition from the cache.
+
+        Returns
+        -------
+        partition : pd.DataFrame or None
+            The cached rows, or None if the partition is missing.
+        cached_sids : set[int] or None
+            The sids that were fetched for this partition, or None if the
+            partition has no sids.
+        """
+        try:
+            partition = cache[key]
+        except KeyError:
+            return None, None
+
+        if sids is None:
+            return partition, None
+
+        try:
+            cached_sids = set(cache[key + '.sids'][SID_FIELD_NAME])
+        except KeyError:
+            # The partition was written without its universe; treat it as
+            # missing.
+            return None, None
+        if not cached_sids.issuperset(sids):
+            # The partition was written for a different universe; it needs
+            # to be fetched again.
+            return None, cached_sids
+        return partition, cached_sids
+
+    def query(self, expr, name, lower, upper, sids, columns, odo_kwargs):
+        """Query the rows of ``expr`` whose timestamps are between ``lower``
+        and ``upper``, inclusive.
+
+        Parameters
+        ----------
+        expr : Expr
+            The bound expression to query.
+        name : str
+            The name of ``expr`` in the cache.
+        lower : datetime or None
+            The lower time bound to query. If this is None, all of the rows
+            up to ``upper`` are queried.
+        upper : datetime
+            The upper time bound to query.
+        sids : list[int] or None
+            The sids to query. This should be None if ``expr`` does not have
+            a sid column.
+        columns : list[str]
+            The columns to return.
+        odo_kwargs : dict
+            The extra keyword arguments to pass to ``odo``.
+
+        Returns
+        -------
+        result : pd.DataFrame
+            The rows matching the query.
+        """
+        cache = self._cache_for(name, expr)
+        first = self._first_timestamp(cache, expr, odo_kwargs)
+        if pd.isnull(first):
+            # The expression is empty.
+            return pd.DataFrame(columns=columns)
+
+        naive_upper = _naive_utc(upper)
+        naive_lower = _naive_utc(first if lower is None else lower)
+        month_starts = pd.date_range(
+            naive_lower.replace(day=1).normalize(),
+            naive_upper,
+            freq='MS',
+        )
+        month_ends = month_starts + pd.offsets.MonthBegin()
+
+        frames = []
+        missing = []
+        fetch_sids = set(sids) if sids is not None else None
+        for ix, month_start in enumerate(month_starts):
+            partition, cached_sids = self._read_partition(
+                cache,
+                month_start.strftime('%Y-%m'),
+                sids,
+            )
+            if partition is None:
+                missing.append(ix)
+                if cached_sids is not None:
+                    # Grow the universe of the partition so that it can still
+                    # be used by the queries it was originally written for.
+                    fetch_sids |= cached_sids
+            else:
+                frames.append(partition)
+
+        tz = None if pd.Timestamp(upper).tz is None else 'utc'
+        now = _naive_utc(pd.Timestamp.utcnow())
+        for run in _contiguous_runs(missing):
+            run_start = month_starts[run[0]]
+            run_end = month_ends[run[-1]]
+            if tz is not None:
+                # Query with the same kind of bounds as the loader uses.
+                run_start = run_start.tz_localize(tz)
+                run_end = run_end.tz_localize(tz)
+            predicate = (
+                (expr[TS_FIELD_NAME] >= run_start) &
+                (expr[TS_FIELD_NAME] < run_end)
+            )
+            if fetch_sids is not None:
+                predicate &= sid_predicate(expr, sorted(fetch_sids))
+            fetched = odo(expr[predicate], pd.DataFrame, **odo_kwargs)
+            ts = fetched[TS_FIELD_NAME].astype('datetime64[ns]')
+
+            for ix in run:
+                partition = fetched[
+                    (ts >= month_starts[ix]) & (ts < month_ends[ix])
+                ]
+                frames.append(partition)
+                if month_ends[ix] <= now:
+                    key = month_starts[ix].strftime('%Y-%m')
+                    cache[key] = partition.reset_index(drop=True)
+                    if fetch_sids is not None:
+                        cache[key + '.sids'] = pd.DataFrame(
+                            {SID_FIELD_NAME: sorted(fetch_sids)},
+                        )
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+
+        result = pd.concat(frames, ignore_index=True, copy=False)
+        ts = result[TS_FIELD_NAME].astype('datetime64[ns]')
+        keep = ts <= naive_upper
+        if lower is not None:
+            keep &= ts >= naive_lower
+        if sids is not None:
+            keep &= result[SID_FIELD_NAME].isin(sids)
+        return result.loc[keep, columns].reset_index(drop=True)
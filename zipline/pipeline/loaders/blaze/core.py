@@ -138,7 +138,7 @@ www.quantopian.com/help#pipeline-api
 from __future__ import division, absolute_import
 
 from abc import ABCMeta, abstractproperty
-from collections import namedtuple, defaultdict
+from collections import namedtuple
 from functools import partial
 from itertools import count
 import warnings
@@ -180,13 +180,21 @@ from zipline.pipeline.loaders.utils import (
 )
 from zipline.pipeline.sentinels import NotSpecified
 from zipline.lib.adjusted_array import AdjustedArray, can_represent_dtype
-from zipline.lib.adjustment import Float64Overwrite
+from zipline.lib.adjustment import (
+    Float64AdjustmentTable,
+    Float64Overwrite,
+    OVERWRITE,
+)
 from zipline.utils.input_validation import (
     expect_element,
     ensure_timezone,
     optionally,
 )
-from zipline.utils.numpy_utils import bool_dtype, categorical_dtype
+from zipline.utils.numpy_utils import (
+    bool_dtype,
+    categorical_dtype,
+    float64_dtype,
+)
 from zipline.utils.pool import SequentialPool
 from zipline.utils.preprocess import preprocess
 
@@ -722,6 +730,34 @@ def from_blaze(expr,
 getdataset = op.attrgetter('dataset')
 getname = op.attrgetter('name')
 
+# The largest number of sids to send to the backend in an ``IN`` predicate.
+# Some backends limit the number of parameters in a query, e.g. sqlite's
+# default limit is 999.
+MAX_SID_PREDICATE_SIZE = 900
+
+
+def sid_predicate(expr, sids):
+    """Build a predicate restricting ``expr`` to the given sids.
+
+    Parameters
+    ----------
+    expr : Expr
+        An expression with a sid column.
+    sids : list[int]
+        The sids to select, in ascending order.
+
+    Returns
+    -------
+    predicate : Expr
+        A boolean expression which can be pushed down to the backend. When
+        there are too many sids to list, this only bounds the range of the
+        sids, so the result may contain extra sids.
+    """
+    sid = expr[SID_FIELD_NAME]
+    if len(sids) <= MAX_SID_PREDICATE_SIZE:
+        return sid.isin(sids)
+    return (sid >= sids[0]) & (sid <= sids[-1])
+
 
 def overwrite_novel_deltas(baseline, deltas, dates):
     """overwrite any deltas into the baseline set that would have changed our
@@ -757,29 +793,28 @@ def overwrite_novel_deltas(baseline, deltas, dates):
     return cat, non_novel_deltas
 
 
-def overwrite_from_dates(asof, dense_dates, sparse_dates, asset_idx, value):
-    """Construct a `Float64Overwrite` with the correct
-    start and end date based on the asof date of the delta,
-    the dense_dates, and the dense_dates.
+def overwrite_bounds_from_dates(asofs, dense_dates, sparse_dates):
+    """Compute the first and last rows to which overwrites apply, based on
+    the asof dates of the deltas, the dense dates, and the sparse dates.
 
     Parameters
     ----------
-    asof : datetime
-        The asof date of the delta.
+    asofs : np.ndarray[datetime64[ns]]
+        The asof dates of the deltas. ``NaT`` entries are not actual deltas;
+        they appear because of the groupby we do on the deltas.
     dense_dates : pd.DatetimeIndex
         The dates requested by the loader.
-    sparse_dates : pd.DatetimeIndex
-        The dates that appeared in the dataset.
-    asset_idx : tuple of int
-        The index of the asset in the block. If this is a tuple, then this
-        is treated as the first and last index to use.
-    value : np.float64
-        The value to overwrite with.
+    sparse_dates : np.ndarray[datetime64[ns]]
+        The sorted dates that appeared in the dataset.
 
     Returns
     -------
-    overwrite : Float64Overwrite
-        The overwrite that will apply the new value to the data.
+    first_rows : np.ndarray[int64]
+        The first row of the dense dates to overwrite for each delta.
+    last_rows : np.ndarray[int64]
+        The last row of the dense dates to overwrite for each delta.
+    valid : np.ndarray[bool]
+        Which deltas produce an overwrite.
 
     Notes
     -----
@@ -793,27 +828,76 @@ def overwrite_from_dates(asof, dense_dates, sparse_dates, asset_idx, value):
 
     Then the overwrite will apply to indexes: 1, 2, 3, 4
     """
-    if asof is pd.NaT:
-        # Not an actual delta.
-        # This happens due to the groupby we do on the deltas.
-        return
+    asofs = np.asarray(pd.to_datetime(asofs), dtype='datetime64[ns]')
+    dense = np.asarray(dense_dates.values, dtype='datetime64[ns]')
+    sparse = np.asarray(sparse_dates, dtype='datetime64[ns]')
 
-    first_row = dense_dates.searchsorted(asof)
-    next_idx = sparse_dates.searchsorted(asof.asm8, 'right')
-    if next_idx == len(sparse_dates):
-        # There is no next date in the sparse, this overwrite should apply
-        # through the end of the dense dates.
-        last_row = len(dense_dates) - 1
-    else:
-        # There is a next date in sparse dates. This means that the overwrite
-        # should only apply until the index of this date in the dense dates.
-        last_row = dense_dates.searchsorted(sparse_dates[next_idx]) - 1
+    first_rows = dense.searchsorted(asofs)
+    next_idx = sparse.searchsorted(asofs, 'right')
 
-    if first_row > last_row:
-        return
+    # If there is no next date in the sparse dates, the overwrite applies
+    # through the end of the dense dates. Otherwise it only applies until the
+    # index of the next sparse date in the dense dates.
+    last_rows = np.full(len(asofs), len(dense) - 1, dtype=np.int64)
+    has_next = next_idx < len(sparse)
+    last_rows[has_next] = dense.searchsorted(sparse[next_idx[has_next]]) - 1
+
+    valid = ~pd.isnull(asofs) & (first_rows <= last_rows)
+    return first_rows, last_rows, valid
+
+
+def overwrites_from_arrays(adj_locs,
+                           first_rows,
+                           last_rows,
+                           cols,
+                           values,
+                           dtype):
+    """Build the adjustments for an ``AdjustedArray`` from arrays describing
+    one overwrite each.
+
+    Parameters
+    ----------
+    adj_locs : np.ndarray[int64]
+        The row at which each overwrite is applied, in ascending order.
+    first_rows, last_rows : np.ndarray[int64]
+        The rows to overwrite.
+    cols : np.ndarray[int64]
+        The column to overwrite.
+    values : np.ndarray
+        The values to write.
+    dtype : np.dtype
+        The dtype of the column being adjusted.
 
-    first, last = asset_idx
-    yield Float64Overwrite(first_row, last_row, first, last, value)
+    Returns
+    -------
+    adjustments : Float64AdjustmentTable or dict[int -> list[Float64Overwrite]]
+        The adjustments to feed to the adjusted array. float64 columns get a
+        packed table; other columns get an adjustments dictionary.
+    """
+    if dtype == float64_dtype:
+        return Float64AdjustmentTable(
+            adj_locs,
+            first_rows,
+            last_rows,
+            cols,
+            cols,
+            np.full(len(adj_locs), OVERWRITE, dtype=np.uint8),
+            values,
+        )
+
+    adjustments = {}
+    for adj_loc, first_row, last_row, col, value in zip(
+            adj_locs.tolist(),
+            first_rows.tolist(),
+            last_rows.tolist(),
+            cols.tolist(),
+            values.tolist()):
+        overwrite = Float64Overwrite(first_row, last_row, col, col, value)
+        try:
+            adjustments[adj_loc].append(overwrite)
+        except KeyError:
+            adjustments[adj_loc] = [overwrite]
+    return adjustments
 
 
 def adjustments_from_deltas_no_sids(dense_dates,
@@ -821,7 +905,8 @@ def adjustments_from_deltas_no_sids(dense_dates,
                                     column_idx,
                                     column_name,
                                     asset_idx,
-                                    deltas):
+                                    deltas,
+                                    dtype):
     """Collect all the adjustments that occur in a dataset that does not
     have a sid column.
 
@@ -839,23 +924,27 @@ def adjustments_from_deltas_no_sids(dense_dates,
         The mapping of sids to their index in the output.
     deltas : pd.DataFrame
         The overwrites that should be applied to the dataset.
+    dtype : np.dtype
+        The dtype of the column.
 
     Returns
     -------
-    adjustments : dict[idx -> Float64Overwrite]
-        The adjustments dictionary to feed to the adjusted array.
+    adjustments : Float64AdjustmentTable or dict[idx -> list[Float64Overwrite]]
+        The adjustments to feed to the adjusted array.
     """
-    ad_series = deltas[AD_FIELD_NAME]
-    idx = 0, 0
-    return {
-        dense_dates.get_loc(kd): overwrite_from_dates(
-            ad_series.loc[kd],
-            dense_dates,
-            sparse_dates,
-            idx,
-            v,
-        ) for kd, v in deltas[column_name].iteritems()
-    }
+    first_rows, last_rows, valid = overwrite_bounds_from_dates(
+        deltas[AD_FIELD_NAME].values,
+        dense_dates,
+        sparse_dates,
+    )
+    return overwrites_from_arrays(
+        dense_dates.searchsorted(deltas.index)[valid],
+        first_rows[valid],
+        last_rows[valid],
+        np.zeros(valid.sum(), dtype=np.int64),
+        deltas[column_name].values[valid],
+        dtype,
+    )
 
 
 def adjustments_from_deltas_with_sids(dense_dates,
@@ -863,15 +952,16 @@ def adjustments_from_deltas_with_sids(dense_dates,
                                       column_idx,
                                       column_name,
                                       asset_idx,
-                                      deltas):
+                                      deltas,
+                                      dtype):
     """Collect all the adjustments that occur in a dataset that has a sid
     column.
 
     Parameters
     ----------
-    dates : pd.DatetimeIndex
-        The dates requested by the loader.
     dense_dates : pd.DatetimeIndex
+        The dates requested by the loader.
+    sparse_dates : pd.DatetimeIndex
         The dates that were in the raw data.
     column_idx : int
         The index of the column in the dataset.
@@ -881,27 +971,39 @@ def adjustments_from_deltas_with_sids(dense_dates,
         The mapping of sids to their index in the output.
     deltas : pd.DataFrame
         The overwrites that should be applied to the dataset.
+    dtype : np.dtype
+        The dtype of the column.
 
     Returns
     -------
-    adjustments : dict[idx -> Float64Overwrite]
-        The adjustments dictionary to feed to the adjusted array.
+    adjustments : Float64AdjustmentTable or dict[idx -> list[Float64Overwrite]]
+        The adjustments to feed to the adjusted array.
     """
-    ad_series = deltas[AD_FIELD_NAME]
-    adjustments = defaultdict(list)
-    for sid, per_sid in deltas[column_name].iteritems():
-        idx = asset_idx[sid]
-        for kd, v in per_sid.iteritems():
-            adjustments[dense_dates.searchsorted(kd)].extend(
-                overwrite_from_dates(
-                    ad_series.loc[kd, sid],
-                    dense_dates,
-                    sparse_dates,
-                    (idx, idx),
-                    v,
-                ),
-            )
-    return dict(adjustments)  # no subclasses of dict
+    ad_frame = deltas[AD_FIELD_NAME]
+    value_frame = deltas[column_name]
+
+    # ``deltas`` has one row per date and one column per sid. Flatten the
+    # (date, sid) pairs in row-major order so that the overwrites for each
+    # date are ordered by sid.
+    date_ix, sid_ix = np.indices(ad_frame.shape).reshape(2, -1)
+    first_rows, last_rows, valid = overwrite_bounds_from_dates(
+        ad_frame.values.ravel(),
+        dense_dates,
+        sparse_dates,
+    )
+    date_ix = date_ix[valid]
+    sid_ix = sid_ix[valid]
+
+    return overwrites_from_arrays(
+        dense_dates.searchsorted(ad_frame.index)[date_ix],
+        first_rows[valid],
+        last_rows[valid],
+        asset_idx.reindex(value_frame.columns).values.astype(np.int64)[
+            sid_ix
+        ],
+        value_frame.values[date_ix, sid_ix],
+        dtype,
+    )
 
 
 class BlazeLoader(dict):
@@ -920,6 +1022,10 @@ class BlazeLoader(dict):
     pool : Pool, optional
         The pool to use to run blaze queries concurrently. This object must
         support ``imap_unordered``, ``apply`` and ``apply_async`` methods.
+    query_cache : DatePartitionedQueryCache, optional
+        An on-disk cache for the rows of the baseline and deltas expressions.
+        When this is provided, consecutive loads only query the backend for
+        the rows that have not been loaded before.
 
     Attributes
     ----------
@@ -934,17 +1040,20 @@ class BlazeLoader(dict):
     --------
     :class:`zipline.utils.pool.SequentialPool`
     :class:`multiprocessing.Pool`
+    :class:`zipline.pipeline.loaders.blaze.cache.DatePartitionedQueryCache`
     """
     @preprocess(data_query_tz=optionally(ensure_timezone))
     def __init__(self,
                  dsmap=None,
                  data_query_time=None,
                  data_query_tz=None,
-                 pool=SequentialPool()):
+                 pool=SequentialPool(),
+                 query_cache=None):
         self.update(dsmap or {})
         check_data_query_args(data_query_time, data_query_tz)
         self._data_query_time = data_query_time
         self._data_query_tz = data_query_tz
+        self._query_cache = query_cache
 
         # explicitly public
         self.pool = pool
@@ -1000,7 +1109,9 @@ class BlazeLoader(dict):
             data_query_tz,
         )
 
-        def collect_expr(e, lower):
+        query_cache = self._query_cache
+
+        def collect_expr(e, lower, kind):
             """Materialize the expression as a dataframe.
 
             Parameters
@@ -1009,6 +1120,8 @@ class BlazeLoader(dict):
                 The baseline or deltas expression.
             lower : datetime
                 The lower time bound to query.
+            kind : {'baseline', 'deltas'}
+                Which expression ``e`` is, used to key the query cache.
 
             Returns
             -------
@@ -1020,9 +1133,24 @@ class BlazeLoader(dict):
             This can return more data than needed. The in memory reindex will
             handle this.
             """
+            if query_cache is not None:
+                return query_cache.query(
+                    e,
+                    '%s-%s' % (dataset.__name__, kind),
+                    lower,
+                    upper_dt,
+                    sorted(assets) if have_sids else None,
+                    colnames,
+                    odo_kwargs,
+                )
+
+            # Push the time bounds, and the sids if we have them, down to the
+            # backend so that only the rows we need are materialized.
             predicate = e[TS_FIELD_NAME] <= upper_dt
             if lower is not None:
                 predicate &= e[TS_FIELD_NAME] >= lower
+            if have_sids:
+                predicate &= sid_predicate(e, sorted(assets))
 
             return odo(e[predicate][colnames], pd.DataFrame, **odo_kwargs)
 
@@ -1033,8 +1161,11 @@ class BlazeLoader(dict):
                 materialized_checkpoints = pd.DataFrame(columns=colnames)
                 lower = None
             else:
+                predicate = ts == checkpoints_ts
+                if have_sids:
+                    predicate &= sid_predicate(checkpoints, sorted(assets))
                 materialized_checkpoints = odo(
-                    checkpoints[ts == checkpoints_ts][colnames],
+                    checkpoints[predicate][colnames],
                     pd.DataFrame,
                     **odo_kwargs
                 )
@@ -1043,9 +1174,12 @@ class BlazeLoader(dict):
             materialized_checkpoints = pd.DataFrame(columns=colnames)
             lower = None
 
-        materialized_expr = self.pool.apply_async(collect_expr, (expr, lower))
+        materialized_expr = self.pool.apply_async(
+            collect_expr,
+            (expr, lower, 'baseline'),
+        )
         materialized_deltas = (
-            self.pool.apply(collect_expr, (deltas, lower))
+            self.pool.apply(collect_expr, (deltas, lower, 'deltas'))
             if deltas is not None else
             pd.DataFrame(columns=colnames)
         )
@@ -1060,8 +1194,9 @@ class BlazeLoader(dict):
                 copy=False,
             )
 
-        # It's not guaranteed that assets returned by the engine will contain
-        # all sids from the deltas table; filter out such mismatches here.
+        # The sid predicate sent to the backend may only bound the range of
+        # the sids, so the deltas can still contain sids that weren't
+        # requested; filter out such mismatches here.
         if not materialized_deltas.empty and have_sids:
             materialized_deltas = materialized_deltas[
                 materialized_deltas[SID_FIELD_NAME].isin(assets)
@@ -1182,6 +1317,7 @@ class BlazeLoader(dict):
                     column.name,
                     asset_idx,
                     sparse_deltas,
+                    column.dtype,
                 ),
                 column.missing_value,
             )
@@ -79,11 +79,23 @@ class USEquityPricingLoader(PipelineLoader):
             end_date,
             assets,
         )
-        adjustments = self.adjustments_loader.load_adjustments(
-            colnames,
-            dates,
-            assets,
-        )
+        # All of the USEquityPricing columns are float64, so the adjustments
+        # can be loaded as packed tables if the reader supports it. Other
+        # readers return a dict of adjustments for each column.
+        adjustments_loader = self.adjustments_loader
+        if getattr(adjustments_loader, 'supports_packed_adjustments', False):
+            adjustments = adjustments_loader.load_adjustments(
+                colnames,
+                dates,
+                assets,
+                packed=True,
+            )
+        else:
+            adjustments = adjustments_loader.load_adjustments(
+                colnames,
+                dates,
+                assets,
+            )
 
         out = {}
         for c, c_raw, c_adjs in zip(columns, raw_arrays, adjustments):
@@ -11,10 +11,25 @@ from zipline.pipeline.common import (
     SID_FIELD_NAME,
     TS_FIELD_NAME,
 )
-from zipline.pipeline.loaders.utils import (
-    next_event_indexer,
-    previous_event_indexer,
-)
+
+
+def _nanos(dates):
+    """
+    Convert an array-like of datetimes into int64 nanoseconds since the epoch.
+    """
+    return pd.DatetimeIndex(dates).asi8
+
+
+def _segment_suffix_min(keys):
+    """
+    Compute, for each entry of ``keys``, the minimum of the entries from it to
+    the end of its segment.
+
+    ``keys`` must be of the form ``segment * span + value`` with segments in
+    ascending order and ``0 <= value < span``, so that a running minimum taken
+    from the end never carries a value into an earlier segment.
+    """
+    return np.minimum.accumulate(keys[::-1])[::-1]
 
 
 def required_event_fields(next_value_columns, previous_value_columns):
@@ -108,14 +123,20 @@ class EventsLoader(PipelineLoader):
 
         events = events[events[EVENT_DATE_FIELD_NAME].notnull()]
 
+        sids = np.asarray(events[SID_FIELD_NAME])
+        event_dates = _nanos(events[EVENT_DATE_FIELD_NAME])
+        timestamps = _nanos(events[TS_FIELD_NAME])
+
         # We always work with entries from ``events`` directly as numpy arrays,
-        # so we coerce from a frame to a dict of arrays here.
+        # so we coerce from a frame to a dict of arrays here.  The events for
+        # each sid form a contiguous segment, sorted by event date and then
+        # timestamp.
+        order = np.lexsort((timestamps, event_dates, sids))
         self.events = {
-            name: np.asarray(series)
-            for name, series in (
-                events.sort_values(EVENT_DATE_FIELD_NAME).iteritems()
-            )
+            name: np.asarray(series)[order]
+            for name, series in events.iteritems()
         }
+        self._build_index(sids[order], event_dates[order], timestamps[order])
 
         # Columns to load with self.load_next_events.
         self.next_value_columns = next_value_columns
@@ -123,6 +144,153 @@ class EventsLoader(PipelineLoader):
         # Columns to load with self.load_previous_events.
         self.previous_value_columns = previous_value_columns
 
+    def _build_index(self, sids, event_dates, timestamps):
+        """
+        Build the arrays used to find the next and previous events of each
+        sid with ``searchsorted``.
+
+        Dates are replaced by their rank among all of the event dates and
+        timestamps, and each event gets a key of ``segment * span + rank``,
+        where ``segment`` is the position of its sid among the unique sids.
+        Keys of the same kind are sorted across segments, so one
+        ``searchsorted`` call answers a query for every (date, sid) pair.
+        """
+        self._sids, segments, counts = np.unique(
+            sids,
+            return_inverse=True,
+            return_counts=True,
+        )
+        self._segment_stops = np.cumsum(counts)
+        self._segment_starts = self._segment_stops - counts
+
+        effective_dates = np.maximum(event_dates, timestamps)
+        self._dates = np.unique(np.concatenate([event_dates, timestamps]))
+        span = self._span = len(self._dates) + 1
+        offsets = segments.astype(np.int64) * span
+
+        def keys(dates):
+            return offsets + self._dates.searchsorted(dates)
+
+        # The next event of a sid is the first one on or after the date that
+        # had been announced by then.
+        self._event_date_keys = keys(event_dates)
+        self._timestamp_ranks = self._dates.searchsorted(timestamps)
+        self._timestamp_suffix_min = (
+            _segment_suffix_min(keys(timestamps)) - offsets
+        )
+
+        # The previous event of a sid is the last one whose event date and
+        # timestamp have both passed.  The suffix minimum of those dates is
+        # sorted within each segment, and the last event at or before a date
+        # in that order is the last event at or before it in the original.
+        self._effective_date_keys = _segment_suffix_min(keys(effective_dates))
+
+    def _segments(self, sids):
+        """
+        Get the segment of each of ``sids`` and the bounds of its events.
+
+        Sids without events get empty bounds.
+        """
+        sids = np.asarray(sids)
+        segments = self._sids.searchsorted(sids)
+        segments[segments == len(self._sids)] = 0
+        present = self._sids[segments] == sids
+        starts = np.where(present, self._segment_starts[segments], 0)
+        stops = np.where(present, self._segment_stops[segments], 0)
+        return segments, starts, stops
+
+    def next_event_indexer(self, dates, sids):
+        """
+        Construct an index array that, when applied to the arrays in
+        ``self.events``, produces the values of the next event for each sid
+        at each date.
+
+        Locations where no next event was known are filled with -1.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            Row labels for the target output.
+        sids : np.ndarray[int]
+            Column labels for the target output.
+
+        Returns
+        -------
+        indexer : np.ndarray[int64]
+            An array of shape (len(dates), len(sids)).
+        """
+        out = np.full((len(dates), len(sids)), -1, dtype=np.int64)
+        if not len(self._sids):
+            return out
+
+        dates = _nanos(dates)
+        segments, starts, stops = self._segments(sids)
+        first_on_or_after = self._dates.searchsorted(dates, side='left')
+        last_on_or_before = self._dates.searchsorted(dates, side='right') - 1
+
+        # The first event of each sid on or after each date.
+        candidates = self._event_date_keys.searchsorted(
+            segments * self._span + first_on_or_after[:, np.newaxis],
+        ).ravel()
+        stops = np.tile(stops, len(dates))
+        known = np.repeat(last_on_or_before, len(sids))
+
+        # Only look further for the cells where some later event of the sid
+        # had been announced.
+        cells = np.flatnonzero(candidates < stops)
+        cells = cells[
+            self._timestamp_suffix_min[candidates[cells]] <= known[cells]
+        ]
+        candidates = candidates[cells]
+        known = known[cells]
+
+        # Walk forward until the first announced event.  One exists in each
+        # remaining cell, so this never leaves the sid's segment.
+        flat_out = out.ravel()
+        timestamp_ranks = self._timestamp_ranks
+        while len(cells):
+            found = timestamp_ranks[candidates] <= known
+            flat_out[cells[found]] = candidates[found]
+            missing = ~found
+            cells = cells[missing]
+            candidates = candidates[missing] + 1
+            known = known[missing]
+
+        return out
+
+    def previous_event_indexer(self, dates, sids):
+        """
+        Construct an index array that, when applied to the arrays in
+        ``self.events``, produces the values of the previous event for each
+        sid at each date.
+
+        Locations where no previous event was known are filled with -1.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            Row labels for the target output.
+        sids : np.ndarray[int]
+            Column labels for the target output.
+
+        Returns
+        -------
+        indexer : np.ndarray[int64]
+            An array of shape (len(dates), len(sids)).
+        """
+        if not len(self._sids):
+            return np.full((len(dates), len(sids)), -1, dtype=np.int64)
+
+        dates = _nanos(dates)
+        segments, starts, stops = self._segments(sids)
+        last_on_or_before = self._dates.searchsorted(dates, side='right') - 1
+
+        ixs = self._effective_date_keys.searchsorted(
+            segments * self._span + last_on_or_before[:, np.newaxis],
+            side='right',
+        ) - 1
+        return np.where((starts <= ixs) & (ixs < stops), ixs, -1)
+
     def split_next_and_previous_event_columns(self, requested_columns):
         """
         Split requested columns into columns that should load the next known
@@ -152,24 +320,6 @@ class EventsLoader(PipelineLoader):
         groups = groupby(next_or_previous, requested_columns)
         return groups.get('next', ()), groups.get('previous', ())
 
-    def next_event_indexer(self, dates, sids):
-        return next_event_indexer(
-            dates,
-            sids,
-            self.events[EVENT_DATE_FIELD_NAME],
-            self.events[TS_FIELD_NAME],
-            self.events[SID_FIELD_NAME],
-        )
-
-    def previous_event_indexer(self, dates, sids):
-        return previous_event_indexer(
-            dates,
-            sids,
-            self.events[EVENT_DATE_FIELD_NAME],
-            self.events[TS_FIELD_NAME],
-            self.events[SID_FIELD_NAME],
-        )
-
     def load_next_events(self, columns, dates, sids, mask):
         if not columns:
             return {}
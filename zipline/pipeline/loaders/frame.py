@@ -145,32 +145,50 @@ class DataFrameLoader(PipelineLoader):
             )
         return out
 
-    def load_adjusted_array(self, columns, dates, assets, mask):
-        """
-        Load data from our stored baseline.
-        """
-        column = self.column
+    def _check_columns(self, columns):
         if len(columns) != 1:
             raise ValueError(
-                "Can't load multiple columns with DataFrameLoader"
+                "Can't load multiple columns with %s" % type(self).__name__
             )
-        elif columns[0] != column:
+        elif columns[0] != self.column:
             raise ValueError("Can't load unknown column %s" % columns[0])
 
-        date_indexer = self.dates.get_indexer(dates)
-        assets_indexer = self.assets.get_indexer(assets)
-
+    def _make_adjusted_array(self,
+                             data,
+                             date_indexer,
+                             assets_indexer,
+                             dates,
+                             assets,
+                             mask):
         # Boolean arrays with True on matched entries
         good_dates = (date_indexer != -1)
         good_assets = (assets_indexer != -1)
 
+        return AdjustedArray(
+            data=data,
+            # Mask out requested columns/rows that didnt match.
+            mask=(good_assets & as_column(good_dates)) & mask,
+            adjustments=self.format_adjustments(dates, assets),
+            missing_value=self.column.missing_value,
+        )
+
+    def load_adjusted_array(self, columns, dates, assets, mask):
+        """
+        Load data from our stored baseline.
+        """
+        self._check_columns(columns)
+
+        date_indexer = self.dates.get_indexer(dates)
+        assets_indexer = self.assets.get_indexer(assets)
+
         return {
-            column: AdjustedArray(
+            self.column: self._make_adjusted_array(
                 # Pull out requested columns/rows from our baseline data.
-                data=self.baseline[ix_(date_indexer, assets_indexer)],
-                # Mask out requested columns/rows that didnt match.
-                mask=(good_assets & as_column(good_dates)) & mask,
-                adjustments=self.format_adjustments(dates, assets),
-                missing_value=column.missing_value,
+                self.baseline[ix_(date_indexer, assets_indexer)],
+                date_indexer,
+                assets_indexer,
+                dates,
+                assets,
+                mask,
             ),
         }
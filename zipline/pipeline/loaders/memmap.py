@@ -0,0 +1,274 @@
+"""
+PipelineLoader reading a dates x sids matrix from a memory-mapped file.
+"""
+import json
+import os
+
+from numpy import (
+    asarray,
+    float64,
+    full,
+    int64,
+    ix_,
+    load,
+    save,
+    savez,
+)
+from numpy.lib.format import open_memmap
+from pandas import DataFrame, DatetimeIndex, Int64Index, to_datetime
+
+from zipline.utils.numpy_utils import object_dtype
+from .frame import ADJUSTMENT_COLUMNS, DataFrameLoader
+
+FORMAT_VERSION = 0
+
+VALUES_FILE = 'values.npy'
+DATES_FILE = 'dates.npy'
+SIDS_FILE = 'sids.npy'
+ADJUSTMENTS_FILE = 'adjustments.npz'
+METADATA_FILE = 'metadata.json'
+
+_ADJUSTMENT_DATE_COLUMNS = ('start_date', 'end_date', 'apply_date')
+
+
+def _dates_to_int64(dates):
+    dates = DatetimeIndex(dates)
+    if dates.tz is not None:
+        dates = dates.tz_convert('UTC').tz_localize(None)
+    return dates.values.view(int64)
+
+
+def _dates_from_int64(values, tz):
+    dates = DatetimeIndex(values.astype('datetime64[ns]'))
+    if tz is not None:
+        dates = dates.tz_localize('UTC').tz_convert(tz)
+    return dates
+
+
+class MemmapFrameWriter(object):
+    """
+    Writer for the on-disk format read by MemmapDataFrameLoader.
+
+    The baseline is stored as an uncompressed ``.npy`` matrix of shape
+    ``(len(dates), len(sids))`` so that it can be memory-mapped. Adjustments
+    are stored next to it as a small side table.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory in which to write the data.
+
+    See Also
+    --------
+    zipline.pipeline.loaders.memmap.MemmapDataFrameLoader
+    """
+    def __init__(self, rootdir):
+        self._rootdir = rootdir
+
+    def _path(self, name):
+        return os.path.join(self._rootdir, name)
+
+    def open(self, dates, sids, dtype):
+        """
+        Create a writable memory-mapped baseline matrix.
+
+        This can be used to write datasets that don't fit in memory in
+        chunks of dates.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            The row labels of the baseline. Dates should be labelled with the
+            first date on which a value would be available to an algorithm.
+        sids : iterable[int]
+            The column labels of the baseline.
+        dtype : np.dtype
+            The dtype of the baseline.
+
+        Returns
+        -------
+        values : np.memmap
+            A writable array of shape ``(len(dates), len(sids))``. Call
+            ``flush`` on it once it has been filled.
+
+        Raises
+        ------
+        TypeError
+            Raised if ``dtype`` can't be memory-mapped.
+        """
+        if dtype == object_dtype:
+            raise TypeError("Can't memory-map a baseline of dtype object.")
+
+        if not os.path.isdir(self._rootdir):
+            os.makedirs(self._rootdir)
+
+        dates = DatetimeIndex(dates)
+        tz = None if dates.tz is None else str(dates.tz)
+        save(self._path(DATES_FILE), _dates_to_int64(dates))
+        save(self._path(SIDS_FILE), asarray(sids, dtype=int64))
+        with open(self._path(METADATA_FILE), 'w') as f:
+            json.dump({'version': FORMAT_VERSION, 'tz': tz}, f)
+
+        self.write_adjustments(None)
+        return open_memmap(
+            self._path(VALUES_FILE),
+            mode='w+',
+            dtype=dtype,
+            shape=(len(dates), len(sids)),
+        )
+
+    def write_adjustments(self, adjustments):
+        """
+        Write the adjustments side table.
+
+        Parameters
+        ----------
+        adjustments : pd.DataFrame or None
+            A DataFrame in the format accepted by DataFrameLoader. None is
+            interpreted as "no adjustments to the baseline".
+        """
+        if adjustments is None:
+            adjustments = DataFrame(columns=ADJUSTMENT_COLUMNS)
+        adjustments = adjustments.reindex_axis(ADJUSTMENT_COLUMNS, axis=1)
+
+        arrays = {}
+        for name in ADJUSTMENT_COLUMNS:
+            if name in _ADJUSTMENT_DATE_COLUMNS:
+                arrays[name] = _dates_to_int64(to_datetime(adjustments[name]))
+            elif name == 'value':
+                arrays[name] = asarray(adjustments[name])
+                if arrays[name].dtype == object_dtype:
+                    if len(adjustments):
+                        raise TypeError(
+                            "Can't write adjustments with values of dtype"
+                            " object."
+                        )
+                    arrays[name] = arrays[name].astype(float64)
+            else:
+                arrays[name] = asarray(adjustments[name], dtype=int64)
+        savez(self._path(ADJUSTMENTS_FILE), **arrays)
+
+    def write(self, baseline, adjustments=None):
+        """
+        Write a baseline DataFrame and its adjustments.
+
+        Parameters
+        ----------
+        baseline : pd.DataFrame
+            A DataFrame with index of type DatetimeIndex and columns of type
+            Int64Index.
+        adjustments : pd.DataFrame, optional
+            A DataFrame in the format accepted by DataFrameLoader.
+        """
+        data = baseline.values
+        values = self.open(baseline.index, baseline.columns, data.dtype)
+        values[:] = data
+        values.flush()
+        self.write_adjustments(adjustments)
+
+
+class MemmapDataFrameLoader(DataFrameLoader):
+    """
+    A DataFrameLoader that reads its baseline from a memory-mapped file.
+
+    Only the rows and columns requested by each call to
+    ``load_adjusted_array`` are read from disk, so this can be used with
+    datasets that are larger than the available memory.
+
+    Parameters
+    ----------
+    column : zipline.pipeline.data.BoundColumn
+        The column whose data is loadable by this loader.
+    rootdir : str
+        A directory written by MemmapFrameWriter.
+
+    See Also
+    --------
+    zipline.pipeline.loaders.frame.DataFrameLoader
+    zipline.pipeline.loaders.memmap.MemmapFrameWriter
+    """
+    def __init__(self, column, rootdir):
+        with open(os.path.join(rootdir, METADATA_FILE)) as f:
+            metadata = json.load(f)
+        if metadata['version'] != FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported memmap format version %r in %r." % (
+                    metadata['version'],
+                    rootdir,
+                )
+            )
+        tz = metadata['tz']
+
+        self.column = column
+        self.baseline = load(
+            os.path.join(rootdir, VALUES_FILE),
+            mmap_mode='r',
+        )
+        self.dates = _dates_from_int64(
+            load(os.path.join(rootdir, DATES_FILE)),
+            tz,
+        )
+        self.assets = Int64Index(load(os.path.join(rootdir, SIDS_FILE)))
+
+        with load(os.path.join(rootdir, ADJUSTMENTS_FILE)) as f:
+            adjustments = DataFrame({
+                name: (
+                    _dates_from_int64(f[name], tz)
+                    if name in _ADJUSTMENT_DATE_COLUMNS else
+                    f[name]
+                )
+                for name in ADJUSTMENT_COLUMNS
+            }, columns=ADJUSTMENT_COLUMNS)
+        adjustments.sort_values(['apply_date', 'sid'], inplace=True)
+
+        self.adjustments = adjustments
+        self.adjustment_apply_dates = DatetimeIndex(adjustments.apply_date)
+        self.adjustment_end_dates = DatetimeIndex(adjustments.end_date)
+        self.adjustment_sids = Int64Index(adjustments.sid)
+
+    def _take(self, date_indexer, assets_indexer):
+        """
+        Read the requested rows and columns of the baseline.
+
+        Locations that aren't in the baseline are filled with the column's
+        missing value.
+        """
+        column = self.column
+        out = full(
+            (len(date_indexer), len(assets_indexer)),
+            column.missing_value,
+            dtype=column.dtype,
+        )
+        good_dates = date_indexer != -1
+        good_assets = assets_indexer != -1
+        if not (good_dates.any() and good_assets.any()):
+            return out
+
+        # Slice down to the requested block of rows before indexing so that
+        # only those pages of the file are read.
+        rows = date_indexer[good_dates]
+        first_row = rows.min()
+        block = self.baseline[first_row:rows.max() + 1]
+        out[ix_(good_dates, good_assets)] = block[
+            ix_(rows - first_row, assets_indexer[good_assets])
+        ]
+        return out
+
+    def load_adjusted_array(self, columns, dates, assets, mask):
+        """
+        Load data from our memory-mapped baseline.
+        """
+        self._check_columns(columns)
+
+        date_indexer = self.dates.get_indexer(dates)
+        assets_indexer = self.assets.get_indexer(assets)
+        return {
+            self.column: self._make_adjusted_array(
+                self._take(date_indexer, assets_indexer),
+                date_indexer,
+                assets_indexer,
+                dates,
+                assets,
+                mask,
+            ),
+        }
@@ -223,6 +223,7 @@ class LatestMixin(SingleInputMixin):
     Mixin for behavior shared by Custom{Factor,Filter,Classifier}.
     """
     window_length = 1
+    columnwise = True
 
     def compute(self, today, assets, out, data):
         out[:] = data[-1]
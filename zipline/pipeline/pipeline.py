@@ -176,7 +176,7 @@ class Pipeline(object):
             The last date of requested output.
         """
         return ExecutionPlan(
-            self._prepare_graph_terms(screen_name, default_screen),
+            self.graph_terms(screen_name, default_screen),
             all_dates,
             start_date,
             end_date,
@@ -194,11 +194,25 @@ class Pipeline(object):
             Term to use as a screen if self.screen is None.
         """
         return TermGraph(
-            self._prepare_graph_terms(screen_name, default_screen)
+            self.graph_terms(screen_name, default_screen)
         )
 
-    def _prepare_graph_terms(self, screen_name, default_screen):
-        """Helper for to_graph and to_execution_plan."""
+    def graph_terms(self, screen_name, default_screen):
+        """
+        Get the terms that should be outputs of a graph of this pipeline.
+
+        Parameters
+        ----------
+        screen_name : str
+            Name to supply for self.screen.
+        default_screen : zipline.pipeline.term.Term
+            Term to use as a screen if self.screen is None.
+
+        Returns
+        -------
+        terms : dict[str -> Term]
+            Map from name to term for each column and for the screen.
+        """
         columns = self.columns.copy()
         screen = self.screen
         if screen is None:
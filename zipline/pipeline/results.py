@@ -0,0 +1,276 @@
+"""
+Columnar containers for the results of running a Pipeline.
+"""
+from numpy import (
+    array,
+    concatenate,
+    cumsum,
+    diff,
+    empty,
+    int64,
+    repeat,
+    searchsorted,
+    unique,
+)
+from pandas import DataFrame, MultiIndex
+from six import iteritems
+
+from zipline.utils.memoize import lazyval
+from zipline.utils.numpy_utils import repeat_first_axis
+
+
+class PipelineResult(object):
+    """
+    The results of a pipeline stored as flat columns.
+
+    Rows for each date are stored contiguously, in the same format as a
+    compressed sparse row matrix: the rows for ``dates[i]`` are the rows
+    between ``offsets[i]`` and ``offsets[i + 1]``.  This makes looking up the
+    results for a single date O(1), without building a MultiIndex over every
+    (date, asset) pair.
+
+    Parameters
+    ----------
+    dates : pd.DatetimeIndex
+        The dates for which results were computed.
+    offsets : np.ndarray[int64]
+        Array of length ``len(dates) + 1`` containing the first row for each
+        date, followed by the total number of rows.
+    sids : np.ndarray[int64]
+        The sid of the asset for each row.
+    columns : dict[str -> np.ndarray]
+        Map from column name to the value of that column for each row.
+    terms : dict[str -> zipline.pipeline.term.Term]
+        Map from column name to the term that computed that column.  Each
+        term's ``postprocess`` method is called on values before they are put
+        into a DataFrame.
+    asset_finder : zipline.assets.AssetFinder
+        AssetFinder used to convert sids into Asset objects.
+
+    See Also
+    --------
+    zipline.pipeline.engine.SimplePipelineEngine.run_pipeline
+    """
+    __slots__ = (
+        'dates',
+        'offsets',
+        'sids',
+        '_columns',
+        '_terms',
+        '_finder',
+        '__weakref__',
+    )
+
+    def __init__(self, dates, offsets, sids, columns, terms, asset_finder):
+        if len(offsets) != len(dates) + 1:
+            raise ValueError(
+                "Expected %d offsets for %d dates, but got %d." % (
+                    len(dates) + 1, len(dates), len(offsets),
+                )
+            )
+        self.dates = dates
+        self.offsets = offsets
+        self.sids = sids
+        self._columns = columns
+        self._terms = terms
+        self._finder = asset_finder
+
+    @classmethod
+    def from_mask(cls, terms, data, mask, dates, assets, asset_finder):
+        """
+        Construct a PipelineResult from computed pipeline results.
+
+        Parameters
+        ----------
+        terms : dict[str -> Term]
+            Dict mapping column names to terms.
+        data : dict[str -> ndarray[ndim=2]]
+            Dict mapping column names to computed results for those names.
+        mask : ndarray[bool, ndim=2]
+            Mask array of values to keep.
+        dates : pd.DatetimeIndex
+            Row index for arrays `data` and `mask`.
+        assets : pd.Int64Index
+            Column index for arrays `data` and `mask`.
+        asset_finder : zipline.assets.AssetFinder
+            AssetFinder used to convert sids into Asset objects.
+        """
+        offsets = concatenate([[0], cumsum(mask.sum(axis=1))]).astype(int64)
+        sids = repeat_first_axis(
+            assets.values.astype(int64),
+            len(dates),
+        )[mask]
+        return cls(
+            dates,
+            offsets,
+            sids,
+            {name: arr[mask] for name, arr in iteritems(data)},
+            terms,
+            asset_finder,
+        )
+
+    @property
+    def columns(self):
+        """
+        The names of the columns in this result.
+        """
+        return sorted(self._columns)
+
+    def __len__(self):
+        return len(self.sids)
+
+    def _bounds(self, date):
+        loc = self.dates.get_loc(date)
+        return self.offsets[loc], self.offsets[loc + 1]
+
+    def sids_for(self, date):
+        """
+        Get the sids of the assets with results on ``date``.
+
+        Parameters
+        ----------
+        date : pd.Timestamp
+            The date to look up.
+
+        Returns
+        -------
+        sids : np.ndarray[int64]
+            A view into ``self.sids``.
+
+        Raises
+        ------
+        KeyError
+            Raised if ``date`` is not in ``self.dates``.
+        """
+        start, stop = self._bounds(date)
+        return self.sids[start:stop]
+
+    def values_for(self, date, column):
+        """
+        Get the raw values of ``column`` on ``date``.
+
+        Parameters
+        ----------
+        date : pd.Timestamp
+            The date to look up.
+        column : str
+            The name of the column to look up.
+
+        Returns
+        -------
+        values : np.ndarray
+            A view into the stored column, aligned with
+            ``self.sids_for(date)``.
+
+        Raises
+        ------
+        KeyError
+            Raised if ``date`` is not in ``self.dates`` or ``column`` is not
+            in ``self.columns``.
+        """
+        start, stop = self._bounds(date)
+        return self._columns[column][start:stop]
+
+    def frame_for(self, date):
+        """
+        Get the results for ``date`` as a DataFrame indexed by asset.
+
+        This is equivalent to ``self.to_frame().loc[date]`` but doesn't require
+        building the full frame.  If no assets have results on ``date``, an
+        empty DataFrame is returned.
+
+        Parameters
+        ----------
+        date : pd.Timestamp
+            The date to look up.
+
+        Returns
+        -------
+        frame : pd.DataFrame
+
+        Raises
+        ------
+        KeyError
+            Raised if ``date`` is not in ``self.dates``.
+        """
+        start, stop = self._bounds(date)
+        return DataFrame(
+            data={
+                name: self._terms[name].postprocess(column[start:stop])
+                for name, column in iteritems(self._columns)
+            },
+            index=self._resolve_assets(self.sids[start:stop]),
+            columns=self.columns,
+        )
+
+    def _resolve_assets(self, sids):
+        """
+        Convert an array of sids into an array of Asset objects.
+        """
+        unique_sids = unique(sids)
+        resolved = array(self._finder.retrieve_all(unique_sids))
+        # Build the output array explicitly to ensure that we get an object
+        # array, even when ``sids`` is empty.
+        out = empty(len(sids), dtype=object)
+        out[:] = resolved[searchsorted(unique_sids, sids)]
+        return out
+
+    @lazyval
+    def frame(self):
+        """
+        The results as a DataFrame with a (date, asset) MultiIndex.
+
+        This is the format returned by
+        ``SimplePipelineEngine.run_pipeline``.  It is computed the first time
+        it is accessed.
+        """
+        if not len(self):
+            # Manually handle the empty DataFrame case. This is a workaround
+            # to pandas failing to tz_localize an empty dataframe with a
+            # MultiIndex.
+            #
+            # Slicing `dates` here to preserve pandas metadata.
+            empty_dates = self.dates[:0]
+            empty_assets = array([], dtype=object)
+            return DataFrame(
+                data={
+                    name: array([], dtype=arr.dtype)
+                    for name, arr in iteritems(self._columns)
+                },
+                index=MultiIndex.from_arrays([empty_dates, empty_assets]),
+            )
+
+        dates_kept = repeat(self.dates.values, diff(self.offsets))
+        assets_kept = self._resolve_assets(self.sids)
+
+        final_columns = {}
+        for name, column in iteritems(self._columns):
+            # Each term that computed an output has its postprocess method
+            # called on the filtered result.
+            #
+            # As of Mon May 2 15:38:47 2016, we only use this to convert
+            # LabelArrays into categoricals.
+            final_columns[name] = self._terms[name].postprocess(column)
+
+        return DataFrame(
+            data=final_columns,
+            index=MultiIndex.from_arrays([dates_kept, assets_kept]),
+        ).tz_localize('UTC', level=0)
+
+    def to_frame(self):
+        """
+        Get the results as a DataFrame with a (date, asset) MultiIndex.
+
+        See Also
+        --------
+        PipelineResult.frame
+        """
+        return self.frame
+
+    def __repr__(self):
+        return "<{type}: {nrows} rows, {ndates} dates, {columns}>".format(
+            type=type(self).__name__,
+            nrows=len(self),
+            ndates=len(self.dates),
+            columns=self.columns,
+        )
@@ -62,6 +62,13 @@ class Term(with_metaclass(ABCMeta, object)):
     # Determines if a term is safe to be used as a windowed input.
     window_safe = False
 
+    # Determines if each column of a term's output depends only on the same
+    # column of its inputs.  Such terms can be computed on any subset of
+    # assets without changing their values, which lets the engine skip assets
+    # that can never pass a pipeline's screen.  Subclasses that override
+    # ``compute`` or ``_compute`` must set this again, see ``is_columnwise``.
+    columnwise = False
+
     # The dimensions of the term's output (1D or 2D).
     ndim = 2
 
@@ -371,6 +378,7 @@ class AssetExists(Term):
     dependencies = {}
     mask = None
     windowed = False
+    columnwise = True
 
     def __repr__(self):
         return "AssetExists()"
@@ -397,6 +405,7 @@ class InputDates(Term):
     mask = None
     windowed = False
     window_safe = True
+    columnwise = True
 
     def __repr__(self):
         return "InputDates()"
@@ -416,6 +425,7 @@ class LoadableTerm(Term):
     """
     windowed = False
     inputs = ()
+    columnwise = True
 
     @lazyval
     def dependencies(self):
@@ -684,6 +694,39 @@ class Slice(ComputableTerm):
         )
 
 
+def is_columnwise(term):
+    """
+    Check whether ``term`` can be computed on any subset of assets without
+    changing its values.
+
+    ``columnwise`` is inherited, so a subclass of a columnwise term that
+    replaces its computation, for example with a cross-sectional rank, would
+    otherwise claim to be columnwise too.  A term is only columnwise if
+    ``compute`` and ``_compute`` aren't overridden by a class below the one
+    that set ``columnwise``.
+
+    Parameters
+    ----------
+    term : zipline.pipeline.Term
+        The term to check.
+
+    Returns
+    -------
+    columnwise : bool
+    """
+    mro = type(term).__mro__
+    declared_at = next(
+        i for i, cls in enumerate(mro) if 'columnwise' in vars(cls)
+    )
+    if not vars(mro[declared_at])['columnwise']:
+        return False
+
+    return not any(
+        'compute' in vars(cls) or '_compute' in vars(cls)
+        for cls in mro[:declared_at]
+    )
+
+
 def validate_dtype(termname, dtype, missing_value):
     """
     Validate a `dtype` and `missing_value` passed to Term.__new__.
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pandas as pd
 
 from zipline.errors import (
@@ -20,6 +21,9 @@ from zipline.errors import (
     BenchmarkAssetNotAvailableTooEarly,
     BenchmarkAssetNotAvailableTooLate
 )
+from zipline.utils.memoize import lazyval
+
+_NANOS_IN_DAY = 24 * 60 * 60 * 10 ** 9
 
 
 class BenchmarkSource(object):
@@ -72,6 +76,56 @@ class BenchmarkSource(object):
     def get_value(self, dt):
         return self._precalculated_series.loc[dt]
 
+    @lazyval
+    def _returns_since_midnight(self):
+        """
+        The compounded return of the benchmark from midnight UTC to each
+        minute of the series, as an int64 array of the minutes and a float64
+        array of the returns.
+        """
+        series = self._precalculated_series
+        if not len(series):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        minutes = series.index.asi8
+        returns = series.values.astype(np.float64)
+        # Missing returns are skipped, like pd.Series.prod does.
+        growth = np.where(np.isnan(returns), 1.0, 1.0 + returns)
+
+        days = minutes // _NANOS_IN_DAY
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        stops = np.r_[starts[1:], len(growth)]
+
+        since_midnight = np.empty_like(growth)
+        for start, stop in zip(starts, stops):
+            np.cumprod(growth[start:stop], out=since_midnight[start:stop])
+        since_midnight -= 1.0
+        return minutes, since_midnight
+
+    def get_return_since_open(self, dt):
+        """
+        Get the compounded return of the benchmark from the start of the day
+        to ``dt``, for minute emission.
+
+        Parameters
+        ----------
+        dt : pd.Timestamp
+            The minute to get the return up to, inclusive.
+
+        Returns
+        -------
+        return_since_open : float
+            The return of the benchmark between midnight UTC on the day of
+            ``dt`` and ``dt``. This is 0.0 if there are no benchmark returns
+            in that range.
+        """
+        minutes, since_midnight = self._returns_since_midnight
+        dt_nanos = dt.value
+        ix = minutes.searchsorted(dt_nanos, side='right') - 1
+        if ix < 0 or minutes[ix] // _NANOS_IN_DAY != dt_nanos // _NANOS_IN_DAY:
+            return 0.0
+        return since_midnight[ix]
+
     def _validate_benchmark(self, benchmark_asset):
         # check if this security has a stock dividend.  if so, raise an
         # error suggesting that the user pick a different asset to use
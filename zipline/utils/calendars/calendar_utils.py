@@ -3,26 +3,23 @@ from zipline.errors import (
     CyclicCalendarAlias,
     InvalidCalendarName,
 )
-from zipline.utils.calendars.exchange_calendar_cfe import CFEExchangeCalendar
-from zipline.utils.calendars.exchange_calendar_ice import ICEExchangeCalendar
-from zipline.utils.calendars.exchange_calendar_nyse import NYSEExchangeCalendar
-from zipline.utils.calendars.exchange_calendar_cme import CMEExchangeCalendar
-from zipline.utils.calendars.exchange_calendar_bmf import BMFExchangeCalendar
-from zipline.utils.calendars.exchange_calendar_lse import LSEExchangeCalendar
-from zipline.utils.calendars.exchange_calendar_tsx import TSXExchangeCalendar
-from zipline.utils.calendars.us_futures_calendar import (
-    QuantopianUSFuturesCalendar,
-)
+from zipline.utils.imports import DeferredCallable
 
+# The calendar types are only imported when a calendar is first requested,
+# because building their holiday rules is a noticeable part of the zipline
+# import time.
 _default_calendar_factories = {
-    'NYSE': NYSEExchangeCalendar,
-    'CME': CMEExchangeCalendar,
-    'ICE': ICEExchangeCalendar,
-    'CFE': CFEExchangeCalendar,
-    'BMF': BMFExchangeCalendar,
-    'LSE': LSEExchangeCalendar,
-    'TSX': TSXExchangeCalendar,
-    'us_futures': QuantopianUSFuturesCalendar,
+    name: DeferredCallable('zipline.utils.calendars.' + module, type_name)
+    for name, module, type_name in (
+        ('NYSE', 'exchange_calendar_nyse', 'NYSEExchangeCalendar'),
+        ('CME', 'exchange_calendar_cme', 'CMEExchangeCalendar'),
+        ('ICE', 'exchange_calendar_ice', 'ICEExchangeCalendar'),
+        ('CFE', 'exchange_calendar_cfe', 'CFEExchangeCalendar'),
+        ('BMF', 'exchange_calendar_bmf', 'BMFExchangeCalendar'),
+        ('LSE', 'exchange_calendar_lse', 'LSEExchangeCalendar'),
+        ('TSX', 'exchange_calendar_tsx', 'TSXExchangeCalendar'),
+        ('us_futures', 'us_futures_calendar', 'QuantopianUSFuturesCalendar'),
+    )
 }
 _default_calendar_aliases = {
     'NASDAQ': 'NYSE',
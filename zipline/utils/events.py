@@ -152,6 +152,42 @@ def _build_time(time, kwargs):
         return datetime.time(**kwargs)
 
 
+def _session_indices(cal, minutes):
+    """
+    Get the position in ``cal.schedule`` of the session containing each of
+    ``minutes``, which are nanoseconds since the epoch.
+    """
+    return np.searchsorted(cal.market_closes_nanos, minutes)
+
+
+def _session_labels(cal, minutes):
+    """
+    Get the label of the session containing each of ``minutes``, as
+    nanoseconds since the epoch.
+    """
+    return cal.schedule.index.asi8[_session_indices(cal, minutes)]
+
+
+def _defining_class(cls, name):
+    return next(klass for klass in cls.__mro__ if name in vars(klass))
+
+
+def _trigger_mask(rule, minutes):
+    """
+    Get ``rule.trigger_mask(minutes)``, or None if the rule's
+    ``should_trigger`` was replaced without also replacing ``trigger_mask``.
+    """
+    if 'should_trigger' in vars(rule):
+        return None
+
+    cls = type(rule)
+    if not issubclass(_defining_class(cls, 'trigger_mask'),
+                      _defining_class(cls, 'should_trigger')):
+        return None
+
+    return rule.trigger_mask(minutes)
+
+
 @curry
 def lossless_float_to_int(funcname, func, argname, arg):
     """
@@ -177,6 +213,10 @@ def lossless_float_to_int(funcname, func, argname, arg):
     raise TypeError(arg)
 
 
+# Marks an event whose rule triggers on every minute of the simulation.
+_EVERY_MINUTE = 'every_minute'
+
+
 class EventManager(object):
     """Manages a list of Event objects.
     This manages the logic for checking the rules and dispatching to the
@@ -196,6 +236,11 @@ class EventManager(object):
             lambda *_: nop_context
         )
 
+        # The minutes at which each event triggers, filled in by ``compile``.
+        # None means that the event's rule is checked every minute.
+        self._triggers = None
+        self._build_timeline()
+
     def add_event(self, event, prepend=False):
         """
         Adds an event to the manager.
@@ -205,14 +250,173 @@ class EventManager(object):
         else:
             self._events.append(event)
 
+        if self._triggers is not None:
+            # Events added after the rules were compiled are checked every
+            # minute.
+            if prepend:
+                self._triggers.insert(0, None)
+            else:
+                self._triggers.append(None)
+        self._build_timeline()
+
+    def compile(self, minutes):
+        """
+        Compute ahead of time the minutes at which each event triggers.
+
+        Once compiled, ``handle_data`` finds the events that trigger at each
+        minute by walking a sorted array of trigger minutes instead of asking
+        every rule, so the events cost nothing on the minutes where they
+        don't trigger. Rules that can't be computed ahead of time are still
+        checked every minute.
+
+        Parameters
+        ----------
+        minutes : np.ndarray[int64]
+            The sorted minutes at which ``handle_data`` will be called, as
+            nanoseconds since the epoch.
+
+        Notes
+        -----
+        Like the rules themselves, this relies on the clock only ever moving
+        forward.
+        """
+        minutes = np.asarray(minutes, dtype=np.int64)
+        triggers = []
+        for event in self._events:
+            mask = _trigger_mask(event.rule, minutes)
+            if mask is None:
+                triggers.append(None)
+            elif mask.all():
+                triggers.append(_EVERY_MINUTE)
+            else:
+                triggers.append(minutes[mask])
+
+        self._triggers = triggers
+        self._build_timeline()
+
+    def trigger_minutes(self, ignore=()):
+        """
+        Get the minutes at which any of the events may trigger.
+
+        Parameters
+        ----------
+        ignore : iterable[Event], optional
+            Events to leave out.
+
+        Returns
+        -------
+        minutes : np.ndarray[int64] or None
+            The sorted minutes, as nanoseconds since the epoch, or None if
+            some event may trigger at any minute. This is always None before
+            the events are compiled.
+        """
+        if self._triggers is None:
+            return None
+
+        ignore = {id(event) for event in ignore}
+        minutes = [np.array([], dtype=np.int64)]
+        for event, trigger in zip(self._events, self._triggers):
+            if id(event) in ignore:
+                continue
+            if trigger is None or trigger is _EVERY_MINUTE:
+                return None
+            minutes.append(trigger)
+        return np.unique(np.concatenate(minutes))
+
+    def _build_timeline(self):
+        """
+        Build the structures used by ``_events_at`` from ``self._triggers``.
+        """
+        triggers = self._triggers
+        if triggers is None:
+            triggers = [None] * len(self._events)
+
+        # The events to consider at every minute, in order, paired with
+        # whether they are known to trigger.
+        untimed = [
+            (ix, trigger is _EVERY_MINUTE)
+            for ix, trigger in enumerate(triggers)
+            if trigger is None or trigger is _EVERY_MINUTE
+        ]
+        self._untimed_events = tuple(
+            (self._events[ix], triggered) for ix, triggered in untimed
+        )
+
+        timed = [
+            (ix, trigger)
+            for ix, trigger in enumerate(triggers)
+            if trigger is not None and trigger is not _EVERY_MINUTE
+        ]
+        if timed:
+            minutes = np.concatenate([trigger for _, trigger in timed])
+            owners = np.concatenate([
+                np.full(len(trigger), ix, dtype=np.int64)
+                for ix, trigger in timed
+            ])
+            order = np.lexsort((owners, minutes))
+            minutes = minutes[order]
+            owners = owners[order]
+            timeline, starts = np.unique(minutes, return_index=True)
+            owners_at = np.split(owners, starts[1:])
+        else:
+            timeline = np.array([], dtype=np.int64)
+            owners_at = []
+
+        self._timeline = timeline
+        self._timeline_events = [
+            tuple(
+                (self._events[ix], triggered)
+                for ix, triggered in sorted(
+                    untimed + [(ix, True) for ix in owners.tolist()]
+                )
+            )
+            for owners in owners_at
+        ]
+        self._timeline_pos = 0
+        self._next_trigger = int(timeline[0]) if len(timeline) else None
+
+    def _events_at(self, dt):
+        """
+        Get the events to consider at ``dt``, in order, paired with whether
+        they are known to trigger.
+        """
+        next_trigger = self._next_trigger
+        if next_trigger is None:
+            return self._untimed_events
+
+        dt_value = dt.value
+        if dt_value < next_trigger:
+            return self._untimed_events
+
+        pos = self._timeline_pos
+        timeline = self._timeline
+        if dt_value > next_trigger:
+            # We skipped over some trigger minutes.
+            pos = timeline.searchsorted(dt_value)
+            if pos == len(timeline) or timeline[pos] != dt_value:
+                self._timeline_pos = pos
+                self._next_trigger = (
+                    int(timeline[pos]) if pos < len(timeline) else None
+                )
+                return self._untimed_events
+
+        self._timeline_pos = pos + 1
+        self._next_trigger = (
+            int(timeline[pos + 1]) if pos + 1 < len(timeline) else None
+        )
+        return self._timeline_events[pos]
+
     def handle_data(self, context, data, dt):
         with self._create_context(data):
-            for event in self._events:
-                event.handle_data(
-                    context,
-                    data,
-                    dt,
-                )
+            for event, triggered in self._events_at(dt):
+                if triggered:
+                    event.callback(context, data)
+                else:
+                    event.handle_data(
+                        context,
+                        data,
+                        dt,
+                    )
 
 
 class Event(namedtuple('Event', ['rule', 'callback'])):
@@ -242,6 +446,26 @@ class EventRule(six.with_metaclass(ABCMeta)):
         """
         raise NotImplementedError('should_trigger')
 
+    def trigger_mask(self, minutes):
+        """
+        Compute whether the rule triggers at each of ``minutes``, assuming
+        that they are all of the minutes the rule will be checked at.
+
+        Rules that can't be computed ahead of time return None and are
+        checked with ``should_trigger`` as the simulation runs.
+
+        Parameters
+        ----------
+        minutes : np.ndarray[int64]
+            The sorted minutes to check, as nanoseconds since the epoch.
+
+        Returns
+        -------
+        mask : np.ndarray[bool] or None
+            Whether the rule triggers at each minute.
+        """
+        return None
+
 
 class StatelessRule(EventRule):
     """
@@ -299,6 +523,18 @@ class ComposedRule(StatelessRule):
         """
         return first_should_trigger(dt) and second_should_trigger(dt)
 
+    def trigger_mask(self, minutes):
+        if self.composer is not ComposedRule.lazy_and:
+            return None
+
+        first = _trigger_mask(self.first, minutes)
+        if first is None:
+            return None
+        second = _trigger_mask(self.second, minutes)
+        if second is None:
+            return None
+        return first & second
+
 
 class Always(StatelessRule):
     """
@@ -312,6 +548,9 @@ class Always(StatelessRule):
         return True
     should_trigger = always_trigger
 
+    def trigger_mask(self, minutes):
+        return np.ones(len(minutes), dtype=bool)
+
 
 class Never(StatelessRule):
     """
@@ -325,6 +564,9 @@ class Never(StatelessRule):
         return False
     should_trigger = never_trigger
 
+    def trigger_mask(self, minutes):
+        return np.zeros(len(minutes), dtype=bool)
+
 
 class AfterOpen(StatelessRule):
     """
@@ -373,6 +615,14 @@ class AfterOpen(StatelessRule):
 
         return dt == self._period_end
 
+    def trigger_mask(self, minutes):
+        opens = self.cal.market_opens_nanos[
+            _session_indices(self.cal, minutes)
+        ]
+        return minutes == opens + pd.Timedelta(
+            self.offset - self._one_minute,
+        ).value
+
 
 class BeforeClose(StatelessRule):
     """
@@ -420,6 +670,12 @@ class BeforeClose(StatelessRule):
 
         return self._period_start == dt
 
+    def trigger_mask(self, minutes):
+        closes = self.cal.market_closes_nanos[
+            _session_indices(self.cal, minutes)
+        ]
+        return minutes == closes - pd.Timedelta(self.offset).value
+
 
 class NotHalfDay(StatelessRule):
     """
@@ -429,6 +685,12 @@ class NotHalfDay(StatelessRule):
         return self.cal.minute_to_session_label(dt) \
             not in self.cal.early_closes
 
+    def trigger_mask(self, minutes):
+        return ~np.in1d(
+            _session_labels(self.cal, minutes),
+            self.cal.early_closes.asi8,
+        )
+
 
 class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
     @preprocess(n=lossless_float_to_int('TradingDayOfWeekRule'))
@@ -443,6 +705,12 @@ class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
         val = self.cal.minute_to_session_label(dt, direction="none").value
         return val in self.execution_period_values
 
+    def trigger_mask(self, minutes):
+        return np.in1d(
+            _session_labels(self.cal, minutes),
+            np.array(list(self.execution_period_values), dtype=np.int64),
+        )
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -488,6 +756,12 @@ class TradingDayOfMonthRule(six.with_metaclass(ABCMeta, StatelessRule)):
         value = self.cal.minute_to_session_label(dt, direction="none").value
         return value in self.execution_period_values
 
+    def trigger_mask(self, minutes):
+        return np.in1d(
+            _session_labels(self.cal, minutes),
+            np.array(list(self.execution_period_values), dtype=np.int64),
+        )
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -560,6 +834,30 @@ class OncePerDay(StatefulRule):
             self.triggered = True
             return True
 
+    def trigger_mask(self, minutes):
+        mask = _trigger_mask(self.rule, minutes)
+        if mask is None:
+            return None
+
+        # Find the minutes at which ``should_trigger`` would start a new day:
+        # the first minute, then the first minute at least a day after the
+        # start of the previous day.
+        one_day = pd.Timedelta(1, unit='d').value
+        day_starts = []
+        pos = 0
+        while pos < len(minutes):
+            day_starts.append(pos)
+            pos = minutes.searchsorted(minutes[pos] + one_day)
+
+        # Only keep the first trigger of each day.
+        triggers = np.flatnonzero(mask)
+        days = np.searchsorted(day_starts, triggers, side='right') - 1
+        _, first_of_day = np.unique(days, return_index=True)
+
+        once_per_day = np.zeros(len(minutes), dtype=bool)
+        once_per_day[triggers[first_of_day]] = True
+        return once_per_day
+
 
 # Factory API
 
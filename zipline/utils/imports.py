@@ -0,0 +1,202 @@
+"""
+Utilities for deferring and measuring imports.
+"""
+from collections import namedtuple
+from importlib import import_module
+import json
+import os
+import subprocess
+import sys
+from tempfile import mkstemp
+
+
+class DeferredCallable(object):
+    """
+    A callable that is looked up by name the first time it is called.
+
+    This lets modules register objects from optional or expensive subsystems,
+    for example calendar types and bundle ingest functions, without importing
+    those subsystems until they are actually used.
+
+    Parameters
+    ----------
+    module_name : str
+        The absolute name of the module that defines the callable.
+    name : str
+        The name of the callable in ``module_name``.
+    """
+    def __init__(self, module_name, name):
+        self.module_name = module_name
+        self.name = name
+        self._resolved = None
+
+    def __repr__(self):
+        return '<%s: %s.%s>' % (
+            type(self).__name__,
+            self.module_name,
+            self.name,
+        )
+
+    def resolve(self):
+        """
+        Import and return the callable.
+        """
+        if self._resolved is None:
+            module = import_module(self.module_name)
+            self._resolved = getattr(module, self.name)
+        return self._resolved
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+
+# The script run by ``profile_imports``. It is passed to the interpreter with
+# ``-c`` so that nothing is imported before the hook is installed, not even
+# the zipline package.
+_PROFILE_SCRIPT = '''
+import sys
+import time
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+clock = getattr(time, 'perf_counter', time.time)
+real_import = builtins.__import__
+stack = []
+attributed = set()
+records = []
+
+
+def absolute_name(name, globals, level):
+    if not level or not globals:
+        return name
+    package = globals.get('__package__') or globals.get('__name__', '')
+    if globals.get('__path__') is None and not globals.get('__package__'):
+        package = package.rpartition('.')[0]
+    for _ in range(level - 1):
+        package = package.rpartition('.')[0]
+    return package + '.' + name if name else package
+
+
+def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    before = set(sys.modules)
+    stack.append(0.0)
+    start = clock()
+    try:
+        return real_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = clock() - start
+        children = stack.pop()
+        new = set(sys.modules) - before - attributed
+        if new:
+            attributed.update(new)
+            target = absolute_name(name, globals, level)
+            label = target if target in new else min(new, key=len)
+            records.append((label, elapsed - children, elapsed, len(stack)))
+            if stack:
+                stack[-1] += elapsed
+        elif stack:
+            stack[-1] += children
+
+
+module_name, out_path = sys.argv[1:3]
+del sys.argv[1:]
+builtins.__import__ = timed_import
+start = clock()
+try:
+    timed_import(module_name)
+finally:
+    total = clock() - start
+    builtins.__import__ = real_import
+
+import json
+with open(out_path, 'w') as f:
+    json.dump({'total': total, 'records': records}, f)
+'''
+
+
+ImportTime = namedtuple('ImportTime', 'module self cumulative depth')
+
+
+def profile_imports(module_name, python=None):
+    """
+    Measure the time it takes to import a module in a fresh interpreter.
+
+    Parameters
+    ----------
+    module_name : str
+        The absolute name of the module to import.
+    python : str, optional
+        The interpreter to run. default: ``sys.executable``
+
+    Returns
+    -------
+    total : float
+        The number of seconds it took to import ``module_name``.
+    imports : list[ImportTime]
+        The modules that were imported, in the order they finished loading.
+        ``self`` is the time spent in the module excluding the modules it
+        imported, and ``cumulative`` includes them.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        Raised if the module could not be imported.
+    """
+    fd, out_path = mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        subprocess.check_call([
+            python or sys.executable,
+            '-c',
+            _PROFILE_SCRIPT,
+            module_name,
+            out_path,
+        ])
+        with open(out_path) as f:
+            profile = json.load(f)
+    finally:
+        os.remove(out_path)
+
+    return profile['total'], [
+        ImportTime(*record) for record in profile['records']
+    ]
+
+
+def format_import_profile(module_name, total, imports, limit=25):
+    """
+    Format the result of ``profile_imports`` as a table of the slowest
+    imports.
+
+    Parameters
+    ----------
+    module_name : str
+        The module that was profiled.
+    total : float
+        The total import time returned by ``profile_imports``.
+    imports : list[ImportTime]
+        The imports returned by ``profile_imports``.
+    limit : int, optional
+        The number of imports to show.
+
+    Returns
+    -------
+    report : str
+    """
+    slowest = sorted(imports, key=lambda i: i.cumulative, reverse=True)
+    lines = [
+        'Imported %s in %.3fs (%d modules).' % (
+            module_name,
+            total,
+            len(imports),
+        ),
+        '',
+        '%10s %10s  %s' % ('self [s]', 'cumul [s]', 'module'),
+    ]
+    lines.extend(
+        '%10.3f %10.3f  %s' % (i.self, i.cumulative, i.module)
+        for i in slowest[:limit]
+    )
+    return '\n'.join(lines)
@@ -17,7 +17,12 @@ from toolz import valfilter, concatv
 from zipline.algorithm import TradingAlgorithm
 from zipline.data.bundles.core import load
 from zipline.data.data_portal import DataPortal
+from zipline.finance.performance import (
+    StreamedResults,
+    StreamingResultsWriter,
+)
 from zipline.finance.trading import TradingEnvironment
+from zipline.gens.checkpoint import CheckpointWriter
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.loaders import USEquityPricingLoader
 from zipline.utils.calendars import get_calendar
@@ -63,10 +68,23 @@ def _run(handle_data,
          output,
          print_algo,
          local_namespace,
-         environ):
+         environ,
+         stream_results=None,
+         checkpoint=None,
+         checkpoint_frequency=21,
+         resume=False):
     """Run a backtest for the given algorithm.
 
     This is shared between the cli and :func:`zipline.run_algo`.
+
+    If ``stream_results`` is a directory, the daily performance is written
+    there as the simulation runs and a ``StreamedResults`` reader is returned
+    instead of the perf frame.
+
+    If ``checkpoint`` is a path, the state of the simulation is written there
+    every ``checkpoint_frequency`` sessions. If ``resume`` is true and the
+    checkpoint exists, the simulation continues from it instead of starting
+    from the beginning.
     """
     if algotext is not None:
         if local_namespace:
@@ -155,7 +173,7 @@ def _run(handle_data,
         env = None
         choose_loader = None
 
-    perf = TradingAlgorithm(
+    algo = TradingAlgorithm(
         namespace=namespace,
         capital_base=capital_base,
         env=env,
@@ -175,13 +193,37 @@ def _run(handle_data,
             'algo_filename': getattr(algofile, 'name', '<algorithm>'),
             'script': algotext,
         }
-    ).run(
-        data,
-        overwrite_sim_params=False,
     )
+    checkpoints = (
+        CheckpointWriter(checkpoint, checkpoint_frequency)
+        if checkpoint is not None else
+        None
+    )
+    if resume and checkpoint is not None and os.path.exists(checkpoint):
+        # The results go wherever the interrupted simulation was writing
+        # them.
+        perf = algo.resume(
+            checkpoint,
+            data,
+            overwrite_sim_params=False,
+            checkpoints=checkpoints,
+        )
+    else:
+        perf = algo.run(
+            data,
+            overwrite_sim_params=False,
+            results_sink=(
+                StreamingResultsWriter(stream_results)
+                if stream_results is not None else
+                None
+            ),
+            checkpoints=checkpoints,
+        )
 
     if output == '-':
-        click.echo(str(perf))
+        click.echo(
+            perf.summary() if isinstance(perf, StreamedResults) else str(perf),
+        )
     elif output != os.devnull:  # make the zipline magic not write any data
         perf.to_pickle(output)
 
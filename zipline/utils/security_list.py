@@ -1,12 +1,17 @@
 from datetime import datetime
 from os import listdir
 import os.path
+import pickle
 
+import numpy as np
 import pandas as pd
 import pytz
 import zipline
 
 from zipline.errors import SymbolNotFound
+from zipline.utils.cache import working_file
+from zipline.utils.memoize import lazyval
+from zipline.utils.paths import cache_path, ensure_directory_containing
 
 
 DATE_FORMAT = "%Y%m%d"
@@ -23,13 +28,14 @@ class SecurityList(object):
               {add: [symbol list], 'delete': []}, delete: [symbol list]}
         current_date_func: function taking no parameters, returning
             current datetime
+
+        The symbols are resolved to sids the first time the list is used and
+        the members are precomputed for every knowledge date, so a membership
+        test is a lookup in a set.
         """
         self.data = data
-        self._cache = {}
         self._knowledge_dates = self.make_knowledge_dates(self.data)
         self.current_date = current_date_func
-        self.count = 0
-        self._current_set = set()
         self.asset_finder = asset_finder
 
     def make_knowledge_dates(self, data):
@@ -43,32 +49,51 @@ class SecurityList(object):
     def __contains__(self, item):
         return item in self.restricted_list
 
-    @property
-    def restricted_list(self):
-
-        cd = self.current_date()
+    @lazyval
+    def _members(self):
+        """
+        The sids in the list from each knowledge date until the next one.
+
+        Returns
+        -------
+        knowledge_dates : np.ndarray[int64]
+            The knowledge dates as nanoseconds.
+        members : list[frozenset[int]]
+            The sids in the list as of each knowledge date.
+        """
+        current = set()
+        members = []
         for kd in self._knowledge_dates:
-            if cd < kd:
-                break
-            if kd in self._cache:
-                self._current_set = self._cache[kd]
-                continue
-
-            for effective_date, changes in iter(self.data[kd].items()):
+            for effective_date, changes in sorted(self.data[kd].items()):
                 self.update_current(
                     effective_date,
                     changes['add'],
-                    self._current_set.add
+                    current.add
                 )
 
                 self.update_current(
                     effective_date,
                     changes['delete'],
-                    self._current_set.remove
+                    current.discard
                 )
+            members.append(frozenset(current))
 
-            self._cache[kd] = self._current_set
-        return self._current_set
+        knowledge_dates = np.array(
+            [kd.value for kd in self._knowledge_dates],
+            dtype=np.int64,
+        )
+        return knowledge_dates, members
+
+    @property
+    def restricted_list(self):
+        knowledge_dates, members = self._members
+        ix = knowledge_dates.searchsorted(
+            pd.Timestamp(self.current_date()).value,
+            side='right',
+        ) - 1
+        if ix < 0:
+            return frozenset()
+        return members[ix]
 
     def update_current(self, effective_date, symbols, change_func):
         for symbol in symbols:
@@ -104,7 +129,22 @@ class SecurityListSet(object):
         return self._leveraged_etf
 
 
-def load_from_directory(list_name):
+def _directory_signature(dir_path):
+    """
+    The path, size and modification time of every file under ``dir_path``.
+    """
+    return sorted(
+        (
+            os.path.relpath(os.path.join(root, name), dir_path),
+            os.path.getsize(os.path.join(root, name)),
+            os.path.getmtime(os.path.join(root, name)),
+        )
+        for root, _, names in os.walk(dir_path)
+        for name in names
+    )
+
+
+def load_from_directory(list_name, environ=None):
     """
     To resolve the symbol in the LEVERAGED_ETF list,
     the date on which the symbol was in effect is needed.
@@ -121,9 +161,38 @@ def load_from_directory(list_name):
     The return value is a dictionary with:
     knowledge_date -> lookup_date ->
        {add: [symbol list], 'delete': [symbol list]}
+
+    The parsed lists are cached in the zipline cache directory and only
+    parsed again when a file in the directory changes.
     """
-    data = {}
     dir_path = os.path.join(SECURITY_LISTS_DIR, list_name)
+    signature = (os.path.abspath(dir_path), _directory_signature(dir_path))
+    cache_file = cache_path(
+        ['security_lists', list_name + '.pickle'],
+        environ=environ,
+    )
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_signature, data = pickle.load(f)
+        if cached_signature == signature:
+            return data
+    except (IOError, EOFError, ValueError, pickle.UnpicklingError):
+        pass
+
+    data = _parse_directory(dir_path)
+    try:
+        ensure_directory_containing(cache_file)
+        with working_file(cache_file) as wf, open(wf.path, 'wb') as f:
+            pickle.dump((signature, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (IOError, OSError):
+        # The cache only saves parsing the files again.
+        pass
+    return data
+
+
+def _parse_directory(dir_path):
+    data = {}
     for kd_name in listdir(dir_path):
         kd = datetime.strptime(kd_name, DATE_FORMAT).replace(
             tzinfo=pytz.utc)
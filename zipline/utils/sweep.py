@@ -0,0 +1,339 @@
+"""
+Run many variants of an algorithm against one shared environment.
+"""
+from functools import partial
+from itertools import count
+import multiprocessing
+
+from six import iteritems, itervalues
+
+from zipline.algorithm import TradingAlgorithm
+from zipline.finance.performance import DailyStatsRecorder
+from zipline.gens.tradesimulation import MultiAlgorithmSimulator
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.utils.calendars import get_calendar
+from zipline.utils.pool import SequentialPool
+
+# The sweeps that are currently running, by id. Forked workers inherit this
+# and look their sweep up here instead of having it pickled to them.
+_running_sweeps = {}
+_sweep_ids = count()
+
+
+def _run_variant(sweep_id, key):
+    return key, _running_sweeps[sweep_id].run_variant(key)
+
+
+def run_multiplexed(algos, data_portal):
+    """
+    Run many algorithms in a single pass over the data.
+
+    One simulation clock drives every algorithm, and the current values
+    they read in each bar are cached and shared between them, so each value
+    is read once regardless of the number of algorithms. History windows are
+    still read per algorithm, and pipelines are only shared if the
+    algorithms use a ``SharedPipelineEngine``. Each algorithm keeps its own
+    blotter, performance tracker and results.
+
+    Parameters
+    ----------
+    algos : dict[hashable -> TradingAlgorithm]
+        The algorithms to run. They must have the same sessions, data
+        frequency and emission rate.
+    data_portal : DataPortal
+        The data to run the algorithms against.
+
+    Returns
+    -------
+    perfs : dict[hashable -> pd.DataFrame]
+        The daily performance of each algorithm, as returned by
+        ``TradingAlgorithm.run``.
+
+    See Also
+    --------
+    zipline.gens.tradesimulation.MultiAlgorithmSimulator
+    """
+    if any(algo._sparse_clock for algo in itervalues(algos)):
+        raise ValueError("Can't multiplex algorithms that use a sparse clock.")
+
+    try:
+        recorders = {}
+        simulators = {}
+        for name, algo in iteritems(algos):
+            algo._prepare_data(data_portal, overwrite_sim_params=False)
+            algo.perf_tracker = None
+            recorders[name] = DailyStatsRecorder(
+                len(algo.sim_params.sessions),
+                metrics_only=algo.metrics_only,
+            )
+            simulators[name] = algo._create_simulator(algo.sim_params)
+
+        clock = next(itervalues(algos))._create_clock()
+        simulator = MultiAlgorithmSimulator(simulators, clock)
+        for name, packet in simulator.transform():
+            recorders[name].record(packet)
+
+        return {
+            name: algo._finish_run(recorders[name])
+            for name, algo in iteritems(algos)
+        }
+    finally:
+        for algo in itervalues(algos):
+            algo.data_portal = None
+
+
+class SharedPipelineEngine(SimplePipelineEngine):
+    """
+    A pipeline engine that remembers the results it has computed.
+
+    ``Sweep`` shares one of these between its variants, so variants that
+    attach the same pipelines compute each chunk of them once. Terms are
+    interned, so pipelines built the same way by different variants have the
+    same terms and hit the same cache entries.
+
+    The results of a sweep's pipelines are kept for as long as the engine
+    is alive. Pipelines attached with ``incremental=True`` are not cached.
+
+    Parameters
+    ----------
+    get_loader : callable[BoundColumn -> PipelineLoader]
+        The function that maps pipeline columns to their loaders.
+    calendar : pd.DatetimeIndex
+        The trading days.
+    asset_finder : AssetFinder
+        The asset finder of the simulations.
+
+    See Also
+    --------
+    zipline.pipeline.engine.SimplePipelineEngine
+    """
+    __slots__ = ('_results',)
+
+    def __init__(self, get_loader, calendar, asset_finder):
+        super(SharedPipelineEngine, self).__init__(
+            get_loader,
+            calendar,
+            asset_finder,
+        )
+        self._results = {}
+
+    def run_pipelines(self,
+                      pipelines,
+                      start_date,
+                      end_date,
+                      columnar=False):
+        key = (
+            frozenset(
+                (name, frozenset(iteritems(pipeline.columns)), pipeline.screen)
+                for name, pipeline in iteritems(pipelines)
+            ),
+            start_date,
+            end_date,
+            columnar,
+        )
+        try:
+            results = self._results[key]
+        except KeyError:
+            results = self._results[key] = super(
+                SharedPipelineEngine,
+                self,
+            ).run_pipelines(pipelines, start_date, end_date, columnar)
+        # Copy the mapping so that callers can't change the cached entry.
+        return dict(results)
+
+
+def _fork_pool(processes):
+    try:
+        get_context = multiprocessing.get_context
+    except AttributeError:
+        # Python 2 always forks on posix.
+        return multiprocessing.Pool(processes)
+    return get_context('fork').Pool(processes)
+
+
+class Sweep(object):
+    """
+    Runs many variants of an algorithm over the same data.
+
+    The trading environment, data portal, calendar and pipeline engine are
+    built once by the caller and shared by every variant, so the cost of
+    loading the asset database, the benchmark returns, the treasury curves and
+    the bar readers is only paid once. The pipeline engine caches its results,
+    so a pipeline that several variants attach is computed once for each
+    chunk of dates in each process that runs them.
+
+    Parameters
+    ----------
+    variants : dict[hashable -> dict]
+        Map from the name of each variant to the keyword arguments used to
+        construct its algorithm, for example ``initialize`` and
+        ``handle_data`` functions, or a ``script`` and a ``namespace``.
+    env : TradingEnvironment
+        The environment shared by every variant.
+    data_portal : DataPortal
+        The data shared by every variant.
+    sim_params : SimulationParameters
+        The parameters of the simulations.
+    trading_calendar : TradingCalendar, optional
+        The calendar of the simulations. default: NYSE
+    get_pipeline_loader : callable[BoundColumn -> PipelineLoader], optional
+        The function that maps pipeline columns to their loaders. One
+        ``SharedPipelineEngine`` is built from this and shared by every
+        variant.
+    algorithm_class : type, optional
+        The subclass of TradingAlgorithm to construct for each variant.
+        default: TradingAlgorithm
+
+    Examples
+    --------
+    Run three lookback windows, four at a time::
+
+        sweep = Sweep(
+            {
+                window: {'initialize': partial(initialize, window=window),
+                         'handle_data': handle_data}
+                for window in (10, 20, 30)
+            },
+            env,
+            data_portal,
+            sim_params,
+        )
+        perfs = sweep.run(processes=4)
+
+    See Also
+    --------
+    zipline.algorithm.TradingAlgorithm
+    """
+    def __init__(self,
+                 variants,
+                 env,
+                 data_portal,
+                 sim_params,
+                 trading_calendar=None,
+                 get_pipeline_loader=None,
+                 algorithm_class=TradingAlgorithm):
+        if trading_calendar is None:
+            trading_calendar = get_calendar('NYSE')
+
+        self.variants = variants
+        self.env = env
+        self.data_portal = data_portal
+        self.sim_params = sim_params
+        self.trading_calendar = trading_calendar
+        self.algorithm_class = algorithm_class
+
+        if get_pipeline_loader is not None:
+            self.engine = SharedPipelineEngine(
+                get_pipeline_loader,
+                trading_calendar.all_sessions,
+                env.asset_finder,
+            )
+        else:
+            self.engine = None
+
+    def __repr__(self):
+        return '<%s: %d variants>' % (type(self).__name__, len(self.variants))
+
+    def make_algorithm(self, key):
+        """
+        Construct the algorithm for a variant.
+
+        Parameters
+        ----------
+        key : hashable
+            The name of the variant.
+
+        Returns
+        -------
+        algo : TradingAlgorithm
+            The variant's algorithm, using the shared environment.
+        """
+        kwargs = dict(self.variants[key])
+        if self.engine is not None:
+            kwargs['pipeline_engine'] = self.engine
+        return self.algorithm_class(
+            env=self.env,
+            sim_params=self.sim_params,
+            trading_calendar=self.trading_calendar,
+            **kwargs
+        )
+
+    def run_variant(self, key):
+        """
+        Run a single variant in this process.
+
+        Parameters
+        ----------
+        key : hashable
+            The name of the variant.
+
+        Returns
+        -------
+        perf : pd.DataFrame
+            The daily performance of the variant.
+        """
+        return self.make_algorithm(key).run(
+            self.data_portal,
+            overwrite_sim_params=False,
+        )
+
+    def run(self, processes=None, multiplex=False):
+        """
+        Run every variant.
+
+        Parameters
+        ----------
+        processes : int, optional
+            The number of worker processes to run the variants in. The workers
+            are forked after the shared environment has been built, so they
+            inherit it instead of building their own. By default the variants
+            are run one after the other in this process.
+        multiplex : bool, optional
+            Run every variant in a single pass over the data with
+            ``run_multiplexed``. This is mutually exclusive with
+            ``processes``.
+
+        Returns
+        -------
+        perfs : dict[hashable -> pd.DataFrame]
+            The daily performance of each variant.
+
+        Notes
+        -----
+        Running the variants in worker processes requires an operating system
+        that supports ``fork``. The results are pickled back to this process,
+        but the variants themselves never are, so they may use closures and
+        lambdas.
+        """
+        if multiplex:
+            if processes is not None:
+                raise ValueError(
+                    "Can't run a multiplexed sweep in worker processes."
+                )
+            return run_multiplexed(
+                {key: self.make_algorithm(key) for key in self.variants},
+                self.data_portal,
+            )
+
+        # Register the sweep before forking so that the workers inherit it.
+        sweep_id = next(_sweep_ids)
+        _running_sweeps[sweep_id] = self
+        try:
+            pool = (
+                SequentialPool()
+                if processes is None else
+                _fork_pool(processes)
+            )
+            try:
+                return dict(
+                    pool.imap_unordered(
+                        partial(_run_variant, sweep_id),
+                        list(self.variants),
+                    ),
+                )
+            finally:
+                if processes is not None:
+                    pool.terminate()
+                    pool.join()
+        finally:
+            del _running_sweeps[sweep_id]